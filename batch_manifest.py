@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Batch Manifest - membaca daftar job upload dari file JSONL/CSV secara bertahap
+dan menulis hasilnya ke file JSONL baris per baris (bisa dilanjutkan jika batch terhenti)
+"""
+
+import os
+import csv
+import json
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, Set
+
+# Kolom manifest yang bukan metadata upload
+JOB_FIELDS = {"id", "platform", "account", "video", "media", "max_attempts"}
+
+PLATFORMS = ("tiktok", "facebook-status", "facebook-reels", "youtube-shorts")
+
+
+def _row_to_job(row: Dict[str, Any], line: int) -> Dict[str, Any]:
+    """Satu baris manifest -> job dalam format yang sama dengan antrian (lihat upload_queue)"""
+    row = {key.strip(): value for key, value in row.items() if key and value not in (None, "")}
+    metadata = {key: value for key, value in row.items() if key not in JOB_FIELDS}
+    return {
+        "id": str(row.get("id") or line),
+        "line": line,
+        "platform": row.get("platform", ""),
+        "account": row.get("account", "default"),
+        "video_path": row.get("video") or row.get("media"),
+        "metadata": metadata
+    }
+
+
+def validate_job(job: Dict[str, Any]) -> Optional[str]:
+    """Pesan error jika job tidak bisa dijalankan, None jika valid"""
+    platform = job["platform"]
+    if platform not in PLATFORMS:
+        return f"Platform tidak dikenal: '{platform}' (pilihan: {', '.join(PLATFORMS)})"
+    if platform == "facebook-status":
+        if not job["video_path"] and not job["metadata"].get("status_text"):
+            return "status_text atau media diperlukan untuk facebook-status"
+    elif not job["video_path"]:
+        return "Kolom video diperlukan"
+    if job["video_path"] and not os.path.exists(job["video_path"]):
+        return f"File tidak ditemukan: {job['video_path']}"
+    if platform == "youtube-shorts" and not job["metadata"].get("title"):
+        return "Kolom title diperlukan untuk youtube-shorts"
+    return None
+
+
+def iter_manifest(manifest_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Baca manifest baris per baris (tidak dimuat sekaligus ke memori)
+
+    Format: .jsonl (satu objek JSON per baris) atau .csv (baris pertama header). Kolom:
+    platform, account, video/media, caption, description, title, privacy, status_text, id (opsional)
+
+    Yields:
+        Dict job; baris yang tidak bisa di-parse menghasilkan job dengan key 'error'
+    """
+    manifest_path = Path(manifest_path)
+
+    with open(manifest_path, 'r', encoding='utf-8', newline='') as f:
+        if manifest_path.suffix.lower() == ".csv":
+            # Baris 1 adalah header
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                yield _row_to_job(row, line)
+            return
+
+        for line, text in enumerate(f, start=1):
+            text = text.strip()
+            if not text or text.startswith("#"):
+                continue
+            try:
+                row = json.loads(text)
+                if not isinstance(row, dict):
+                    raise ValueError("baris harus berupa objek JSON")
+            except ValueError as e:
+                yield {"id": str(line), "line": line, "platform": "", "account": "default",
+                       "video_path": None, "metadata": {}, "error": f"JSON tidak valid: {e}"}
+                continue
+            yield _row_to_job(row, line)
+
+
+class ResultsWriter:
+    def __init__(self, results_path: Path):
+        """
+        Initialize Results Writer
+
+        Args:
+            results_path: File JSONL hasil; baris ditambahkan (append) dan di-flush setiap job
+        """
+        self.results_path = Path(results_path)
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = None
+
+    def _entries(self) -> Iterator[Dict[str, Any]]:
+        if not self.results_path.exists():
+            return
+        with open(self.results_path, 'r', encoding='utf-8') as f:
+            for text in f:
+                try:
+                    yield json.loads(text)
+                except ValueError:
+                    # Baris terakhir bisa terpotong jika proses mati saat menulis
+                    continue
+
+    def completed_ids(self) -> Set[str]:
+        """ID job yang sudah berhasil pada run sebelumnya (dilewati saat batch dilanjutkan)"""
+        return {str(entry.get("id")) for entry in self._entries() if entry.get("success")}
+
+    def review_ids(self) -> Set[str]:
+        """
+        ID job yang gagal dengan retryable False pada run sebelumnya (mis. post diklik tapi tidak
+        terkonfirmasi): perlu dicek manual, tidak diupload ulang agar tidak menjadi post ganda
+        """
+        return {str(entry.get("id")) for entry in self._entries()
+                if not entry.get("success") and entry.get("retryable") is False}
+
+    def write(self, job: Dict[str, Any], result: Dict[str, Any]):
+        if self._file is None:
+            self._file = open(self.results_path, 'a', encoding='utf-8')
+        entry = {
+            "id": job["id"],
+            "line": job["line"],
+            "platform": job["platform"],
+            "account": job["account"],
+            "video": job["video_path"],
+            **result
+        }
+        self._file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Browser Pool - Chrome session yang sudah login untuk TikTok dan Facebook
+Menghindari biaya start Chrome + ChromeDriver di setiap upload
+"""
+
+import os
+import time
+import platform
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+from colorama import init, Fore, Style
+
+from tiktok_uploader import TikTokUploader
+from facebook_uploader import FacebookUploader
+
+try:
+    import psutil
+except ImportError:  # psutil opsional, fallback ke /proc di Linux
+    psutil = None
+
+# Initialize colorama
+init(autoreset=True)
+
+
+class PooledSession:
+    """Satu Chrome session milik pool untuk kombinasi platform/akun tertentu"""
+
+    def __init__(self, platform_name: str, account: str, driver):
+        self.platform = platform_name
+        self.account = account
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.time()
+        self.last_used = self.created_at
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return (self.platform, self.account)
+
+
+class BrowserPool:
+    # Uploader yang dipakai untuk meluncurkan session per platform
+    UPLOADER_CLASSES = {
+        "tiktok": TikTokUploader,
+        "facebook": FacebookUploader,
+    }
+
+    def __init__(self, size: int = 1, max_uses: int = 20, max_rss_mb: Optional[float] = 1500,
+                 headless: bool = False, debug: bool = False, use_profile: bool = False,
+                 factory: Optional[Callable[[str, str], Any]] = None):
+        """
+        Initialize Browser Pool
+
+        Args:
+            size: Jumlah maksimal session per platform/akun
+            max_uses: Session di-recycle setelah dipakai sebanyak ini
+            max_rss_mb: Session di-recycle jika RSS Chrome melebihi batas ini (None = nonaktif)
+            headless: Jalankan browser dalam mode headless
+            debug: Enable debug logging
+            use_profile: Luncurkan session dengan profile Chrome persisten per akun
+            factory: Callable (platform, account) -> driver, default memakai launch_session() uploader
+        """
+        if size < 1:
+            raise ValueError("Ukuran pool minimal 1")
+
+        self.size = size
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self.headless = headless
+        self.debug = debug
+        self.use_profile = use_profile
+        self.factory = factory or self._launch_driver
+
+        self._idle: Dict[Tuple[str, str], List[PooledSession]] = {}
+        self._busy: Dict[Tuple[str, str], int] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+
+        # Satu user-data-dir hanya bisa dipakai satu Chrome dalam waktu bersamaan
+        if use_profile and size > 1:
+            self._log("Profile persisten hanya mendukung 1 session per akun, ukuran pool menjadi 1", "WARNING")
+            self.size = 1
+
+    def _log(self, message: str, level: str = "INFO"):
+        """Enhanced logging dengan warna"""
+        colors = {
+            "INFO": Fore.CYAN,
+            "SUCCESS": Fore.GREEN,
+            "WARNING": Fore.YELLOW,
+            "ERROR": Fore.RED,
+            "DEBUG": Fore.MAGENTA
+        }
+
+        if level == "DEBUG" and not self.debug:
+            return
+
+        color = colors.get(level, Fore.WHITE)
+        icons = {
+            "INFO": "ℹ️",
+            "SUCCESS": "✅",
+            "WARNING": "⚠️",
+            "ERROR": "❌",
+            "DEBUG": "🔍"
+        }
+
+        icon = icons.get(level, "📝")
+        print(f"{color}{icon} {message}{Style.RESET_ALL}")
+
+    def _launch_driver(self, platform_name: str, account: str):
+        """Luncurkan Chrome baru yang sudah memuat cookies akun"""
+        uploader_class = self.UPLOADER_CLASSES.get(platform_name)
+        if not uploader_class:
+            raise ValueError(f"Platform tidak didukung pool: {platform_name}")
+
+        uploader = uploader_class(headless=self.headless, debug=self.debug,
+                                  account=account, use_profile=self.use_profile)
+        return uploader.launch_session()
+
+    def _new_session(self, platform_name: str, account: str) -> PooledSession:
+        self._log(f"Meluncurkan session baru untuk {platform_name}/{account}...")
+        start_time = time.time()
+        driver = self.factory(platform_name, account)
+        self._log(f"Session {platform_name}/{account} siap ({time.time() - start_time:.1f}s)", "SUCCESS")
+        return PooledSession(platform_name, account, driver)
+
+    def _quit_session(self, session: PooledSession, reason: str = ""):
+        if reason:
+            self._log(f"Recycle session {session.platform}/{session.account}: {reason}", "DEBUG")
+        try:
+            session.driver.quit()
+        except:
+            pass
+
+    def _is_healthy(self, session: PooledSession) -> bool:
+        """Health check ringan: browser masih merespon dan punya window"""
+        try:
+            if not session.driver.window_handles:
+                return False
+            session.driver.execute_script("return document.readyState")
+            return True
+        except Exception as e:
+            self._log(f"Health check gagal: {e}", "DEBUG")
+            return False
+
+    def _driver_rss_mb(self, session: PooledSession) -> Optional[float]:
+        """Total RSS ChromeDriver + semua proses Chrome turunannya (MB)"""
+        try:
+            root_pid = session.driver.service.process.pid
+        except Exception:
+            return None
+
+        if psutil is not None:
+            try:
+                root = psutil.Process(root_pid)
+                processes = [root] + root.children(recursive=True)
+                total = 0
+                for proc in processes:
+                    try:
+                        total += proc.memory_info().rss
+                    except psutil.Error:
+                        continue
+                return total / (1024 * 1024)
+            except psutil.Error:
+                return None
+
+        if platform.system() != "Linux":
+            return None
+
+        # Fallback tanpa psutil: baca parent pid dan RSS dari /proc
+        children: Dict[int, List[int]] = {}
+        rss_pages: Dict[int, int] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "r") as f:
+                    stat = f.read()
+                # Field setelah nama proses "(...)": state ppid ... rss di index 21
+                fields = stat[stat.rfind(")") + 2:].split()
+                pid = int(entry)
+                children.setdefault(int(fields[1]), []).append(pid)
+                rss_pages[pid] = int(fields[21])
+            except (OSError, ValueError, IndexError):
+                continue
+
+        if root_pid not in rss_pages:
+            return None
+
+        total_pages = 0
+        stack = [root_pid]
+        while stack:
+            pid = stack.pop()
+            total_pages += rss_pages.get(pid, 0)
+            stack.extend(children.get(pid, []))
+
+        return total_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+    def _recycle_reason(self, session: PooledSession) -> Optional[str]:
+        if self.max_uses and session.uses >= self.max_uses:
+            return f"sudah dipakai {session.uses}x"
+
+        if self.max_rss_mb:
+            rss = self._driver_rss_mb(session)
+            if rss is not None and rss > self.max_rss_mb:
+                return f"RSS {rss:.0f}MB melebihi batas {self.max_rss_mb:.0f}MB"
+
+        return None
+
+    def warm(self, platform_name: str, account: str = "default", count: Optional[int] = None) -> int:
+        """
+        Pre-launch session sampai jumlah tertentu
+
+        Args:
+            platform_name: Platform ('tiktok' atau 'facebook')
+            account: Nama akun
+            count: Jumlah session yang diinginkan (default: ukuran pool)
+
+        Returns:
+            Jumlah session yang baru diluncurkan
+        """
+        key = (platform_name, account)
+        target = min(count or self.size, self.size)
+        launched = 0
+
+        while True:
+            with self._condition:
+                total = len(self._idle.get(key, [])) + self._busy.get(key, 0)
+                if self._closed or total >= target:
+                    break
+                # Reservasi slot agar warm paralel tidak melebihi ukuran pool
+                self._busy[key] = self._busy.get(key, 0) + 1
+
+            try:
+                session = self._new_session(platform_name, account)
+            except Exception as e:
+                self._log(f"Gagal meluncurkan session {platform_name}/{account}: {e}", "ERROR")
+                with self._condition:
+                    self._busy[key] -= 1
+                    self._condition.notify_all()
+                break
+
+            with self._condition:
+                self._busy[key] -= 1
+                self._idle.setdefault(key, []).append(session)
+                self._condition.notify_all()
+            launched += 1
+
+        return launched
+
+    def checkout(self, platform_name: str, account: str = "default", timeout: float = 300) -> PooledSession:
+        """
+        Ambil session dari pool, meluncurkan baru jika belum penuh
+
+        Raises:
+            TimeoutError: Jika tidak ada session tersedia dalam waktu timeout
+        """
+        key = (platform_name, account)
+        deadline = time.time() + timeout
+
+        while True:
+            session = None
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Browser pool sudah ditutup")
+
+                idle = self._idle.get(key, [])
+                if idle:
+                    session = idle.pop()
+                elif self._busy.get(key, 0) < self.size:
+                    session = None
+                else:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise TimeoutError(f"Tidak ada session {platform_name}/{account} yang tersedia")
+                    self._condition.wait(remaining)
+                    continue
+
+                self._busy[key] = self._busy.get(key, 0) + 1
+
+            if session is not None:
+                if self._is_healthy(session):
+                    session.last_used = time.time()
+                    return session
+                self._quit_session(session, "health check gagal")
+
+            try:
+                return self._new_session(platform_name, account)
+            except Exception:
+                with self._condition:
+                    self._busy[key] -= 1
+                    self._condition.notify_all()
+                raise
+
+    def checkin(self, session: PooledSession, healthy: bool = True):
+        """Kembalikan session ke pool, recycle jika rusak atau sudah melewati batas"""
+        session.uses += 1
+        session.last_used = time.time()
+
+        reason = None if healthy else "ditandai tidak sehat"
+        if reason is None:
+            reason = self._recycle_reason(session)
+
+        with self._condition:
+            self._busy[session.key] = max(self._busy.get(session.key, 0) - 1, 0)
+            keep = reason is None and not self._closed
+            if keep:
+                self._idle.setdefault(session.key, []).append(session)
+            self._condition.notify_all()
+
+        if not keep:
+            self._quit_session(session, reason or "pool ditutup")
+
+    @contextmanager
+    def session(self, platform_name: str, account: str = "default", timeout: float = 300):
+        """
+        Context manager untuk meminjam driver
+
+        Contoh:
+            with pool.session("tiktok") as driver:
+                TikTokUploader(driver=driver).upload_video("video.mp4")
+        """
+        pooled = self.checkout(platform_name, account, timeout=timeout)
+        healthy = True
+        try:
+            yield pooled.driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.checkin(pooled, healthy=healthy and self._is_healthy(pooled))
+
+    def stats(self) -> Dict[str, Any]:
+        """Ringkasan jumlah session idle/busy per platform/akun"""
+        with self._condition:
+            keys = set(self._idle) | set(self._busy)
+            return {
+                f"{platform_name}/{account}": {
+                    "idle": len(self._idle.get((platform_name, account), [])),
+                    "busy": self._busy.get((platform_name, account), 0)
+                }
+                for platform_name, account in keys
+            }
+
+    def close_idle(self, platform_name: str, account: str = "default") -> int:
+        """Tutup session idle satu platform/akun (mis. setelah semua upload akun itu selesai)"""
+        with self._condition:
+            sessions = self._idle.pop((platform_name, account), [])
+        for session in sessions:
+            self._quit_session(session, "tidak dipakai lagi")
+        return len(sessions)
+
+    def close(self):
+        """Tutup semua session idle; session yang sedang dipinjam ditutup saat checkin"""
+        with self._condition:
+            self._closed = True
+            sessions = [s for idle in self._idle.values() for s in idle]
+            self._idle.clear()
+            self._condition.notify_all()
+
+        if sessions:
+            self._log(f"Menutup {len(sessions)} session browser...")
+        for session in sessions:
+            self._quit_session(session)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+CDP Cookies - inject cookies lewat Chrome DevTools Protocol
+Satu perintah Network.setCookies untuk seluruh cookie jar, tanpa perlu navigasi dulu
+"""
+
+from typing import Optional, Dict, Any, List
+
+# Nilai sameSite yang diterima Network.setCookies
+CDP_SAME_SITE = {"strict": "Strict", "lax": "Lax", "none": "None"}
+
+
+def to_cdp_cookie(cookie: Dict[str, Any], default_domain: str) -> Optional[Dict[str, Any]]:
+    """Konversi cookie format JSON/Selenium ke format Network.CookieParam"""
+    if 'name' not in cookie or 'value' not in cookie:
+        return None
+
+    cdp_cookie = {
+        'name': cookie['name'],
+        'value': str(cookie['value']),
+        'domain': cookie.get('domain', default_domain),
+        'path': cookie.get('path', '/'),
+    }
+
+    # Tanpa expires = session cookie
+    if 'expiry' in cookie:
+        cdp_cookie['expires'] = float(cookie['expiry'])
+    elif 'expires' in cookie and isinstance(cookie['expires'], (int, float)) and cookie['expires'] > 0:
+        cdp_cookie['expires'] = float(cookie['expires'])
+
+    if 'secure' in cookie:
+        cdp_cookie['secure'] = bool(cookie['secure'])
+    if 'httpOnly' in cookie:
+        cdp_cookie['httpOnly'] = bool(cookie['httpOnly'])
+
+    same_site = CDP_SAME_SITE.get(str(cookie.get('sameSite', '')).lower())
+    # Chrome menolak SameSite=None tanpa Secure
+    if same_site and (same_site != "None" or cdp_cookie.get('secure')):
+        cdp_cookie['sameSite'] = same_site
+
+    return cdp_cookie
+
+
+def set_cookies_cdp(driver, cookies: List[Dict[str, Any]], default_domain: str) -> Optional[int]:
+    """
+    Pasang semua cookies lewat CDP sebelum navigasi pertama
+
+    Args:
+        driver: Chrome WebDriver
+        cookies: List cookies dari file JSON
+        default_domain: Domain jika cookie tidak punya domain (mis. '.tiktok.com')
+
+    Returns:
+        Jumlah cookies yang terpasang, atau None jika CDP tidak tersedia
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+
+    cdp_cookies = [c for c in (to_cdp_cookie(cookie, default_domain) for cookie in cookies) if c]
+    if not cdp_cookies:
+        return 0
+
+    try:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+        return len(cdp_cookies)
+    except Exception:
+        pass
+
+    # Satu cookie invalid membuat seluruh batch ditolak, ulangi per cookie (tetap via CDP)
+    added = 0
+    for cdp_cookie in cdp_cookies:
+        try:
+            result = driver.execute_cdp_cmd("Network.setCookie", cdp_cookie)
+        except Exception:
+            # CDP tidak bisa dipakai sama sekali, biarkan pemanggil fallback ke add_cookie
+            if added == 0:
+                return None
+            continue
+        if not isinstance(result, dict) or result.get("success", True):
+            added += 1
+
+    return added
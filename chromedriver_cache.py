@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+ChromeDriver Cache - resolusi path ChromeDriver berdasarkan versi major Chrome
+Tanpa network call jika driver yang cocok sudah ada di disk
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import platform
+import subprocess
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from colorama import init, Fore, Style
+import argparse
+
+# Initialize colorama
+init(autoreset=True)
+
+
+class ChromeDriverCache:
+    # Lokasi umum ChromeDriver di Windows jika tidak ada di PATH
+    WINDOWS_DRIVER_PATHS = [
+        r"C:\Program Files\Google\Chrome\Application\chromedriver.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chromedriver.exe",
+        r"C:\chromedriver\chromedriver.exe",
+        r"C:\tools\chromedriver.exe"
+    ]
+
+    # Resolusi yang sudah dilakukan di proses ini: {major: path}
+    _memory_cache: Dict[str, str] = {}
+    _detected_version: Optional[str] = None
+
+    def __init__(self, debug: bool = False, offline: Optional[bool] = None, cache_path: Optional[Path] = None):
+        """
+        Initialize ChromeDriver Cache
+
+        Args:
+            debug: Enable debug logging
+            offline: Jangan pernah memanggil ChromeDriverManager (default: env CHROMEDRIVER_OFFLINE)
+            cache_path: Lokasi file cache JSON (default: drivers/chromedriver_cache.json)
+        """
+        self.debug = debug
+        if offline is None:
+            offline = os.environ.get("CHROMEDRIVER_OFFLINE", "").lower() in ("1", "true", "yes")
+        self.offline = offline
+
+        self.base_dir = Path(__file__).parent
+        self.cache_path = Path(cache_path) if cache_path else self.base_dir / "drivers" / "chromedriver_cache.json"
+
+    def _log(self, message: str, level: str = "INFO"):
+        """Enhanced logging dengan warna"""
+        colors = {
+            "INFO": Fore.CYAN,
+            "SUCCESS": Fore.GREEN,
+            "WARNING": Fore.YELLOW,
+            "ERROR": Fore.RED,
+            "DEBUG": Fore.MAGENTA
+        }
+
+        if level == "DEBUG" and not self.debug:
+            return
+
+        color = colors.get(level, Fore.WHITE)
+        icons = {
+            "INFO": "ℹ️",
+            "SUCCESS": "✅",
+            "WARNING": "⚠️",
+            "ERROR": "❌",
+            "DEBUG": "🔍"
+        }
+
+        icon = icons.get(level, "📝")
+        print(f"{color}{icon} {message}{Style.RESET_ALL}")
+
+    @staticmethod
+    def _parse_version(text: str) -> Optional[str]:
+        match = re.search(r"(\d+)\.(\d+)\.(\d+)\.(\d+)", text or "")
+        return match.group(0) if match else None
+
+    @staticmethod
+    def _run_version_command(binary: str) -> Optional[str]:
+        try:
+            output = subprocess.run(
+                [binary, "--version"],
+                capture_output=True, text=True, timeout=10
+            ).stdout
+            return ChromeDriverCache._parse_version(output)
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    def detect_chrome_version(self) -> Optional[str]:
+        """Deteksi versi Chrome yang terinstall secara lokal (tanpa network)"""
+        system = platform.system()
+
+        if system == "Windows":
+            try:
+                import winreg
+                for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                    try:
+                        with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                            version, _ = winreg.QueryValueEx(key, "version")
+                            if version:
+                                return version
+                    except OSError:
+                        continue
+            except ImportError:
+                pass
+
+            # Fallback: nama folder versi di direktori instalasi Chrome
+            for root in (os.environ.get("PROGRAMFILES", ""), os.environ.get("PROGRAMFILES(X86)", ""),
+                         os.environ.get("LOCALAPPDATA", "")):
+                app_dir = Path(root) / "Google" / "Chrome" / "Application"
+                if root and app_dir.is_dir():
+                    versions = [self._parse_version(p.name) for p in app_dir.iterdir()]
+                    versions = [v for v in versions if v]
+                    if versions:
+                        return max(versions, key=lambda v: [int(x) for x in v.split(".")])
+            return None
+
+        if system == "Darwin":
+            candidates = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+        else:
+            candidates = [
+                shutil.which(name)
+                for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")
+            ]
+
+        for binary in candidates:
+            if binary and os.path.exists(binary):
+                version = self._run_version_command(binary)
+                if version:
+                    return version
+
+        return None
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            self._log(f"Cache ChromeDriver rusak, diabaikan: {e}", "WARNING")
+            return {}
+
+    def _save_cache(self, cache: Dict[str, Any]):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+
+    def _remember(self, major: str, driver_path: str, source: str):
+        cache = self._load_cache()
+        cache[major] = {
+            "path": driver_path,
+            "driver_version": self._run_version_command(driver_path),
+            "source": source,
+            "resolved_at": int(time.time())
+        }
+        try:
+            self._save_cache(cache)
+        except Exception as e:
+            self._log(f"Gagal menyimpan cache ChromeDriver: {e}", "WARNING")
+        self._memory_cache[major] = driver_path
+
+    def _find_local_driver(self, major: Optional[str], strict: bool = False) -> Optional[str]:
+        """
+        Cari ChromeDriver di PATH dan lokasi umum, cocokkan versi major jika diketahui
+
+        Args:
+            major: Versi major Chrome, None jika tidak diketahui
+            strict: Hanya terima driver yang versinya terbukti sama dengan major
+        """
+        candidates = [shutil.which(name) for name in ('chromedriver', 'chromedriver.exe')]
+        if platform.system() == "Windows":
+            candidates.extend(self.WINDOWS_DRIVER_PATHS)
+
+        for path in candidates:
+            if not path or not os.path.exists(path):
+                continue
+            if major:
+                version = self._run_version_command(path)
+                if version and version.split(".")[0] != major:
+                    self._log(f"ChromeDriver {path} versi {version} tidak cocok dengan Chrome {major}", "DEBUG")
+                    continue
+                if strict and not version:
+                    continue
+            elif strict:
+                continue
+            return path
+
+        return None
+
+    def _download_driver(self) -> str:
+        """Download lewat webdriver-manager (satu-satunya jalur dengan network call)"""
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        os.environ['WDM_LOG_LEVEL'] = '0'
+        os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
+
+        self._log("Mendownload ChromeDriver terbaru...")
+        driver_path = ChromeDriverManager().install()
+
+        if not os.path.exists(driver_path):
+            raise FileNotFoundError("ChromeDriver tidak ditemukan setelah download")
+
+        # Untuk Windows, pastikan file adalah .exe
+        if platform.system() == "Windows" and not driver_path.endswith('.exe'):
+            driver_dir = os.path.dirname(driver_path)
+            for file in os.listdir(driver_dir):
+                if file.endswith('.exe') and 'chromedriver' in file.lower():
+                    driver_path = os.path.join(driver_dir, file)
+                    break
+
+        return driver_path
+
+    def resolve(self, force_refresh: bool = False) -> str:
+        """
+        Dapatkan path ChromeDriver yang cocok dengan Chrome terinstall
+
+        Urutan: cache memori -> cache disk -> driver lokal dengan versi major yang sama ->
+        download (jika tidak offline) -> driver lokal apa pun
+
+        Args:
+            force_refresh: Abaikan cache dan resolusi ulang
+
+        Returns:
+            Path ke executable ChromeDriver
+        """
+        if force_refresh or ChromeDriverCache._detected_version is None:
+            ChromeDriverCache._detected_version = self.detect_chrome_version() or ""
+        chrome_version = ChromeDriverCache._detected_version
+        # Versi Chrome tidak terdeteksi: tidak ada key yang aman untuk cache
+        major = chrome_version.split(".")[0] if chrome_version else None
+        self._log(f"Versi Chrome terdeteksi: {chrome_version or 'tidak diketahui'}", "DEBUG")
+
+        if major and not force_refresh:
+            cached = self._memory_cache.get(major)
+            if cached and os.path.exists(cached):
+                return cached
+
+            entry = self._load_cache().get(major)
+            if entry and os.path.exists(entry.get("path", "")):
+                self._memory_cache[major] = entry["path"]
+                self._log(f"ChromeDriver dari cache: {entry['path']}", "SUCCESS")
+                return entry["path"]
+
+        # Driver di disk yang cocok dengan Chrome: tanpa network call sama sekali
+        if major:
+            driver_path = self._find_local_driver(major, strict=True)
+            if driver_path:
+                self._remember(major, driver_path, "local")
+                self._log(f"ChromeDriver ditemukan di PATH: {driver_path}", "SUCCESS")
+                return driver_path
+
+        if not self.offline:
+            try:
+                driver_path = self._download_driver()
+                if major:
+                    self._remember(major, driver_path, "webdriver-manager")
+                self._log(f"ChromeDriver ditemukan: {driver_path}", "SUCCESS")
+                return driver_path
+            except Exception as e:
+                self._log(f"Error downloading ChromeDriver: {e}", "WARNING")
+        else:
+            self._log("Mode offline: tidak mendownload ChromeDriver", "DEBUG")
+
+        self._log("Mencari ChromeDriver di sistem PATH...")
+        driver_path = self._find_local_driver(major)
+        if driver_path:
+            if major:
+                self._remember(major, driver_path, "local")
+            self._log(f"ChromeDriver ditemukan di PATH: {driver_path}", "SUCCESS")
+            return driver_path
+
+        raise FileNotFoundError("ChromeDriver tidak ditemukan. Silakan install Chrome dan ChromeDriver.")
+
+    def prewarm(self) -> str:
+        """Isi cache saat deploy agar startup browser berikutnya murni lokal"""
+        self._log("Pre-warm cache ChromeDriver...")
+        driver_path = self.resolve(force_refresh=True)
+        self._log(f"Cache ChromeDriver siap: {driver_path}", "SUCCESS")
+        return driver_path
+
+    def clear(self):
+        """Hapus file cache (binary ChromeDriver tidak dihapus)"""
+        self._memory_cache.clear()
+        if self.cache_path.exists():
+            self.cache_path.unlink()
+            self._log("Cache ChromeDriver dihapus", "SUCCESS")
+        else:
+            self._log("Tidak ada cache ChromeDriver untuk dihapus", "WARNING")
+
+
+def main():
+    """Main function untuk CLI"""
+    parser = argparse.ArgumentParser(description="ChromeDriver Cache")
+    parser.add_argument("--prewarm", action="store_true", help="Resolusi dan simpan ChromeDriver ke cache")
+    parser.add_argument("--show", action="store_true", help="Tampilkan isi cache")
+    parser.add_argument("--clear", action="store_true", help="Hapus cache")
+    parser.add_argument("--offline", action="store_true", help="Jangan download, hanya pakai driver lokal")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+
+    args = parser.parse_args()
+
+    cache = ChromeDriverCache(debug=args.debug, offline=args.offline or None)
+
+    if args.clear:
+        cache.clear()
+    elif args.show:
+        print(json.dumps(cache._load_cache(), indent=2))
+    else:
+        try:
+            cache.prewarm()
+        except FileNotFoundError as e:
+            print(f"{Fore.RED}❌ {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
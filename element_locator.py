@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Element Locator - mencari elemen dengan banyak fallback selector sekaligus
+Semua kandidat (CSS/XPath) dicek dalam satu script per polling dengan satu timeout total,
+atau ditunggu dengan MutationObserver di dalam halaman (satu round-trip blocking)
+"""
+
+import time
+from typing import Optional, Dict, Any, List, Tuple
+
+from selenium.common.exceptions import WebDriverException, InvalidSessionIdException, NoSuchWindowException
+
+# Browser sudah ditutup/mati: tidak ada gunanya mencoba lagi sampai timeout
+DEAD_DRIVER_ERRORS = (InvalidSessionIdException, NoSuchWindowException)
+
+# Cek semua kandidat di dalam halaman, kembalikan [elemen, index] kandidat pertama yang cocok
+RACE_SELECTORS_JS = """
+const items = arguments[0];
+const mode = arguments[1];
+
+function isVisible(el) {
+    if (!el || !el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+
+function isEnabled(el) {
+    return !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+}
+
+function matches(el) {
+    if (mode === 'present') return true;
+    if (!isVisible(el)) return false;
+    return mode !== 'clickable' || isEnabled(el);
+}
+
+for (let i = 0; i < items.length; i++) {
+    const kind = items[i][0];
+    const selector = items[i][1];
+    let candidates = [];
+    try {
+        if (kind === 'xpath') {
+            const snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let j = 0; j < snapshot.snapshotLength; j++) candidates.push(snapshot.snapshotItem(j));
+        } else {
+            candidates = document.querySelectorAll(selector);
+        }
+    } catch (e) {
+        continue;  // Selector invalid, lanjut ke kandidat berikutnya
+    }
+    for (const el of candidates) {
+        if (el.nodeType === 1 && matches(el)) return [el, i];
+    }
+}
+return null;
+"""
+
+# Tunggu di dalam halaman sampai salah satu selector terlihat atau predicate URL terpenuhi.
+# MutationObserver memicu pengecekan (di-throttle), interval ringan menangkap perubahan CSS/URL
+OBSERVE_SELECTORS_JS = """
+const items = arguments[0];
+const urlArgs = arguments[1] || {};
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+
+function isVisible(el) {
+    if (!el || !el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+
+function query(kind, selector) {
+    try {
+        if (kind === 'xpath') {
+            const out = [];
+            const snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let j = 0; j < snapshot.snapshotLength; j++) out.push(snapshot.snapshotItem(j));
+            return out;
+        }
+        return Array.from(document.querySelectorAll(selector));
+    } catch (e) {
+        return [];
+    }
+}
+
+function check() {
+    for (let i = 0; i < items.length; i++) {
+        for (const el of query(items[i][0], items[i][1])) {
+            if (el.nodeType === 1 && isVisible(el)) return {element: el, index: i, url: null};
+        }
+    }
+    const href = location.href;
+    if (urlArgs.url_contains && urlArgs.url_contains.some(part => href.includes(part))) {
+        return {element: null, index: -1, url: href};
+    }
+    if (urlArgs.url_not_contains && !urlArgs.url_not_contains.some(part => href.includes(part))) {
+        return {element: null, index: -1, url: href};
+    }
+    return null;
+}
+
+let finished = false;
+let pending = false;
+let observer = null;
+let interval = null;
+let timer = null;
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+}
+
+function run() {
+    pending = false;
+    const result = check();
+    if (result) finish(result);
+}
+
+run();
+if (!finished) {
+    observer = new MutationObserver(() => {
+        if (!pending) {
+            pending = true;
+            setTimeout(run, 50);
+        }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    interval = setInterval(run, 500);
+    timer = setTimeout(() => finish(null), timeoutMs);
+}
+"""
+
+# Cari elemen berdasarkan teks terlihat (innerText/aria-label) dengan cek enabled + visible di dalam halaman.
+# Urutan kecocokan: teks sama persis, lalu diawali keyword, lalu mengandung keyword
+FIND_BY_TEXT_JS = """
+const keywords = arguments[0].map(k => k.toLowerCase());
+const tagSelector = arguments[1];
+
+function isVisible(el) {
+    if (!el || !el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+
+function isEnabled(el) {
+    return !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+}
+
+let best = null;
+let bestRank = 99;
+for (const el of document.querySelectorAll(tagSelector)) {
+    const texts = [(el.innerText || '').trim().toLowerCase(), (el.getAttribute('aria-label') || '').trim().toLowerCase()];
+    let rank = 99;
+    for (const text of texts) {
+        if (!text) continue;
+        for (const keyword of keywords) {
+            if (text === keyword) rank = Math.min(rank, 0);
+            else if (text.startsWith(keyword)) rank = Math.min(rank, 1);
+            else if (text.includes(keyword)) rank = Math.min(rank, 2);
+        }
+    }
+    if (rank < bestRank && isEnabled(el) && isVisible(el)) {
+        best = el;
+        bestRank = rank;
+        if (rank === 0) break;
+    }
+}
+return best ? [best, (best.innerText || best.getAttribute('aria-label') || '').trim()] : null;
+"""
+
+
+class ElementLocator:
+    # Mode pencarian: 'present' (ada di DOM), 'visible', 'clickable' (visible + enabled)
+    MODES = ("present", "visible", "clickable")
+
+    def __init__(self, driver, poll_interval: float = 0.25, observe_slice: float = 30):
+        """
+        Initialize Element Locator
+
+        Args:
+            driver: Selenium WebDriver
+            poll_interval: Jeda antar polling (detik)
+            observe_slice: Durasi maksimum satu panggilan execute_async_script di wait_for (detik)
+        """
+        self.driver = driver
+        self.poll_interval = poll_interval
+        self.observe_slice = observe_slice
+
+    @staticmethod
+    def _selector_kind(selector: str, by_type: Optional[str]) -> str:
+        if by_type:
+            return "xpath" if by_type.upper() == "XPATH" else "css"
+        # Deteksi otomatis: XPath selalu diawali '/' atau '('
+        return "xpath" if selector.startswith(("/", "(")) else "css"
+
+    def find_first(self, selectors: List[str], timeout: float = 10, mode: str = "clickable",
+                   by_type: Optional[str] = None) -> Tuple[Optional[Any], int]:
+        """
+        Cari elemen pertama yang cocok dari semua kandidat selector secara bersamaan
+
+        Args:
+            selectors: List selector CSS/XPath, urutan = prioritas
+            timeout: Timeout total untuk semua kandidat (detik)
+            mode: 'present', 'visible' atau 'clickable'
+            by_type: 'CSS' atau 'XPATH' untuk semua selector (default: deteksi otomatis)
+
+        Returns:
+            Tuple (elemen, index selector yang cocok) atau (None, -1) jika timeout
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Mode tidak valid: {mode}")
+        if not selectors:
+            return None, -1
+
+        items = [[self._selector_kind(selector, by_type), selector] for selector in selectors]
+        deadline = time.time() + timeout
+
+        while True:
+            try:
+                result = self.driver.execute_script(RACE_SELECTORS_JS, items, mode)
+                if result:
+                    return result[0], int(result[1])
+            except DEAD_DRIVER_ERRORS:
+                raise
+            except WebDriverException:
+                # Halaman sedang navigasi atau elemen stale, coba lagi di polling berikutnya
+                pass
+
+            if time.time() >= deadline:
+                return None, -1
+            time.sleep(self.poll_interval)
+
+    def find_by_text(self, keywords: List[str], timeout: float = 0,
+                     tag_selector: str = "button, [role='button']") -> Tuple[Optional[Any], str]:
+        """
+        Cari elemen yang bisa diklik berdasarkan teks terlihat, semua kandidat dicek dalam satu script
+
+        Args:
+            keywords: Kata kunci (case-insensitive, multi bahasa), mis. ['post', 'publish', 'terbitkan']
+            timeout: Timeout total (detik), 0 = cek sekali saja
+            tag_selector: Selector CSS kandidat elemen
+
+        Returns:
+            Tuple (elemen, teks elemen) atau (None, '') jika tidak ditemukan
+        """
+        if not keywords:
+            return None, ""
+
+        deadline = time.time() + timeout
+
+        while True:
+            try:
+                result = self.driver.execute_script(FIND_BY_TEXT_JS, list(keywords), tag_selector)
+                if result:
+                    return result[0], result[1]
+            except DEAD_DRIVER_ERRORS:
+                raise
+            except WebDriverException:
+                pass
+
+            if time.time() >= deadline:
+                return None, ""
+            time.sleep(self.poll_interval)
+
+    def wait_for(self, selectors: List[str], timeout: float = 10, by_type: Optional[str] = None,
+                 url_contains: Optional[List[str]] = None,
+                 url_not_contains: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Tunggu sampai salah satu selector terlihat atau predicate URL terpenuhi, tanpa polling WebDriver
+
+        Observer dipasang lewat execute_async_script. Jika halaman bernavigasi script ikut hilang,
+        jadi observer dipasang ulang di halaman baru sampai timeout total habis.
+
+        Args:
+            selectors: List selector CSS/XPath, urutan = prioritas
+            timeout: Timeout total (detik)
+            by_type: 'CSS' atau 'XPATH' untuk semua selector (default: deteksi otomatis)
+            url_contains: Terpenuhi jika URL mengandung salah satu bagian ini
+            url_not_contains: Terpenuhi jika URL tidak mengandung satupun bagian ini
+
+        Returns:
+            Dict {'element', 'index', 'url'} atau None jika timeout
+        """
+        items = [[self._selector_kind(selector, by_type), selector] for selector in selectors]
+        url_args = {"url_contains": url_contains, "url_not_contains": url_not_contains}
+        deadline = time.time() + timeout
+
+        try:
+            previous_script_timeout = self.driver.timeouts.script
+        except (AttributeError, WebDriverException):
+            previous_script_timeout = None
+
+        try:
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+
+                slice_seconds = min(remaining, self.observe_slice)
+                try:
+                    # Timeout sementara untuk satu slice observer, dikembalikan di finally
+                    self.driver.set_script_timeout(max(slice_seconds + 5, 30))
+                    result = self.driver.execute_async_script(
+                        OBSERVE_SELECTORS_JS, items, url_args, int(slice_seconds * 1000)
+                    )
+                except DEAD_DRIVER_ERRORS:
+                    raise
+                except WebDriverException:
+                    # Dokumen di-unload saat navigasi, pasang ulang observer di halaman baru
+                    time.sleep(self.poll_interval)
+                    continue
+
+                if result:
+                    return {
+                        "element": result.get("element"),
+                        "index": int(result.get("index", -1)),
+                        "url": result.get("url")
+                    }
+        finally:
+            if previous_script_timeout is not None:
+                try:
+                    self.driver.set_script_timeout(previous_script_timeout)
+                except WebDriverException:
+                    pass
@@ -8,53 +8,95 @@ import os
 import sys
 import json
 import time
-import platform
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, List, Iterable
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     WebDriverException,
-    ElementNotInteractableException,
-    StaleElementReferenceException
+    NoAlertPresentException,
+    UnexpectedAlertPresentException
 )
-from webdriver_manager.chrome import ChromeDriverManager
-from colorama import init, Fore, Style, Back
+from colorama import init, Fore, Style
 import argparse
 
+from chromedriver_cache import ChromeDriverCache
+from cdp_cookies import set_cookies_cdp
+from element_locator import ElementLocator
+from selector_stats import SelectorStats
+from page_readiness import PageReadiness
+from text_input import TextInserter
+from screenshot_manager import ScreenshotManager, LEVELS
+from upload_session import UploadSession
+
 # Initialize colorama untuk Windows compatibility
 init(autoreset=True)
 
 class FacebookUploader:
-    def __init__(self, headless: bool = False, debug: bool = False):
+    # Batas menunggu konfirmasi setelah klik Post/Publish (berhenti begitu terkonfirmasi). Lebih lama dari
+    # timeout readiness karena composer dengan media bisa lama tertutup
+    POST_CONFIRM_TIMEOUT = 30
+
+    def __init__(self, headless: bool = False, debug: bool = False,
+                 driver: Optional[webdriver.Chrome] = None, account: str = "default",
+                 use_profile: bool = False, screenshot_level: Optional[str] = None):
         """
         Initialize Facebook Uploader
         
         Args:
             headless: Jalankan browser dalam mode headless
             debug: Enable debug logging
+            driver: Driver yang sudah login (mis. dari BrowserPool). Driver dari luar
+                    tidak di-quit oleh uploader
+            account: Nama akun, menentukan file cookies yang dipakai
+            use_profile: Jalankan Chrome dengan profile persisten per akun sehingga
+                         session login bertahan antar run
+            screenshot_level: 'off', 'error', 'milestones' atau 'verbose'
+                              (default: env SCREENSHOT_LEVEL atau 'error')
         """
         self.headless = headless
         self.debug = debug
-        self.driver = None
-        self.wait = None
+        self.account = account
+        self.use_profile = use_profile
+        self.driver = driver
+        self.wait = WebDriverWait(driver, 30) if driver else None
+        self._owns_driver = driver is None
+        self.cookie_injection_ms = None
         
         # Setup paths - menggunakan folder cookies dengan file JSON
         self.base_dir = Path(__file__).parent
         self.cookies_dir = self.base_dir / "cookies"
         self.cookies_dir.mkdir(exist_ok=True)
-        self.cookies_path = self.cookies_dir / "facebook_cookies.json"
+        if account == "default":
+            self.cookies_path = self.cookies_dir / "facebook_cookies.json"
+        else:
+            self.cookies_path = self.cookies_dir / f"facebook_{account}_cookies.json"
         self.screenshots_dir = self.base_dir / "screenshots"
         self.screenshots_dir.mkdir(exist_ok=True)
+        self.screenshots = ScreenshotManager(self.screenshots_dir, "facebook", level=screenshot_level, log=self._log)
+        
+        # Profile Chrome persisten per akun (--user-data-dir)
+        self.profiles_dir = self.base_dir / "profiles"
+        self.profile_dir = self.profiles_dir / f"facebook_{account}"
+        self.profile_marker_path = self.profile_dir / "sosmed_session.json"
+        
+        # Statistik selector yang berhasil, untuk mengurutkan ulang fallback
+        self.selector_stats = SelectorStats(self.base_dir / "selector_stats.json", "facebook")
+        
+        # Kondisi siap bernama pengganti sleep tetap (dibuat ulang per driver)
+        self.readiness = None
+        self.readiness_timings = []
+        
+        # Tombol Post/Publish post terakhir sudah diklik: post bisa saja sudah terkirim, jangan diulang otomatis
+        self.post_clicked = False
+        # Konfirmasi (composer tertutup / Reels terpublish) terlihat setelah klik
+        self.post_confirmed = False
         
         # Facebook URLs
         self.facebook_url = "https://www.facebook.com"
@@ -128,6 +170,12 @@ class FacebookUploader:
                 "//button[text()='Terbitkan']"
             ]
         }
+        
+        # Kata kunci teks tombol (multi bahasa) untuk fallback pencarian berdasarkan teks
+        self.text_keywords = {
+            'status.post_button': ['post', 'posting', 'kirim'],
+            'reels.publish_button': ['publish', 'terbitkan', 'bagikan']
+        }
 
     def _log(self, message: str, level: str = "INFO"):
         """Enhanced logging dengan warna"""
@@ -155,50 +203,8 @@ class FacebookUploader:
         print(f"{color}{icon} {message}{Style.RESET_ALL}")
 
     def _get_chromedriver_path(self):
-        """Get ChromeDriver path dengan fallback untuk Windows"""
-        try:
-            self._log("Mendownload ChromeDriver terbaru...")
-            driver_path = ChromeDriverManager().install()
-            
-            if os.path.exists(driver_path):
-                if platform.system() == "Windows" and not driver_path.endswith('.exe'):
-                    driver_dir = os.path.dirname(driver_path)
-                    for file in os.listdir(driver_dir):
-                        if file.endswith('.exe') and 'chromedriver' in file.lower():
-                            driver_path = os.path.join(driver_dir, file)
-                            break
-                
-                self._log(f"ChromeDriver ditemukan: {driver_path}", "SUCCESS")
-                return driver_path
-            else:
-                raise FileNotFoundError("ChromeDriver tidak ditemukan setelah download")
-                
-        except Exception as e:
-            self._log(f"Error downloading ChromeDriver: {e}", "WARNING")
-            
-            self._log("Mencari ChromeDriver di sistem PATH...")
-            chrome_names = ['chromedriver', 'chromedriver.exe']
-            for name in chrome_names:
-                import shutil
-                path = shutil.which(name)
-                if path:
-                    self._log(f"ChromeDriver ditemukan di PATH: {path}", "SUCCESS")
-                    return path
-            
-            if platform.system() == "Windows":
-                common_paths = [
-                    r"C:\Program Files\Google\Chrome\Application\chromedriver.exe",
-                    r"C:\Program Files (x86)\Google\Chrome\Application\chromedriver.exe",
-                    r"C:\chromedriver\chromedriver.exe",
-                    r"C:\tools\chromedriver.exe"
-                ]
-                
-                for path in common_paths:
-                    if os.path.exists(path):
-                        self._log(f"ChromeDriver ditemukan: {path}", "SUCCESS")
-                        return path
-            
-            raise FileNotFoundError("ChromeDriver tidak ditemukan. Silakan install Chrome dan ChromeDriver.")
+        """Get ChromeDriver path dari cache lokal, download hanya jika belum ada"""
+        return ChromeDriverCache(debug=self.debug).resolve()
 
     def _setup_driver(self):
         """Setup Chrome WebDriver dengan konfigurasi optimal"""
@@ -262,6 +268,13 @@ class FacebookUploader:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument("--disable-web-security")
         
+        # Profile persisten: cookies dan local storage bertahan antar run
+        if self.use_profile:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={self.profile_dir.resolve()}")
+            chrome_options.add_argument("--profile-directory=Default")
+            self._log(f"Memakai profile Chrome: {self.profile_dir.name}", "DEBUG")
+        
         if self.headless:
             self._log("Mode headless diaktifkan")
         
@@ -278,6 +291,7 @@ class FacebookUploader:
             os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
             
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self._owns_driver = True
             
             # Anti-detection script
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -299,29 +313,162 @@ class FacebookUploader:
             
             raise
 
-    def _find_element_by_selectors(self, selectors: list, timeout: int = 10, by_type: str = "CSS") -> Optional[Any]:
-        """Mencari elemen menggunakan multiple selectors"""
-        for i, selector in enumerate(selectors):
-            try:
-                if by_type == "XPATH":
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                else:  # CSS
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                
-                if i == 0:
-                    self._log(f"Elemen ditemukan dengan {by_type} #{i+1}", "SUCCESS")
-                else:
-                    self._log(f"Elemen ditemukan dengan {by_type} #{i+1}", "SUCCESS")
-                return element
-                
-            except TimeoutException:
-                continue
-                
-        return None
+    def launch_session(self) -> webdriver.Chrome:
+        """Buka browser, muat cookies dan buka feed Facebook (dipakai BrowserPool untuk pre-launch)"""
+        self._start_session()
+        self.driver.get(self.facebook_url)
+
+        # Driver diserahkan ke pemanggil, uploader ini tidak lagi menutupnya
+        self._owns_driver = False
+        return self.driver
+
+    def _profile_session_ready(self) -> bool:
+        """Cek apakah profile sudah pernah login (tidak perlu import cookies lagi)"""
+        return self.use_profile and self.profile_marker_path.exists()
+
+    def _mark_profile_session(self):
+        """Tandai profile sudah login setelah halaman target terbuka tanpa redirect login"""
+        if not self.use_profile or self.profile_marker_path.exists():
+            return
+        try:
+            with open(self.profile_marker_path, 'w', encoding='utf-8') as f:
+                json.dump({"account": self.account, "timestamp": int(time.time())}, f)
+        except Exception as e:
+            self._log(f"Gagal menandai profile: {e}", "DEBUG")
+
+    def _start_session(self) -> bool:
+        """Setup browser dan siapkan login. Return True jika session/cookies tersedia"""
+        self._setup_driver()
+
+        if self._profile_session_ready():
+            # Session sudah tersimpan di profile, langsung ke halaman target
+            self._log("Memakai session dari profile Chrome", "SUCCESS")
+            return True
+
+        # Cookies JSON sebagai import awal (atau mekanisme login tanpa profile)
+        return self.load_cookies()
+
+    def _ensure_logged_in(self, target_url: str, cookies_loaded: bool):
+        """Pastikan halaman target tidak redirect ke login, fallback ke cookies lalu login manual"""
+        if self.check_login_required():
+            if self._profile_session_ready():
+                self._log("Session profile sudah tidak valid, mengimport cookies...", "WARNING")
+                if self.load_cookies():
+                    self.driver.get(target_url)
+                    self._wait_ready('navigation_settled', timeout=3)
+            elif cookies_loaded:
+                self._log("Cookies dimuat tapi masih perlu login, refresh halaman...", "WARNING")
+                self.driver.refresh()
+                self._wait_ready('navigation_settled', timeout=3)
+            
+            if self.check_login_required():
+                self.wait_for_login()
+                # Navigate ulang ke halaman target setelah login
+                self.driver.get(target_url)
+                self._wait_ready('navigation_settled', timeout=3)
+
+        # Profile hanya ditandai login jika halaman target benar-benar terbuka tanpa redirect ke login
+        if self.check_login_required():
+            self._log("Masih diarahkan ke halaman login, profile tidak ditandai sebagai login", "WARNING")
+            return
+        self._mark_profile_session()
+
+    def export_cookies(self) -> bool:
+        """Export cookies dari profile Chrome ke file JSON"""
+        if not self.use_profile or not self.profile_dir.exists():
+            self._log("Profile Chrome belum ada untuk akun ini", "WARNING")
+            return False
+
+        try:
+            self._setup_driver()
+            self.driver.get("https://www.facebook.com")
+            self._wait_ready('navigation_settled', timeout=2)
+            self.save_cookies()
+            return True
+        except Exception as e:
+            self._log(f"Gagal export cookies: {str(e)}", "ERROR")
+            return False
+        finally:
+            self._release_driver()
+
+    def clear_profile(self):
+        """Hapus profile Chrome akun ini"""
+        import shutil
+        try:
+            if self.profile_dir.exists():
+                shutil.rmtree(self.profile_dir)
+                self._log("Profile Chrome berhasil dihapus", "SUCCESS")
+            else:
+                self._log("Tidak ada profile Chrome untuk dihapus", "WARNING")
+        except Exception as e:
+            self._log(f"Gagal menghapus profile: {str(e)}", "ERROR")
+
+    def _release_driver(self):
+        """Tutup browser hanya jika dibuat sendiri oleh uploader ini"""
+        if not self.driver or not self._owns_driver:
+            return
+
+        self._log("Menutup browser...")
+        try:
+            self.driver.quit()
+        except:
+            pass
+        self.driver = None
+        self.wait = None
+
+    def _locate(self, selectors: list, timeout: float = 10, mode: str = "clickable",
+                by_type: str = "CSS", key: Optional[str] = None) -> Tuple[Optional[Any], int]:
+        """
+        Cari elemen dari semua kandidat selector sekaligus
+        
+        Jika key diberikan, kandidat diurutkan berdasarkan statistik keberhasilan sebelumnya
+        dan hasilnya dicatat ke selector_stats.json
+        
+        Returns:
+            Tuple (elemen, index di list selectors asli) atau (None, -1)
+        """
+        ranked = self.selector_stats.rank(key, selectors) if key else selectors
+        
+        start_time = time.time()
+        element, index = ElementLocator(self.driver).find_first(ranked, timeout=timeout, mode=mode, by_type=by_type)
+        elapsed_ms = (time.time() - start_time) * 1000
+        
+        if key:
+            self.selector_stats.record(key, ranked[index] if element is not None else None, elapsed_ms)
+        
+        if element is None:
+            return None, -1
+        return element, selectors.index(ranked[index])
+
+    def _readiness(self) -> PageReadiness:
+        """PageReadiness untuk driver aktif, kondisi platform didaftarkan sekali per driver"""
+        if self.readiness is None or self.readiness.driver is not self.driver:
+            self.readiness = PageReadiness(self.driver, log=self._log)
+            self.readiness.timings = self.readiness_timings
+            self.readiness.register('composer_open', timeout=5, present=self.status_selectors['text_input_primary'])
+            self.readiness.register('media_attached', timeout=3,
+                                    present=self.status_selectors['media_upload_verification'])
+            self.readiness.register('post_dialog_dismissed', timeout=5,
+                                    absent=["div[role='dialog'] div[contenteditable='true']"])
+            self.readiness.register('reels.upload_accepted', timeout=5, present=self.reels_selectors['next_button'])
+            self.readiness.register('reels.publish_submitted', timeout=5, absent=self.reels_selectors['publish_button'],
+                                    url_not_contains=["/reels/create"])
+        return self.readiness
+
+    def _wait_ready(self, name: str, timeout: Optional[float] = None, element: Any = None, **overrides) -> bool:
+        """Tunggu kondisi readiness bernama, timeout tidak lebih lama dari sleep yang digantikan"""
+        return self._readiness().wait(name, timeout=timeout, element=element, **overrides)
+
+    def _find_element_by_selectors(self, selectors: list, timeout: int = 10, by_type: str = "CSS",
+                                   key: Optional[str] = None) -> Optional[Any]:
+        """Mencari elemen menggunakan multiple selectors - semua kandidat dicek bersamaan"""
+        element, index = self._locate(selectors, timeout=timeout, by_type=by_type, key=key)
+        
+        if element is None:
+            return None
+        
+        self._log(f"Elemen ditemukan dengan {by_type} #{index+1}", "SUCCESS")
+        return element
 
     def load_cookies(self) -> bool:
         """Load cookies dari file JSON"""
@@ -342,40 +489,51 @@ class FacebookUploader:
                 self._log("File cookies kosong", "WARNING")
                 return False
             
-            # Navigate ke Facebook dulu sebelum set cookies
-            self.driver.get("https://www.facebook.com")
-            time.sleep(2)
+            start_time = time.time()
             
-            # Add cookies
-            cookies_added = 0
-            for cookie in cookies:
-                try:
-                    if 'name' in cookie and 'value' in cookie:
-                        clean_cookie = {
-                            'name': cookie['name'],
-                            'value': cookie['value'],
-                            'domain': cookie.get('domain', '.facebook.com'),
-                            'path': cookie.get('path', '/'),
-                        }
+            # Bulk inject via CDP di tab kosong, tanpa load homepage dulu
+            cookies_added = set_cookies_cdp(self.driver, cookies, ".facebook.com")
+            method = "CDP"
+            
+            if cookies_added is None:
+                # CDP tidak tersedia, fallback ke add_cookie per cookie
+                method = "add_cookie"
+                
+                # Navigate ke Facebook dulu sebelum set cookies
+                self.driver.get("https://www.facebook.com")
+                self._wait_ready('navigation_settled', timeout=2)
+            
+                # Add cookies
+                cookies_added = 0
+                for cookie in cookies:
+                    try:
+                        if 'name' in cookie and 'value' in cookie:
+                            clean_cookie = {
+                                'name': cookie['name'],
+                                'value': cookie['value'],
+                                'domain': cookie.get('domain', '.facebook.com'),
+                                'path': cookie.get('path', '/'),
+                            }
                         
-                        if 'expiry' in cookie:
-                            clean_cookie['expiry'] = int(cookie['expiry'])
-                        elif 'expires' in cookie:
-                            clean_cookie['expiry'] = int(cookie['expires'])
+                            if 'expiry' in cookie:
+                                clean_cookie['expiry'] = int(cookie['expiry'])
+                            elif 'expires' in cookie:
+                                clean_cookie['expiry'] = int(cookie['expires'])
                         
-                        if 'secure' in cookie:
-                            clean_cookie['secure'] = cookie['secure']
-                        if 'httpOnly' in cookie:
-                            clean_cookie['httpOnly'] = cookie['httpOnly']
+                            if 'secure' in cookie:
+                                clean_cookie['secure'] = cookie['secure']
+                            if 'httpOnly' in cookie:
+                                clean_cookie['httpOnly'] = cookie['httpOnly']
                         
-                        self.driver.add_cookie(clean_cookie)
-                        cookies_added += 1
+                            self.driver.add_cookie(clean_cookie)
+                            cookies_added += 1
                         
-                except Exception as e:
-                    if self.debug:
-                        self._log(f"Gagal menambahkan cookie {cookie.get('name', 'unknown')}: {e}", "DEBUG")
+                    except Exception as e:
+                        if self.debug:
+                            self._log(f"Gagal menambahkan cookie {cookie.get('name', 'unknown')}: {e}", "DEBUG")
             
-            self._log(f"Cookies dimuat: {cookies_added}/{len(cookies)}", "SUCCESS")
+            self.cookie_injection_ms = (time.time() - start_time) * 1000
+            self._log(f"Cookies dimuat: {cookies_added}/{len(cookies)} via {method} ({self.cookie_injection_ms:.0f} ms)", "SUCCESS")
             return cookies_added > 0
             
         except Exception as e:
@@ -421,32 +579,34 @@ class FacebookUploader:
         self._log("Silakan login secara manual di browser...", "WARNING")
         self._log(f"Menunggu login selesai (timeout {timeout} detik)...", "INFO")
         
-        start_time = time.time()
+        # Observer di dalam halaman, tanpa polling current_url
+        result = ElementLocator(self.driver).wait_for([], timeout=timeout, url_not_contains=["login", "checkpoint"])
         
-        while time.time() - start_time < timeout:
-            current_url = self.driver.current_url
-            
-            if not ("login" in current_url or "checkpoint" in current_url):
-                self._log("Login berhasil!", "SUCCESS")
-                self.save_cookies()
-                return True
-            
-            time.sleep(2)
+        if result:
+            self._log("Login berhasil!", "SUCCESS")
+            self.save_cookies()
+            return True
         
         raise TimeoutException("Timeout menunggu login")
 
-    def take_screenshot(self, filename: str = None):
-        """Ambil screenshot untuk debugging"""
+    def take_screenshot(self, filename: str = None, kind: str = "milestone"):
+        """
+        Ambil screenshot untuk debugging sesuai level kebijakan screenshot
+        
+        Args:
+            filename: Nama file
+            kind: 'error', 'milestone' atau 'verbose'
+        """
         if not filename:
             filename = f"facebook_screenshot_{int(time.time())}.png"
         
-        screenshot_path = self.screenshots_dir / filename
-        
         try:
             if self.driver:
-                self.driver.save_screenshot(str(screenshot_path))
-                self._log(f"Screenshot saved: {screenshot_path.name}", "INFO")
-                return str(screenshot_path)
+                # Capture terkompresi, penulisan ke disk di background thread
+                screenshot_path = self.screenshots.capture(self.driver, filename, kind=kind)
+                if screenshot_path:
+                    self._log(f"Screenshot saved: {Path(screenshot_path).name}", "INFO")
+                return screenshot_path
             else:
                 self._log("Driver tidak tersedia untuk screenshot", "WARNING")
                 return None
@@ -465,175 +625,223 @@ class FacebookUploader:
         Returns:
             Dict dengan status upload
         """
+        # Screenshot upload ini dikelompokkan dalam satu run
+        self.screenshots.new_run()
+        self.post_clicked = False
+        self.post_confirmed = False
+        
         try:
-            # Setup driver
-            self._setup_driver()
-            
-            # Load cookies
-            cookies_loaded = self.load_cookies()
-            
+            if self.driver is None:
+                # Setup driver + cookies/profile
+                cookies_loaded = self._start_session()
+            else:
+                # Driver dari luar (pool) sudah memuat cookies saat diluncurkan
+                cookies_loaded = True
+
             # Navigate ke Facebook
             self._log("Navigating to Facebook...")
             self.driver.get(self.facebook_url)
             self.take_screenshot(f"facebook_before_post_{int(time.time())}.png")
-            time.sleep(3)
+            self._wait_ready('navigation_settled', timeout=3)
             
             # Cek apakah perlu login
-            if self.check_login_required():
-                if cookies_loaded:
-                    self._log("Cookies dimuat tapi masih perlu login, refresh halaman...", "WARNING")
-                    self.driver.refresh()
-                    time.sleep(3)
-                
-                if self.check_login_required():
-                    self.wait_for_login()
-                    self.driver.get(self.facebook_url)
-                    time.sleep(3)
-            
-            # Tentukan mode upload
-            if status_text and media_path:
-                mode = "TEXT + MEDIA"
-            elif media_path:
-                mode = "MEDIA ONLY"
-            elif status_text:
-                mode = "TEXT ONLY"
-            else:
-                raise ValueError("Minimal status text atau media diperlukan")
-            
-            self._log(f"MODE: {mode}")
+            self._ensure_logged_in(self.facebook_url, cookies_loaded)
             
-            # Klik area "What's on your mind" untuk membuka composer
-            self._log("Mencari area 'What's on your mind' untuk membuka composer...")
-            composer_trigger = self._find_element_by_selectors(
-                self.status_selectors['composer_trigger'], 
-                timeout=10, 
-                by_type="XPATH"
-            )
-            
-            if not composer_trigger:
-                raise NoSuchElementException("Tidak dapat menemukan area composer trigger")
-            
-            self._log("Mengklik 'Area What's on your mind'...")
-            
-            # Coba klik dengan berbagai metode
+            return self._post_status(status_text, media_path)
+                
+        except Exception as e:
+            return self._failed_status_result(e, status_text, media_path)
+        
+        finally:
+            self._release_driver()
+
+    def _open_page(self, url: str):
+        """Navigasi ke url, dialog 'tinggalkan halaman?' dari post sebelumnya diterima"""
+        try:
+            # Composer/Reels yang belum selesai memasang beforeunload
+            self.driver.execute_script("window.onbeforeunload = null;")
+        except WebDriverException:
+            pass
+        
+        try:
+            self.driver.get(url)
+        except UnexpectedAlertPresentException:
             try:
-                self._log("Mencoba regular click...")
-                composer_trigger.click()
-                self._log("Berhasil klik dengan regular", "SUCCESS")
-            except Exception as e:
-                self._log(f"Regular click gagal: {e}", "WARNING")
-                try:
-                    self._log("Mencoba JavaScript click...")
-                    self.driver.execute_script("arguments[0].click();", composer_trigger)
-                    self._log("Berhasil klik dengan JavaScript", "SUCCESS")
-                except Exception as e2:
-                    self._log(f"JavaScript click gagal: {e2}", "WARNING")
-                    try:
-                        self._log("Mencoba ActionChains click...")
-                        ActionChains(self.driver).move_to_element(composer_trigger).click().perform()
-                        self._log("Berhasil klik dengan ActionChains", "SUCCESS")
-                    except Exception as e3:
-                        raise Exception(f"Semua metode klik gagal: {e}, {e2}, {e3}")
-            
-            time.sleep(5)  # Tunggu composer terbuka
-            self.take_screenshot(f"facebook_composer_opened_{int(time.time())}.png")
-            
-            # Upload media jika ada
-            if media_path:
-                self._log("Mencoba upload media langsung setelah composer terbuka...")
-                if self._upload_media_direct(media_path):
-                    self._log("Media berhasil diupload!", "SUCCESS")
-                else:
-                    raise Exception("Gagal upload media")
-            
-            # Input text jika ada
-            if status_text:
-                self._log("Mencari area text input di composer...")
-                if self._input_text_to_composer(status_text):
-                    self._log("Text berhasil dimasukkan!", "SUCCESS")
-                else:
-                    # Jika gagal input text tapi media sudah terupload, lanjutkan saja
-                    if media_path:
-                        self._log("Text gagal dimasukkan tapi media sudah ada, melanjutkan post...", "WARNING")
-                    else:
-                        raise Exception("Gagal memasukkan text ke composer")
-            
-            # Klik tombol Post
-            self._log("Mencari tombol Post di composer...")
-            post_button = self._find_element_by_selectors(
-                self.status_selectors['post_button'], 
-                timeout=10, 
-                by_type="XPATH"
-            )
-            
-            if not post_button:
-                raise NoSuchElementException("Tidak dapat menemukan tombol Post")
-            
-            self._log("Mengklik 'Post Button'...")
-            
-            # Coba klik tombol post
+                self.driver.switch_to.alert.accept()
+            except NoAlertPresentException:
+                pass
+            self.driver.get(url)
+        self._wait_ready('navigation_settled', timeout=3)
+
+    def _feed_ready_in_place(self) -> bool:
+        """Feed masih terbuka dan composer sebelumnya sudah tertutup: composer bisa dibuka tanpa reload"""
+        try:
+            current_url = self.driver.current_url
+            if "facebook.com" not in current_url or any(part in current_url for part in
+                                                        ["composer", "/reels/", "login", "checkpoint"]):
+                return False
+            if not self._wait_ready('post_dialog_dismissed', timeout=1):
+                return False
+            trigger, _ = self._locate(self.status_selectors['composer_trigger'], timeout=2, mode="present",
+                                      by_type="XPATH")
+            return trigger is not None
+        except WebDriverException:
+            return False
+
+    def _open_composer(self):
+        """Buka composer status dari feed yang sedang terbuka"""
+        self._log("Mencari area 'What's on your mind' untuk membuka composer...")
+        composer_trigger = self._find_element_by_selectors(
+            self.status_selectors['composer_trigger'], 
+            timeout=10, 
+            by_type="XPATH",
+            key="status.composer_trigger"
+        )
+        
+        if not composer_trigger:
+            raise NoSuchElementException("Tidak dapat menemukan area composer trigger")
+        
+        self._log("Mengklik 'Area What's on your mind'...")
+        
+        # Coba klik dengan berbagai metode
+        try:
+            self._log("Mencoba regular click...")
+            composer_trigger.click()
+            self._log("Berhasil klik dengan regular", "SUCCESS")
+        except Exception as e:
+            self._log(f"Regular click gagal: {e}", "WARNING")
             try:
-                self._log("Mencoba regular click...")
-                post_button.click()
-                self._log("Berhasil klik dengan regular", "SUCCESS")
-            except Exception as e:
-                self._log(f"Regular click gagal: {e}", "WARNING")
+                self._log("Mencoba JavaScript click...")
+                self.driver.execute_script("arguments[0].click();", composer_trigger)
+                self._log("Berhasil klik dengan JavaScript", "SUCCESS")
+            except Exception as e2:
+                self._log(f"JavaScript click gagal: {e2}", "WARNING")
                 try:
-                    self._log("Mencoba JavaScript click...")
-                    self.driver.execute_script("arguments[0].click();", post_button)
-                    self._log("Berhasil klik dengan JavaScript", "SUCCESS")
-                except Exception as e2:
-                    raise Exception(f"Gagal klik tombol post: {e}, {e2}")
-            
-            time.sleep(5)  # Tunggu post selesai
-            
-            # Verifikasi post berhasil (kembali ke feed)
-            current_url = self.driver.current_url
-            if "facebook.com" in current_url and "composer" not in current_url:
-                self._log("Post berhasil (kembali ke feed)", "SUCCESS")
-                success = True
+                    self._log("Mencoba ActionChains click...")
+                    ActionChains(self.driver).move_to_element(composer_trigger).click().perform()
+                    self._log("Berhasil klik dengan ActionChains", "SUCCESS")
+                except Exception as e3:
+                    raise Exception(f"Semua metode klik gagal: {e}, {e2}, {e3}")
+        
+        self._wait_ready('composer_open')
+        self.take_screenshot(f"facebook_composer_opened_{int(time.time())}.png")
+
+    def _post_status(self, status_text: str = "", media_path: str = "") -> Dict[str, Any]:
+        """Buka composer, lampirkan media/text lalu post (feed sudah terbuka dan login)"""
+        # Tentukan mode upload
+        if status_text and media_path:
+            mode = "TEXT + MEDIA"
+        elif media_path:
+            mode = "MEDIA ONLY"
+        elif status_text:
+            mode = "TEXT ONLY"
+        else:
+            raise ValueError("Minimal status text atau media diperlukan")
+        
+        self._log(f"MODE: {mode}")
+        
+        self._open_composer()
+        
+        # Upload media jika ada
+        if media_path:
+            self._log("Mencoba upload media langsung setelah composer terbuka...")
+            if self._upload_media_direct(media_path):
+                self._log("Media berhasil diupload!", "SUCCESS")
             else:
-                self._log("Post mungkin berhasil tapi tidak dapat dikonfirmasi", "WARNING")
-                success = True  # Anggap berhasil
-            
-            if success:
-                self._log("Status berhasil dipost ke Facebook!", "SUCCESS")
-                return {
-                    "success": True,
-                    "message": "Post berhasil",
-                    "status_text": status_text,
-                    "media_path": media_path,
-                    "mode": mode
-                }
+                raise Exception("Gagal upload media")
+        
+        # Input text jika ada
+        if status_text:
+            self._log("Mencari area text input di composer...")
+            if self._input_text_to_composer(status_text):
+                self._log("Text berhasil dimasukkan!", "SUCCESS")
             else:
-                return {
-                    "success": False,
-                    "message": "Post mungkin berhasil tapi tidak dapat dikonfirmasi",
-                    "status_text": status_text,
-                    "media_path": media_path,
-                    "mode": mode
-                }
-                
+                # Jika gagal input text tapi media sudah terupload, lanjutkan saja
+                if media_path:
+                    self._log("Text gagal dimasukkan tapi media sudah ada, melanjutkan post...", "WARNING")
+                else:
+                    raise Exception("Gagal memasukkan text ke composer")
+        
+        # Klik tombol Post
+        self._log("Mencari tombol Post di composer...")
+        post_button = self._find_element_by_selectors(
+            self.status_selectors['post_button'], 
+            timeout=10, 
+            by_type="XPATH",
+            key="status.post_button"
+        )
+        
+        if not post_button:
+            self._log("Selector tombol Post tidak ditemukan, mencoba berdasarkan teks...", "WARNING")
+            post_button, _ = ElementLocator(self.driver).find_by_text(self.text_keywords['status.post_button'])
+        
+        if not post_button:
+            raise NoSuchElementException("Tidak dapat menemukan tombol Post")
+        
+        self._log("Mengklik 'Post Button'...")
+        
+        # Coba klik tombol post
+        try:
+            self._log("Mencoba regular click...")
+            post_button.click()
+            self.post_clicked = True
+            self._log("Berhasil klik dengan regular", "SUCCESS")
         except Exception as e:
-            error_msg = f"Facebook status upload gagal: {str(e)}"
-            self._log(error_msg, "ERROR")
-            
-            self.take_screenshot(f"facebook_error_{int(time.time())}.png")
-            
+            self._log(f"Regular click gagal: {e}", "WARNING")
+            try:
+                self._log("Mencoba JavaScript click...")
+                self.driver.execute_script("arguments[0].click();", post_button)
+                self.post_clicked = True
+                self._log("Berhasil klik dengan JavaScript", "SUCCESS")
+            except Exception as e2:
+                raise Exception(f"Gagal klik tombol post: {e}, {e2}")
+        
+        dismissed = self._wait_ready('post_dialog_dismissed', timeout=self.POST_CONFIRM_TIMEOUT)
+        
+        # Verifikasi post berhasil (composer tertutup dan kembali ke feed)
+        current_url = self.driver.current_url
+        if dismissed and "facebook.com" in current_url and "composer" not in current_url:
+            self._log("Post berhasil (kembali ke feed)", "SUCCESS")
+            success = True
+        else:
+            self._log("Post mungkin berhasil tapi tidak dapat dikonfirmasi", "WARNING")
+            success = False
+        self.post_confirmed = success
+        
+        if success:
+            self._log("Status berhasil dipost ke Facebook!", "SUCCESS")
+            return {
+                "success": True,
+                "message": "Post berhasil",
+                "status_text": status_text,
+                "media_path": media_path,
+                "mode": mode
+            }
+        else:
             return {
                 "success": False,
-                "message": error_msg,
+                "message": "Post mungkin berhasil tapi tidak dapat dikonfirmasi",
                 "status_text": status_text,
-                "media_path": media_path
+                "media_path": media_path,
+                "mode": mode,
+                "unconfirmed": True,
+                "retryable": False
             }
+
+    def _failed_status_result(self, error: Exception, status_text: str, media_path: str) -> Dict[str, Any]:
+        error_msg = f"Facebook status upload gagal: {str(error)}"
+        self._log(error_msg, "ERROR")
         
-        finally:
-            if self.driver:
-                self._log("Closing browser...")
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+        self.take_screenshot(f"facebook_error_{int(time.time())}.png", kind="error")
+        
+        return {
+            "success": False,
+            "message": error_msg,
+            "status_text": status_text,
+            "media_path": media_path,
+            # Gagal setelah klik Post: status mungkin sudah terkirim, ulangi hanya secara manual
+            "retryable": not self.post_clicked
+        }
 
     def _upload_media_direct(self, media_path: str) -> bool:
         """Upload media langsung setelah composer terbuka"""
@@ -649,7 +857,8 @@ class FacebookUploader:
             file_input = self._find_element_by_selectors(
                 self.status_selectors['file_input'], 
                 timeout=5, 
-                by_type="XPATH"
+                by_type="XPATH",
+                key="status.file_input"
             )
             
             if file_input:
@@ -660,7 +869,7 @@ class FacebookUploader:
                 self._log("Media berhasil diupload langsung!", "SUCCESS")
                 
                 # Tunggu dan verifikasi upload
-                time.sleep(3)
+                self._wait_ready('media_attached')
                 return self._verify_media_upload()
             else:
                 self._log("Input file tidak ditemukan langsung", "WARNING")
@@ -675,18 +884,14 @@ class FacebookUploader:
         self._log("Memverifikasi apakah media sudah ter-upload...")
         
         try:
-            # Cek indikator media upload
-            for i, selector in enumerate(self.status_selectors['media_upload_verification']):
-                try:
-                    element = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    if element.is_displayed():
-                        self._log(f"✅ Media berhasil ter-upload! (selector #{i+1})", "SUCCESS")
-                        self.take_screenshot(f"facebook_media_uploaded_{int(time.time())}.png")
-                        return True
-                except TimeoutException:
-                    continue
+            # Semua indikator media diamati sekaligus, budget sama dengan 3 detik per selector sebelumnya
+            selectors = self.status_selectors['media_upload_verification']
+            result = ElementLocator(self.driver).wait_for(selectors, timeout=3 * len(selectors), by_type="XPATH")
+            
+            if result:
+                self._log(f"✅ Media berhasil ter-upload! (selector #{result['index']+1})", "SUCCESS")
+                self.take_screenshot(f"facebook_media_uploaded_{int(time.time())}.png")
+                return True
             
             self._log("Tidak dapat memverifikasi media upload", "WARNING")
             return False
@@ -700,130 +905,34 @@ class FacebookUploader:
         if not text.strip():
             return True
         
-        self._log(f"🎯 Media sudah ter-upload, mengetik text di composer yang sama...")
-        self._log(f"🎯 Mengetik text di composer yang sama (tanpa membuat composer baru)...")
+        self._log("🎯 Mengetik text di composer yang sama (tanpa membuat composer baru)...")
         
-        # Coba mencari text area di composer yang sudah terbuka
-        self._log("Mencoba CSS selector berdasarkan elemen yang diberikan...")
+        # Semua kandidat text area dicek bersamaan
+        text_element = self._find_element_by_selectors(
+            self.status_selectors['text_input_primary'],
+            timeout=10,
+            by_type="CSS",
+            key="status.text_input"
+        )
         
-        for i, selector in enumerate(self.status_selectors['text_input_primary']):
-            try:
-                self._log(f"🎯 Mencoba strategi #{i+1}...")
-                
-                # Cari elemen text input
-                text_element = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                )
-                
-                if text_element and text_element.is_displayed():
-                    self._log(f"Text element ditemukan dengan CSS #{i+1}", "SUCCESS")
-                    
-                    # Fokus ke elemen
-                    text_element.click()
-                    time.sleep(0.5)
-                    
-                    # Clear existing content jika ada
-                    try:
-                        text_element.clear()
-                    except:
-                        pass
-                    
-                    # Input text dengan berbagai metode
-                    success = False
-                    
-                    # Metode 1: Direct send_keys
-                    try:
-                        text_element.send_keys(text)
-                        time.sleep(1)
-                        
-                        # Verifikasi text masuk
-                        if self._verify_text_input(text_element, text):
-                            self._log(f"✅ Text berhasil diketik dengan strategi #{i+1}!", "SUCCESS")
-                            return True
-                        else:
-                            self._log(f"⚠️ ❌ Strategi #{i+1} gagal - text tidak terdeteksi", "WARNING")
-                    except Exception as e:
-                        self._log(f"⚠️ ❌ Strategi #{i+1} gagal: {str(e)}", "WARNING")
-                    
-                    # Metode 2: JavaScript setValue
-                    try:
-                        self.driver.execute_script(f"arguments[0].textContent = '{text}';", text_element)
-                        self.driver.execute_script(f"arguments[0].innerText = '{text}';", text_element)
-                        time.sleep(1)
-                        
-                        if self._verify_text_input(text_element, text):
-                            self._log(f"✅ Text berhasil diketik dengan JavaScript #{i+1}!", "SUCCESS")
-                            return True
-                    except Exception as e:
-                        self._log(f"JavaScript method gagal: {str(e)}", "WARNING")
-                    
-                    # Metode 3: ActionChains
-                    try:
-                        ActionChains(self.driver).move_to_element(text_element).click().send_keys(text).perform()
-                        time.sleep(1)
-                        
-                        if self._verify_text_input(text_element, text):
-                            self._log(f"✅ Text berhasil diketik dengan ActionChains #{i+1}!", "SUCCESS")
-                            return True
-                    except Exception as e:
-                        self._log(f"ActionChains method gagal: {str(e)}", "WARNING")
-                
-            except TimeoutException:
-                self._log(f"⚠️ Selector #{i+1} tidak ditemukan", "WARNING")
-                continue
-            except Exception as e:
-                self._log(f"⚠️ Error pada strategi #{i+1}: {str(e)}", "WARNING")
-                continue
+        if not text_element:
+            self._log("❌ Text area composer tidak ditemukan", "ERROR")
+            return False
         
-        self._log("❌ ❌ Semua strategi input text gagal", "ERROR")
-        return False
-
-    def _verify_text_input(self, element, expected_text: str) -> bool:
-        """Verifikasi apakah text sudah masuk ke elemen"""
         try:
-            # Ambil screenshot untuk debugging
-            self.take_screenshot(f"facebook_text_input_verification_{int(time.time())}.png")
-            
-            # Cek berbagai atribut untuk memverifikasi text
-            actual_text = ""
-            
-            # Cek textContent
-            try:
-                actual_text = self.driver.execute_script("return arguments[0].textContent;", element)
-                if actual_text and expected_text.lower() in actual_text.lower():
-                    return True
-            except:
-                pass
-            
-            # Cek innerText
-            try:
-                actual_text = self.driver.execute_script("return arguments[0].innerText;", element)
-                if actual_text and expected_text.lower() in actual_text.lower():
-                    return True
-            except:
-                pass
-            
-            # Cek value attribute
-            try:
-                actual_text = element.get_attribute('value')
-                if actual_text and expected_text.lower() in actual_text.lower():
-                    return True
-            except:
-                pass
-            
-            # Cek data-text attribute
-            try:
-                actual_text = element.get_attribute('data-text')
-                if actual_text and expected_text.lower() in actual_text.lower():
-                    return True
-            except:
-                pass
-            
-            return False
-            
-        except Exception as e:
-            self._log(f"Error verifying text input: {str(e)}", "DEBUG")
-            return False
+            # Seluruh text dimasukkan sekaligus (CDP/paste), mengetik hanya sebagai fallback
+            method = TextInserter(self.driver, log=self._log).insert(text_element, text)
+        except WebDriverException as e:
+            self._log(f"Error input text: {str(e)}", "WARNING")
+            method = None
+        
+        if method:
+            self._log(f"✅ Text berhasil dimasukkan via {method}!", "SUCCESS")
+            self.take_screenshot(f"facebook_text_input_verification_{int(time.time())}.png", kind="verbose")
+            return True
+        
+        self._log("❌ ❌ Semua metode input text gagal", "ERROR")
+        return False
 
     def upload_reels(self, video_path: str, description: str = "") -> Dict[str, Any]:
         """
@@ -836,74 +945,120 @@ class FacebookUploader:
         Returns:
             Dict dengan status upload
         """
+        # Screenshot upload ini dikelompokkan dalam satu run
+        self.screenshots.new_run()
+        self.post_clicked = False
+        self.post_confirmed = False
+        
         try:
-            # Setup driver
-            self._setup_driver()
-            
-            # Load cookies
-            cookies_loaded = self.load_cookies()
-            
+            if self.driver is None:
+                # Setup driver + cookies/profile
+                cookies_loaded = self._start_session()
+            else:
+                # Driver dari luar (pool) sudah memuat cookies saat diluncurkan
+                cookies_loaded = True
+
             # Navigate ke Facebook Reels Create
             self._log("Navigasi ke Facebook Reels Create...")
             self.driver.get(self.reels_create_url)
-            time.sleep(3)
+            self._wait_ready('navigation_settled', timeout=3)
             
             # Cek apakah perlu login
-            if self.check_login_required():
-                if cookies_loaded:
-                    self._log("Cookies dimuat tapi masih perlu login, refresh halaman...", "WARNING")
-                    self.driver.refresh()
-                    time.sleep(3)
-                
-                if self.check_login_required():
-                    self.wait_for_login()
-                    self.driver.get(self.reels_create_url)
-                    time.sleep(3)
-            
-            # Upload video
-            if not self._upload_reels_video(video_path):
-                raise Exception("Gagal upload video reels")
-            
-            # Navigate through reels creation steps
-            if not self._navigate_reels_steps():
-                raise Exception("Gagal navigasi steps reels")
-            
-            # Add description
-            if description and not self._add_reels_description(description):
-                self._log("Gagal menambahkan deskripsi, melanjutkan tanpa deskripsi...", "WARNING")
+            self._ensure_logged_in(self.reels_create_url, cookies_loaded)
             
-            # Publish reels
-            if not self._publish_reels():
-                raise Exception("Gagal publish reels")
-            
-            self._log("Reels berhasil diupload ke Facebook!", "SUCCESS")
-            return {
-                "success": True,
-                "message": "Reels upload berhasil",
-                "video_path": video_path,
-                "description": description
-            }
+            return self._post_reels(video_path, description)
                 
         except Exception as e:
-            error_msg = f"Facebook reels upload gagal: {str(e)}"
-            self._log(error_msg, "ERROR")
-            
-            self.take_screenshot(f"facebook_reels_error_{int(time.time())}.png")
-            
+            return self._failed_reels_result(e, video_path, description)
+        
+        finally:
+            self._release_driver()
+
+    def _post_reels(self, video_path: str, description: str = "") -> Dict[str, Any]:
+        """Upload, deskripsi dan publish di halaman Reels Create yang sudah terbuka"""
+        # Upload video
+        if not self._upload_reels_video(video_path):
+            raise Exception("Gagal upload video reels")
+        
+        # Navigate through reels creation steps
+        if not self._navigate_reels_steps():
+            raise Exception("Gagal navigasi steps reels")
+        
+        # Add description
+        if description and not self._add_reels_description(description):
+            self._log("Gagal menambahkan deskripsi, melanjutkan tanpa deskripsi...", "WARNING")
+        
+        # Publish reels
+        if not self._publish_reels():
+            raise Exception("Gagal publish reels")
+        
+        if not self.post_confirmed:
+            self._log("Reels mungkin berhasil tapi tidak dapat dikonfirmasi", "WARNING")
             return {
                 "success": False,
-                "message": error_msg,
+                "message": "Reels mungkin berhasil tapi tidak dapat dikonfirmasi",
                 "video_path": video_path,
-                "description": description
+                "description": description,
+                "unconfirmed": True,
+                "retryable": False
             }
         
-        finally:
-            if self.driver:
-                self._log("Menutup browser...")
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+        self._log("Reels berhasil diupload ke Facebook!", "SUCCESS")
+        return {
+            "success": True,
+            "message": "Reels upload berhasil",
+            "video_path": video_path,
+            "description": description
+        }
+
+    def _failed_reels_result(self, error: Exception, video_path: str, description: str) -> Dict[str, Any]:
+        error_msg = f"Facebook reels upload gagal: {str(error)}"
+        self._log(error_msg, "ERROR")
+        
+        self.take_screenshot(f"facebook_reels_error_{int(time.time())}.png", kind="error")
+        
+        return {
+            "success": False,
+            "message": error_msg,
+            "video_path": video_path,
+            "description": description,
+            "retryable": not self.post_clicked
+        }
+
+    def session(self) -> "FacebookSession":
+        """
+        Session panjang: login sekali, lalu post status/Reels berturut-turut di Chrome yang sama
+
+        Contoh:
+            with uploader.session() as session:
+                session.post_status("Selamat pagi!")
+                session.post_reels("video.mp4", "Reels hari ini")
+        """
+        return FacebookSession(self)
+
+    def upload_many(self, posts: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Post beberapa status/Reels dalam satu session browser (mis. kalender konten satu hari)
+
+        Args:
+            posts: Dict per post, {"type": "status", "status": ..., "media": ...} atau
+                   {"type": "reels", "video": ..., "description": ...}
+
+        Returns:
+            List hasil per post (urutan sama dengan input) dengan duration_seconds dan navigated;
+            satu post gagal tidak menghentikan sisanya
+        """
+        posts = list(posts)
+        try:
+            with self.session() as session:
+                for post in posts:
+                    session.post(post)
+                return session.results
+        except Exception as e:
+            # Session gagal dibuka (browser/login): semua post dilaporkan gagal
+            self._log(f"Session Facebook gagal dibuka: {str(e)}", "ERROR")
+            return [dict(post, success=False, message=f"Session gagal dibuka: {str(e)}", index=index)
+                    for index, post in enumerate(posts)]
 
     def _upload_reels_video(self, video_path: str) -> bool:
         """Upload video untuk reels"""
@@ -918,7 +1073,8 @@ class FacebookUploader:
             upload_input = self._find_element_by_selectors(
                 self.reels_selectors['upload_input'], 
                 timeout=10, 
-                by_type="XPATH"
+                by_type="XPATH",
+                key="reels.upload_input"
             )
             
             if not upload_input:
@@ -930,7 +1086,7 @@ class FacebookUploader:
             upload_input.send_keys(abs_path)
             
             self._log("File video berhasil dikirim ke input.", "SUCCESS")
-            time.sleep(5)  # Tunggu upload selesai
+            self._wait_ready('reels.upload_accepted')
             
             return True
             
@@ -946,13 +1102,15 @@ class FacebookUploader:
             next_button = self._find_element_by_selectors(
                 self.reels_selectors['next_button'], 
                 timeout=15, 
-                by_type="XPATH"
+                by_type="XPATH",
+                key="reels.next_button"
             )
             
             if next_button:
                 next_button.click()
                 self._log("Tombol 'Next' berhasil diklik (index 1)!", "SUCCESS")
-                time.sleep(3)
+                # Tombol pertama harus hilang dulu, jika tidak pencarian berikut akan mengklik tombol yang sama
+                self._wait_ready('element_gone', element=next_button)
             else:
                 self._log("Tombol 'Next' pertama tidak ditemukan", "WARNING")
             
@@ -961,13 +1119,14 @@ class FacebookUploader:
             next_button2 = self._find_element_by_selectors(
                 self.reels_selectors['next_button'], 
                 timeout=10, 
-                by_type="XPATH"
+                by_type="XPATH",
+                key="reels.next_button"
             )
             
             if next_button2:
                 next_button2.click()
                 self._log("Tombol 'Next' berhasil diklik (index 2)!", "SUCCESS")
-                time.sleep(3)
+                self._wait_ready('element_gone', element=next_button2)
             else:
                 self._log("Tombol 'Next' kedua tidak ditemukan, melanjutkan...", "WARNING")
             
@@ -987,15 +1146,16 @@ class FacebookUploader:
             desc_input = self._find_element_by_selectors(
                 self.reels_selectors['description_input'], 
                 timeout=10, 
-                by_type="XPATH"
+                by_type="XPATH",
+                key="reels.description_input"
             )
             
             if desc_input:
-                desc_input.click()
-                time.sleep(0.5)
-                desc_input.clear()
-                desc_input.send_keys(description)
-                self._log("Deskripsi berhasil diisi", "SUCCESS")
+                method = TextInserter(self.driver, log=self._log).insert(desc_input, description)
+                if not method:
+                    self._log("Deskripsi tidak terverifikasi setelah semua metode input", "WARNING")
+                    return False
+                self._log(f"Deskripsi berhasil diisi via {method}", "SUCCESS")
                 return True
             else:
                 self._log("Input deskripsi tidak ditemukan", "WARNING")
@@ -1012,15 +1172,19 @@ class FacebookUploader:
             publish_button = self._find_element_by_selectors(
                 self.reels_selectors['publish_button'], 
                 timeout=10, 
-                by_type="XPATH"
+                by_type="XPATH",
+                key="reels.publish_button"
             )
             
+            if not publish_button:
+                self._log("Selector tombol Publish tidak ditemukan, mencoba berdasarkan teks...", "WARNING")
+                publish_button, _ = ElementLocator(self.driver).find_by_text(self.text_keywords['reels.publish_button'])
+            
             if publish_button:
                 publish_button.click()
+                self.post_clicked = True
                 self._log("Tombol 'Publish' berhasil diklik (index 2)!", "SUCCESS")
-                time.sleep(5)
-                
-                self._log("Upload video reels berhasil!", "SUCCESS")
+                self.post_confirmed = self._wait_ready('reels.publish_submitted', timeout=self.POST_CONFIRM_TIMEOUT)
                 return True
             else:
                 raise NoSuchElementException("Tombol Publish tidak ditemukan")
@@ -1089,6 +1253,121 @@ class FacebookUploader:
             return {"exists": True, "error": str(e)}
 
 
+class FacebookSession(UploadSession):
+    """Chrome yang sudah login ke Facebook untuk banyak status/Reels berturut-turut"""
+
+    # Batas menunggu post sebelumnya yang belum terkonfirmasi sebelum halaman dinavigasi ulang
+    SETTLE_TIMEOUT = 60
+    # Kondisi readiness yang menandakan post terkirim, per jenis post
+    SETTLE_CONDITIONS = {"status": "post_dialog_dismissed", "reels": "reels.publish_submitted"}
+
+    def __init__(self, uploader: FacebookUploader):
+        super().__init__(uploader)
+        # Halaman bersih yang sedang terbuka: 'status' (feed), 'reels' (Reels Create) atau None
+        self._page: Optional[str] = None
+        # Jenis post sebelumnya yang sudah diklik tapi belum terkonfirmasi
+        self._unsettled_kind: Optional[str] = None
+
+    def _open_home(self) -> str:
+        self.uploader._log("Navigating to Facebook...")
+        self.uploader._open_page(self.uploader.facebook_url)
+        return self.uploader.facebook_url
+
+    def _on_open(self):
+        self._page = "status"
+        self._unsettled_kind = None
+
+    def _wait_post_settled(self):
+        """
+        Post sebelumnya sudah diklik tapi belum terkonfirmasi: tunggu composer tertutup/halaman berpindah
+        sebelum halaman dinavigasi ulang, agar post yang masih terkirim tidak dibatalkan
+        """
+        uploader = self.uploader
+        condition = self.SETTLE_CONDITIONS[self._unsettled_kind]
+        uploader._log("Menunggu post sebelumnya selesai terkirim...", "INFO")
+        if not uploader._wait_ready(condition, timeout=self.SETTLE_TIMEOUT):
+            uploader._log("Post sebelumnya belum terkonfirmasi, tetap melanjutkan ke post berikutnya", "WARNING")
+
+    def _prepare(self, kind: str) -> bool:
+        """
+        Siapkan halaman untuk post berikutnya
+
+        Returns:
+            True jika halaman dimuat ulang, False jika composer dibuka langsung di feed yang sama
+        """
+        uploader = self.uploader
+        if kind == "status" and self._page == "status" and uploader._feed_ready_in_place():
+            return False
+
+        url = uploader.facebook_url if kind == "status" else uploader.reels_create_url
+        uploader._open_page(url)
+        if uploader.check_login_required():
+            uploader._ensure_logged_in(url, True)
+        return True
+
+    def _run(self, kind: str, publish, failed, describe: str) -> Dict[str, Any]:
+        uploader = self.uploader
+        uploader.screenshots.new_run()
+        uploader.post_clicked = False
+        uploader.post_confirmed = False
+        index = len(self.results)
+        started = time.time()
+        navigated = True
+        uploader._log(f"[{index + 1}] {kind}: {describe}")
+
+        try:
+            if not self._driver_alive():
+                self._recover()
+            elif self._unsettled_kind:
+                self._wait_post_settled()
+            self._unsettled_kind = None
+            navigated = self._prepare(kind)
+            self._page = None
+            result = publish()
+            if kind == "status" and result["success"]:
+                # Composer tertutup kembali ke feed, post berikutnya tidak perlu reload
+                self._page = "status"
+        except Exception as e:
+            self._page = None
+            result = failed(e)
+
+        if uploader.post_clicked and not uploader.post_confirmed:
+            self._unsettled_kind = kind
+
+        result["type"] = kind
+        result["index"] = index
+        result["navigated"] = navigated
+        result["duration_seconds"] = round(time.time() - started, 2)
+        uploader._log(f"[{index + 1}] selesai dalam {result['duration_seconds']:.1f} detik"
+                      f"{'' if navigated else ' (composer dibuka ulang tanpa reload)'}", "DEBUG")
+        self.results.append(result)
+        return result
+
+    def post_status(self, status_text: str = "", media_path: str = "") -> Dict[str, Any]:
+        """Post status (text dan/atau media); error tidak dilempar, dilaporkan di hasil"""
+        uploader = self.uploader
+        describe = os.path.basename(media_path) if media_path else status_text[:40]
+        return self._run("status",
+                         lambda: uploader._post_status(status_text, media_path),
+                         lambda e: uploader._failed_status_result(e, status_text, media_path),
+                         describe)
+
+    def post_reels(self, video_path: str, description: str = "") -> Dict[str, Any]:
+        """Upload Reels; error tidak dilempar, dilaporkan di hasil"""
+        uploader = self.uploader
+        return self._run("reels",
+                         lambda: uploader._post_reels(video_path, description),
+                         lambda e: uploader._failed_reels_result(e, video_path, description),
+                         os.path.basename(str(video_path)))
+
+    def post(self, post: Dict[str, Any]) -> Dict[str, Any]:
+        """Post satu item kalender konten: {"type": "status"|"reels", ...}"""
+        if post.get("type", "status") == "reels":
+            return self.post_reels(post.get("video") or post.get("video_path", ""), post.get("description", ""))
+        return self.post_status(post.get("status") or post.get("status_text", ""),
+                                post.get("media") or post.get("media_path", ""))
+
+
 def main():
     """Main function untuk CLI"""
     parser = argparse.ArgumentParser(description="Facebook Uploader (Status & Reels)")
@@ -1097,24 +1376,64 @@ def main():
     parser.add_argument("--media", help="Path ke file media (video/gambar) untuk status")
     parser.add_argument("--video", help="Path ke file video untuk reels")
     parser.add_argument("--description", help="Deskripsi untuk reels")
+    parser.add_argument("--posts", metavar="FILE",
+                        help="File JSONL berisi banyak status/Reels, dipost dalam satu session browser")
     parser.add_argument("--headless", action="store_true", help="Jalankan dalam mode headless")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--clear-cookies", action="store_true", help="Hapus cookies")
     parser.add_argument("--check-cookies", action="store_true", help="Cek status cookies")
+    parser.add_argument("--account", default="default", help="Nama akun (cookies/profile terpisah per akun)")
+    parser.add_argument("--profile", action="store_true", help="Pakai profile Chrome persisten per akun")
+    parser.add_argument("--export-cookies", action="store_true", help="Export cookies dari profile Chrome ke JSON")
+    parser.add_argument("--clear-profile", action="store_true", help="Hapus profile Chrome akun")
+    parser.add_argument("--screenshots", choices=list(LEVELS), help="Level screenshot (default: error)")
     
     args = parser.parse_args()
     
-    uploader = FacebookUploader(headless=args.headless, debug=args.debug)
+    uploader = FacebookUploader(headless=args.headless, debug=args.debug,
+                                account=args.account, use_profile=args.profile or args.export_cookies,
+                                screenshot_level=args.screenshots)
     
     # Handle different actions
     if args.clear_cookies:
         uploader.clear_cookies()
         return
     
+    if args.clear_profile:
+        uploader.clear_profile()
+        return
+    
+    if args.export_cookies:
+        if not uploader.export_cookies():
+            sys.exit(1)
+        return
+    
     if args.check_cookies:
         uploader.check_cookies_status()
         return
     
+    if args.posts:
+        try:
+            with open(args.posts, 'r', encoding='utf-8') as f:
+                posts = [json.loads(line) for line in f if line.strip() and not line.lstrip().startswith("#")]
+        except (OSError, ValueError) as e:
+            print(f"{Fore.RED}❌ Gagal membaca file posts: {e}")
+            sys.exit(1)
+        
+        results = uploader.upload_many(posts)
+        
+        failed = [result for result in results if not result["success"]]
+        for result in results:
+            status = f"{Fore.GREEN}✅" if result["success"] else f"{Fore.RED}❌"
+            duration = result.get("duration_seconds")
+            timing = f" ({duration:.1f}s{', tanpa reload' if result.get('navigated') is False else ''})" \
+                if duration is not None else ""
+            print(f"{status} [{result['index'] + 1}] {result.get('type', 'status')}{timing}: {result['message']}")
+        print(f"{Fore.CYAN}📊 {len(results) - len(failed)}/{len(results)} post berhasil")
+        if failed:
+            sys.exit(1)
+        return
+    
     if args.type:
         if args.type == 'status':
             if not args.status and not args.media:
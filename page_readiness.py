@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Page Readiness - kondisi siap bernama pengganti time.sleep tetap
+Setiap kondisi adalah predicate DOM/URL yang dicek di dalam halaman, waktunya dicatat per kondisi
+"""
+
+import time
+from typing import Optional, Dict, Any, List, Callable
+
+from selenium.common.exceptions import WebDriverException, StaleElementReferenceException
+
+# Predicate generik: gabungan cek DOM/URL yang diberikan di args, digabung dengan 'any' atau 'all'
+READINESS_JS = """
+const args = arguments[0] || {};
+const focusElement = arguments[1];
+
+function isVisible(el) {
+    if (!el || !el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden') return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+
+function query(kind, selector) {
+    try {
+        if (kind === 'xpath') {
+            const out = [];
+            const snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let i = 0; i < snapshot.snapshotLength; i++) out.push(snapshot.snapshotItem(i));
+            return out;
+        }
+        return Array.from(document.querySelectorAll(selector));
+    } catch (e) {
+        return [];
+    }
+}
+
+function anyVisible(items) {
+    return items.some(item => query(item[0], item[1]).some(isVisible));
+}
+
+function domToken() {
+    return document.querySelectorAll('*').length + ':' + (document.body ? document.body.innerText.length : 0);
+}
+
+const href = location.href;
+const checks = [];
+if (args.ready_state) checks.push(document.readyState === 'complete' && href !== 'about:blank');
+if (args.attached) checks.push(args.attached.some(item => query(item[0], item[1]).length > 0));
+if (args.present) checks.push(anyVisible(args.present));
+if (args.absent) checks.push(!anyVisible(args.absent));
+if (args.url_contains) checks.push(args.url_contains.some(part => href.includes(part)));
+if (args.url_not_contains) checks.push(!args.url_not_contains.some(part => href.includes(part)));
+if (args.url_changed_from) checks.push(href !== args.url_changed_from);
+if (args.token) checks.push(domToken() !== args.token);
+if (focusElement && args.element_gone) {
+    checks.push(!isVisible(focusElement));
+} else if (focusElement) {
+    const active = document.activeElement;
+    checks.push(!!active && (active === focusElement || focusElement.contains(active)));
+}
+if (args.want_token) return {met: false, token: domToken()};
+if (!checks.length) return {met: true};
+return {met: args.mode === 'all' ? checks.every(Boolean) : checks.some(Boolean)};
+"""
+
+
+class PageReadiness:
+    # Kondisi bawaan: name -> (args predicate, timeout default)
+    BUILTIN_CONDITIONS = {
+        "navigation_settled": ({"ready_state": True}, 10.0),
+        "element_focused": ({}, 1.0),
+        "dom_changed": ({}, 3.0),
+        "element_gone": ({"element_gone": True}, 3.0),
+    }
+
+    # Jumlah catatan waktu yang disimpan, session panjang tidak boleh menumpuk tanpa batas
+    MAX_TIMINGS = 200
+
+    def __init__(self, driver, log: Optional[Callable[[str, str], None]] = None, poll_interval: float = 0.2):
+        """
+        Initialize Page Readiness
+
+        Args:
+            driver: Selenium WebDriver
+            log: Fungsi logging (message, level), mis. uploader._log
+            poll_interval: Jeda antar pengecekan (detik)
+        """
+        self.driver = driver
+        self.log = log
+        self.poll_interval = poll_interval
+        self.conditions: Dict[str, Dict[str, Any]] = {}
+        self.timings: List[Dict[str, Any]] = []
+
+        for name, (args, timeout) in self.BUILTIN_CONDITIONS.items():
+            self.register(name, timeout=timeout, **args)
+
+    @staticmethod
+    def _items(selectors: List[str]) -> List[List[str]]:
+        return [["xpath" if s.startswith(("/", "(")) else "css", s] for s in selectors]
+
+    def register(self, name: str, timeout: float = 5.0, present: Optional[List[str]] = None,
+                 absent: Optional[List[str]] = None, attached: Optional[List[str]] = None,
+                 mode: str = "any", **args):
+        """
+        Daftarkan kondisi bernama
+
+        Args:
+            name: Nama kondisi (mis. 'composer_open')
+            timeout: Batas waktu default
+            present: Selector CSS/XPath, terpenuhi jika salah satu terlihat
+            absent: Selector CSS/XPath, terpenuhi jika tidak ada yang terlihat
+            attached: Selector CSS/XPath, terpenuhi jika ada di DOM (walau tersembunyi)
+            mode: 'any' atau 'all' untuk menggabungkan cek
+            **args: Cek lain: ready_state, url_contains, url_not_contains
+        """
+        condition = dict(args, mode=mode)
+        if present:
+            condition["present"] = self._items(present)
+        if absent:
+            condition["absent"] = self._items(absent)
+        if attached:
+            condition["attached"] = self._items(attached)
+        self.conditions[name] = {"args": condition, "timeout": timeout}
+
+    def dom_token(self) -> Optional[str]:
+        """Snapshot struktur DOM, dipakai kondisi dom_changed setelah klik"""
+        try:
+            return self.driver.execute_script(READINESS_JS, {"want_token": True})["token"]
+        except WebDriverException:
+            return None
+
+    def wait(self, name: str, timeout: Optional[float] = None, element: Any = None, **overrides) -> bool:
+        """
+        Tunggu sampai kondisi terpenuhi
+
+        Args:
+            name: Nama kondisi terdaftar
+            timeout: Override timeout default
+            element: Elemen untuk kondisi element_focused / element_gone
+            **overrides: Override args kondisi (mis. token=..., url_changed_from=...)
+
+        Returns:
+            True jika terpenuhi, False jika timeout (alur tetap lanjut seperti sleep)
+        """
+        if name not in self.conditions:
+            raise KeyError(f"Kondisi readiness tidak dikenal: {name}")
+
+        condition = self.conditions[name]
+        args = dict(condition["args"], **overrides)
+        timeout = condition["timeout"] if timeout is None else timeout
+
+        start_time = time.time()
+        deadline = start_time + timeout
+        met = False
+
+        while True:
+            try:
+                result = self.driver.execute_script(READINESS_JS, args, element)
+                met = bool(result and result.get("met"))
+            except StaleElementReferenceException:
+                # Elemen sudah dilepas dari DOM
+                met = bool(args.get("element_gone"))
+            except WebDriverException:
+                # Halaman sedang berpindah, cek lagi
+                met = False
+
+            if met or time.time() >= deadline:
+                break
+            time.sleep(self.poll_interval)
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        self.timings.append({"condition": name, "ms": round(elapsed_ms, 1), "met": met})
+        # Dipotong di tempat: list ini dibagi dengan uploader (readiness_timings)
+        del self.timings[:-self.MAX_TIMINGS]
+
+        if self.log:
+            status = "siap" if met else "timeout"
+            self.log(f"Kondisi '{name}' {status} ({elapsed_ms:.0f} ms)", "DEBUG")
+
+        return met
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Screenshot Manager - kebijakan level screenshot dan penulisan file di background
+Capture lewat CDP Page.captureScreenshot (JPEG/WebP terkompresi), disk I/O di thread terpisah.
+File disimpan per run (screenshots/<platform>/<run_id>/) dan dirotasi berdasarkan ukuran, umur dan jumlah
+"""
+
+import os
+import json
+import time
+import uuid
+import queue
+import atexit
+import base64
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional, Callable, Tuple, Dict, Any
+
+from file_lock import FileLock
+
+# Level kebijakan, makin tinggi makin banyak screenshot yang diambil
+LEVELS = {"off": 0, "error": 1, "milestones": 2, "verbose": 3}
+
+# Level minimum kebijakan agar screenshot jenis ini diambil
+KIND_LEVELS = {"error": 1, "milestone": 2, "verbose": 3}
+
+FORMAT_EXTENSIONS = {"jpeg": ".jpg", "webp": ".webp", "png": ".png"}
+
+# Prefix nama file screenshot lama (langsung di screenshots/) -> platform. TikTok dulu menyimpan
+# screenshot error sebagai error_<ts>.png; prefix lain masuk ke 'misc'
+LEGACY_PREFIXES = (("facebook_", "facebook"), ("tiktok_", "tiktok"), ("error_", "tiktok"))
+
+
+class ScreenshotRetention:
+    INDEX_NAME = ".retention_index.json"
+    # Dipegang ScreenshotManager selama run aktif, run yang lock-nya terpegang tidak pernah dihapus
+    ACTIVE_LOCK_NAME = ".active.lock"
+
+    # Satu instance per folder screenshots di proses ini
+    _instances: Dict[str, "ScreenshotRetention"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, screenshots_dir: Path, max_bytes: Optional[int] = None, max_age_days: Optional[float] = None,
+                 max_count: Optional[int] = None):
+        """
+        Initialize Screenshot Retention
+
+        Args:
+            screenshots_dir: Folder screenshots
+            max_bytes: Total ukuran maksimum per platform (default: env SCREENSHOT_MAX_MB atau 200 MB)
+            max_age_days: Run yang tidak dipakai lebih lama dari ini dihapus (default: env SCREENSHOT_MAX_AGE_DAYS atau 14)
+            max_count: Jumlah file maksimum per platform (default: env SCREENSHOT_MAX_COUNT atau 2000)
+        """
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get("SCREENSHOT_MAX_MB", 200)) * 1024 * 1024)
+        if max_age_days is None:
+            max_age_days = float(os.environ.get("SCREENSHOT_MAX_AGE_DAYS", 14))
+        if max_count is None:
+            max_count = int(os.environ.get("SCREENSHOT_MAX_COUNT", 2000))
+
+        self.screenshots_dir = Path(screenshots_dir)
+        self.index_path = self.screenshots_dir / self.INDEX_NAME
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.max_count = max_count
+        self._lock = threading.Lock()
+        # Index dipakai bersama beberapa proses (upload concurrent, worker antrian)
+        self._file_lock = FileLock(self.screenshots_dir / ".retention_index.lock")
+
+    @classmethod
+    def for_dir(cls, screenshots_dir: Path) -> Tuple["ScreenshotRetention", bool]:
+        """Instance bersama untuk folder ini. Return (instance, baru_dibuat)"""
+        key = str(Path(screenshots_dir).resolve())
+        with cls._instances_lock:
+            if key in cls._instances:
+                return cls._instances[key], False
+            instance = cls(screenshots_dir)
+            cls._instances[key] = instance
+            return instance, True
+
+    def _load_index(self) -> Dict[str, Any]:
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if isinstance(index, dict):
+                    return index
+            except Exception:
+                pass
+        # Index belum ada atau rusak: scan penuh sekali, setelah itu cukup update per capture
+        return self._scan()
+
+    def _save_index(self, index: Dict[str, Any]):
+        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def _migrate_legacy_files(self):
+        """Pindahkan screenshot lama (langsung di screenshots/) ke run 'legacy' per platform"""
+        if not self.screenshots_dir.exists():
+            return
+        for path in self.screenshots_dir.iterdir():
+            if not path.is_file() or path.suffix.lower() not in (".png", ".jpg", ".webp"):
+                continue
+            platform_name = next(
+                (name for prefix, name in LEGACY_PREFIXES if path.name.startswith(prefix)), "misc"
+            )
+            legacy_dir = self.screenshots_dir / platform_name / "legacy"
+            legacy_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(path, legacy_dir / path.name)
+            except OSError:
+                continue
+
+    def _scan(self) -> Dict[str, Any]:
+        """Bangun index dari isi folder (hanya saat index belum ada)"""
+        self._migrate_legacy_files()
+        index: Dict[str, Any] = {}
+        if not self.screenshots_dir.exists():
+            return index
+
+        for platform_dir in self.screenshots_dir.iterdir():
+            if not platform_dir.is_dir():
+                continue
+            for run_dir in platform_dir.iterdir():
+                if not run_dir.is_dir():
+                    continue
+                files = [f.stat() for f in run_dir.iterdir() if f.is_file() and not f.name.startswith(".")]
+                if not files:
+                    continue
+                index.setdefault(platform_dir.name, {})[run_dir.name] = {
+                    "bytes": sum(st.st_size for st in files),
+                    "count": len(files),
+                    "created": min(st.st_mtime for st in files),
+                    "last_used": max(st.st_mtime for st in files)
+                }
+        return index
+
+    def run_lock(self, platform_name: str, run_id: str) -> FileLock:
+        """Lock yang menandai run sedang dipakai (oleh proses mana pun)"""
+        return FileLock(self.screenshots_dir / platform_name / run_id / self.ACTIVE_LOCK_NAME)
+
+    def _evict(self, platform_name: str, run_id: str) -> bool:
+        """Hapus folder run, kecuali masih dipakai ScreenshotManager lain. Return True jika dihapus"""
+        run_dir = self.screenshots_dir / platform_name / run_id
+        if run_dir.is_dir():
+            lock = self.run_lock(platform_name, run_id)
+            if not lock.acquire(blocking=False):
+                return False
+            lock.release()
+        shutil.rmtree(run_dir, ignore_errors=True)
+        return True
+
+    def _enforce(self, index: Dict[str, Any], platform_name: str, protect: Optional[str] = None) -> int:
+        """Hapus run yang paling lama tidak dipakai (LRU) sampai batas terpenuhi"""
+        runs = index.get(platform_name, {})
+        now = time.time()
+        evicted = 0
+
+        # Batas umur dulu, lalu ukuran dan jumlah file
+        for run_id in [r for r, entry in runs.items() if r != protect and now - entry["last_used"] > self.max_age]:
+            if self._evict(platform_name, run_id):
+                del runs[run_id]
+                evicted += 1
+
+        for run_id in sorted((r for r in runs if r != protect), key=lambda r: runs[r]["last_used"]):
+            total_bytes = sum(entry["bytes"] for entry in runs.values())
+            total_count = sum(entry["count"] for entry in runs.values())
+            if total_bytes <= self.max_bytes and total_count <= self.max_count:
+                break
+            if self._evict(platform_name, run_id):
+                del runs[run_id]
+                evicted += 1
+
+        return evicted
+
+    def startup(self) -> int:
+        """Terapkan batas ke semua platform berdasarkan index (tanpa scan ulang folder)"""
+        with self._lock, self._file_lock:
+            index = self._load_index()
+            evicted = sum(self._enforce(index, platform_name) for platform_name in list(index))
+            self._save_index(index)
+            return evicted
+
+    def record(self, screenshot_path: Path) -> int:
+        """
+        Catat file baru ke index run-nya lalu terapkan batas untuk platform tersebut
+
+        Returns:
+            Jumlah run yang dihapus
+        """
+        run_dir = screenshot_path.parent
+        platform_name, run_id = run_dir.parent.name, run_dir.name
+        size = screenshot_path.stat().st_size
+        now = time.time()
+
+        with self._lock, self._file_lock:
+            index = self._load_index()
+            entry = index.setdefault(platform_name, {}).setdefault(
+                run_id, {"bytes": 0, "count": 0, "created": now, "last_used": now}
+            )
+            entry["bytes"] += size
+            entry["count"] += 1
+            entry["last_used"] = now
+
+            evicted = self._enforce(index, platform_name, protect=run_id)
+            self._save_index(index)
+            return evicted
+
+
+class ScreenshotManager:
+    # Satu writer thread untuk seluruh proses, dipakai bersama semua uploader
+    _queue: "queue.Queue" = queue.Queue()
+    _thread: Optional[threading.Thread] = None
+    _thread_lock = threading.Lock()
+
+    def __init__(self, screenshots_dir: Path, platform_name: str = "misc", level: Optional[str] = None,
+                 image_format: Optional[str] = None, quality: Optional[int] = None,
+                 log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize Screenshot Manager
+
+        Args:
+            screenshots_dir: Folder tujuan screenshot
+            platform_name: Nama platform, subfolder dan batas retensi per platform
+            level: 'off', 'error', 'milestones' atau 'verbose' (default: env SCREENSHOT_LEVEL atau 'error')
+            image_format: 'jpeg', 'webp' atau 'png' (default: env SCREENSHOT_FORMAT atau 'jpeg')
+            quality: Kualitas JPEG/WebP 1-100 (default: env SCREENSHOT_QUALITY atau 70)
+            log: Fungsi logging (message, level), mis. uploader._log
+        """
+        level = (level or os.environ.get("SCREENSHOT_LEVEL") or "error").lower()
+        if level not in LEVELS:
+            raise ValueError(f"Level screenshot tidak valid: {level}")
+
+        image_format = (image_format or os.environ.get("SCREENSHOT_FORMAT") or "jpeg").lower()
+        if image_format not in FORMAT_EXTENSIONS:
+            raise ValueError(f"Format screenshot tidak valid: {image_format}")
+
+        if quality is None:
+            quality = int(os.environ.get("SCREENSHOT_QUALITY", 70))
+
+        self.screenshots_dir = Path(screenshots_dir)
+        self.platform = platform_name
+        self.level = level
+        self.image_format = image_format
+        self.quality = max(1, min(int(quality), 100))
+        self.log = log
+        self._run_lock: Optional[FileLock] = None
+        self._run_lock_guard = threading.Lock()
+        self.run_id = self.new_run()
+
+        self.retention, created = ScreenshotRetention.for_dir(self.screenshots_dir)
+        if created and level != "off":
+            # Rotasi awal di background agar startup uploader tidak menunggu
+            self._submit(self.retention.startup)
+
+    def new_run(self) -> str:
+        """Mulai run baru, screenshot berikutnya dikelompokkan di screenshots/<platform>/<run_id>/"""
+        with self._run_lock_guard:
+            # Run sebelumnya boleh dirotasi lagi
+            if self._run_lock is not None:
+                self._run_lock.release()
+                self._run_lock = None
+            self.run_id = time.strftime("%Y%m%d-%H%M%S") + "-" + uuid.uuid4().hex[:6]
+        return self.run_id
+
+    def _hold_run(self, run_id: str):
+        """Pegang lock run aktif agar proses lain tidak menghapus foldernya saat rotasi"""
+        with self._run_lock_guard:
+            if run_id != self.run_id or self._run_lock is not None:
+                return
+            lock = self.retention.run_lock(self.platform, run_id)
+            if lock.acquire(blocking=False):
+                self._run_lock = lock
+
+    def enabled(self, kind: str) -> bool:
+        """Apakah screenshot jenis ini ('error', 'milestone', 'verbose') diambil pada level sekarang"""
+        return LEVELS[self.level] >= KIND_LEVELS.get(kind, KIND_LEVELS["milestone"])
+
+    def _capture_base64(self, driver) -> Tuple[str, str]:
+        """Ambil screenshot sebagai base64, prioritas CDP dengan kompresi"""
+        if self.image_format != "png" and hasattr(driver, "execute_cdp_cmd"):
+            try:
+                result = driver.execute_cdp_cmd(
+                    "Page.captureScreenshot",
+                    {"format": self.image_format, "quality": self.quality}
+                )
+                return result["data"], self.image_format
+            except Exception:
+                # CDP tidak tersedia, fallback ke PNG standar WebDriver
+                pass
+        return driver.get_screenshot_as_base64(), "png"
+
+    def capture(self, driver, filename: str, kind: str = "milestone") -> Optional[str]:
+        """
+        Ambil screenshot jika diizinkan kebijakan, file ditulis di background
+
+        Args:
+            driver: Selenium WebDriver
+            filename: Nama file (ekstensi disesuaikan dengan format)
+            kind: 'error', 'milestone' atau 'verbose'
+
+        Returns:
+            Path file tujuan, atau None jika dilewati/gagal
+        """
+        if not self.enabled(kind):
+            return None
+
+        data, image_format = self._capture_base64(driver)
+        run_dir = self.screenshots_dir / self.platform / self.run_id
+        screenshot_path = run_dir / (Path(filename).stem + FORMAT_EXTENSIONS[image_format])
+
+        self._submit(lambda: self._write(screenshot_path, data))
+        return str(screenshot_path)
+
+    def _write(self, screenshot_path: Path, data: str):
+        screenshot_path.parent.mkdir(parents=True, exist_ok=True)
+        self._hold_run(screenshot_path.parent.name)
+        with open(screenshot_path, 'wb') as f:
+            f.write(base64.b64decode(data))
+        self.retention.record(screenshot_path)
+
+    def _submit(self, task: Callable[[], Any]):
+        """Jalankan task (tulis file / rotasi) di writer thread"""
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                ScreenshotManager._thread = threading.Thread(
+                    target=ScreenshotManager._writer_loop, name="screenshot-writer", daemon=True
+                )
+                ScreenshotManager._thread.start()
+        self._queue.put((task, self.log))
+
+    @classmethod
+    def _writer_loop(cls):
+        while True:
+            task, log = cls._queue.get()
+            try:
+                task()
+            except Exception as e:
+                if log:
+                    log(f"Gagal menulis/merotasi screenshot: {e}", "WARNING")
+            finally:
+                cls._queue.task_done()
+
+    @classmethod
+    def flush(cls):
+        """Tunggu semua screenshot di antrian selesai ditulis"""
+        if cls._thread is not None and cls._thread.is_alive():
+            cls._queue.join()
+
+
+# Jangan kehilangan screenshot error yang masih di antrian saat proses selesai
+atexit.register(ScreenshotManager.flush)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Selector Stats - statistik selector yang berhasil per platform dan key
+Dipakai untuk mengurutkan ulang fallback selector berdasarkan keberhasilan dan latency terakhir
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from file_lock import FileLock
+
+
+class SelectorStats:
+    def __init__(self, stats_path: Path, platform_name: str,
+                 half_life_days: float = 7, max_age_days: float = 30):
+        """
+        Initialize Selector Stats
+
+        Args:
+            stats_path: Lokasi file JSON statistik
+            platform_name: Nama platform ('tiktok', 'facebook', ...)
+            half_life_days: Skor keberhasilan berkurang setengah setiap periode ini
+            max_age_days: Statistik selector yang tidak pernah berhasil selama ini dihapus
+        """
+        self.stats_path = Path(stats_path)
+        self.platform = platform_name
+        self.half_life = half_life_days * 86400
+        self.max_age = max_age_days * 86400
+        self._lock = threading.Lock()
+        # File dipakai bersama semua platform dan proses: setiap penulisan baca ulang + merge di bawah lock
+        self._file_lock = FileLock(self.stats_path.with_suffix(".lock"))
+        self._data = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        if not self.stats_path.exists():
+            return {}
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            # File rusak tidak boleh menggagalkan upload, mulai dari kosong
+            return {}
+
+    def _save(self):
+        self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.stats_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.stats_path)
+
+    def _decayed_score(self, entry: Dict[str, Any], now: float) -> float:
+        age = max(now - entry.get("updated_at", now), 0)
+        return entry.get("score", 0.0) * 0.5 ** (age / self.half_life)
+
+    def _key_stats(self, key: str) -> Dict[str, Any]:
+        return self._data.setdefault(self.platform, {}).setdefault(key, {})
+
+    def rank(self, key: str, selectors: List[str]) -> List[str]:
+        """
+        Urutkan selector: yang sering berhasil dan cepat di depan, sisanya urutan asli
+
+        Returns:
+            List selector baru (list asli tidak diubah)
+        """
+        now = time.time()
+        with self._lock:
+            stats = self._data.get(self.platform, {}).get(key, {})
+
+            def sort_key(item):
+                index, selector = item
+                entry = stats.get(selector)
+                if not entry:
+                    return (0, 0.0, 0.0, index)
+                score = self._decayed_score(entry, now)
+                return (-1 if score > 0.05 else 0, -score, entry.get("avg_ms", 0.0), index)
+
+            return [selector for _, selector in sorted(enumerate(selectors), key=sort_key)]
+
+    def record(self, key: str, selector: Optional[str], elapsed_ms: float):
+        """
+        Catat hasil pencarian
+
+        Args:
+            key: Key selector (mis. 'post_button')
+            selector: Selector yang cocok, None jika semua kandidat gagal
+            elapsed_ms: Waktu sampai elemen ditemukan
+        """
+        now = time.time()
+        with self._lock:
+            if not self._file_lock.acquire(blocking=True):
+                # Tanpa lock penulisan bisa menimpa statistik proses lain, lewati saja
+                return
+            try:
+                # Mulai dari isi file terbaru agar statistik platform/proses lain tidak tertimpa
+                self._data = self._load()
+                stats = self._key_stats(key)
+
+                if selector is not None:
+                    entry = stats.setdefault(selector, {"score": 0.0, "avg_ms": elapsed_ms, "hits": 0})
+                    entry["score"] = self._decayed_score(entry, now) + 1.0
+                    # EWMA latency agar perubahan terbaru lebih berpengaruh
+                    entry["avg_ms"] = round(0.7 * entry.get("avg_ms", elapsed_ms) + 0.3 * elapsed_ms, 1)
+                    entry["hits"] = entry.get("hits", 0) + 1
+                    entry["updated_at"] = now
+                    entry["last_hit"] = now
+                else:
+                    stats.setdefault("__misses__", {"count": 0})
+                    stats["__misses__"]["count"] += 1
+                    stats["__misses__"]["last_miss"] = now
+
+                self._prune(stats, now)
+
+                try:
+                    self._save()
+                except OSError:
+                    # Statistik hanya optimasi, gagal simpan tidak boleh menggagalkan upload
+                    pass
+            finally:
+                self._file_lock.release()
+
+    def _prune(self, stats: Dict[str, Any], now: float):
+        """Hapus statistik basi agar selector yang sudah mati tidak selalu di depan"""
+        for selector in list(stats):
+            entry = stats[selector]
+            last_seen = entry.get("last_hit", entry.get("last_miss", now))
+            if now - last_seen > self.max_age:
+                del stats[selector]
+
+    def summary(self, key: Optional[str] = None) -> Dict[str, Any]:
+        """Ringkasan statistik platform ini (atau satu key)"""
+        with self._lock:
+            platform_stats = self._data.get(self.platform, {})
+            if key is not None:
+                return dict(platform_stats.get(key, {}))
+            return {k: dict(v) for k, v in platform_stats.items()}
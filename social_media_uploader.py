@@ -6,7 +6,14 @@ Dengan dukungan YouTube Data API v3
 
 import os
 import sys
+import time
+import queue
+import signal
+import threading
+import multiprocessing
+from datetime import datetime
 from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, List
 from colorama import init, Fore, Style
 import argparse
 
@@ -14,17 +21,76 @@ import argparse
 from tiktok_uploader import TikTokUploader
 from facebook_uploader import FacebookUploader
 from youtube_api_uploader import YouTubeAPIUploader
+from browser_pool import BrowserPool
+from screenshot_manager import LEVELS
+from upload_queue import UploadJobQueue, make_worker_id
+from batch_manifest import iter_manifest, validate_job, ResultsWriter
 
 # Initialize colorama
 init(autoreset=True)
 
+# Lokasi default antrian job upload
+DEFAULT_QUEUE_PATH = Path(__file__).parent / "queue" / "upload_jobs.db"
+
+# Batas waktu default per platform pada upload concurrent (detik)
+DEFAULT_PLATFORM_TIMEOUTS = {
+    "tiktok": 900,
+    "facebook_reels": 900,
+    "youtube_shorts": 1800,
+}
+
+
+def _platform_upload_process(platform: str, options: Dict[str, Any], method_name: str,
+                             args: Tuple, result_queue):
+    """Entry point proses anak: uploader dan Chrome dibuat di proses ini (driver tidak bisa dipindah antar proses)"""
+    # Timeout dari parent (terminate) -> SystemExit agar blok finally uploader tetap menutup Chrome
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+    try:
+        uploader = SocialMediaUploader(**options)
+        result = getattr(uploader, method_name)(*args)
+    except Exception as e:
+        result = {"success": False, "message": str(e)}
+    result_queue.put((platform, result))
+
+
+def _queue_worker_process(options: Dict[str, Any], db_path: str, platforms: Optional[List[str]],
+                          stop_when_empty: bool):
+    """Entry point proses worker antrian"""
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+    uploader = SocialMediaUploader(**options)
+    # Worker tanpa terminal: token YouTube harus sudah ada, jangan buka browser OAuth
+    uploader.youtube_uploader.interactive_auth = False
+    uploader.run_queue_worker(UploadJobQueue(db_path), platforms=platforms, stop_when_empty=stop_when_empty)
+
+
 class SocialMediaUploader:
-    def __init__(self, headless: bool = False, debug: bool = False):
+    # Platform video: key results -> (method upload, icon, nama)
+    VIDEO_PLATFORMS = {
+        "tiktok": ("upload_to_tiktok", "📱", "TikTok"),
+        "facebook_reels": ("upload_to_facebook_reels", "📘", "Facebook Reels"),
+        "youtube_shorts": ("upload_to_youtube_shorts", "📺", "YouTube Shorts"),
+    }
+    
+    # Platform Selenium dijalankan di proses terpisah pada upload concurrent
+    SELENIUM_PLATFORMS = {"tiktok", "facebook_reels"}
+
+    def __init__(self, headless: bool = False, debug: bool = False, browser_pool: Optional[BrowserPool] = None,
+                 use_profile: bool = False, screenshot_level: Optional[str] = None, account: str = "default"):
         self.headless = headless
         self.debug = debug
-        self.tiktok_uploader = TikTokUploader(headless=headless, debug=debug)
-        self.facebook_uploader = FacebookUploader(headless=headless, debug=debug)
-        self.youtube_uploader = YouTubeAPIUploader(debug=debug)
+        self.screenshot_level = screenshot_level
+        self.account = account
+        # Jika ada pool, upload Selenium meminjam browser yang sudah login
+        self.browser_pool = browser_pool
+        self.use_profile = use_profile
+        self.tiktok_uploader = TikTokUploader(headless=headless, debug=debug, account=account,
+                                              use_profile=use_profile, screenshot_level=screenshot_level)
+        self.facebook_uploader = FacebookUploader(headless=headless, debug=debug, account=account,
+                                                  use_profile=use_profile, screenshot_level=screenshot_level)
+        self.youtube_uploader = YouTubeAPIUploader(debug=debug, account=account)
+        
+        # Uploader per akun lain untuk worker antrian (dibuat saat pertama dipakai)
+        self._account_uploaders: Dict[str, "SocialMediaUploader"] = {account: self}
 
     def _log(self, message: str, level: str = "INFO"):
         """Simple logging"""
@@ -49,16 +115,31 @@ class SocialMediaUploader:
     def upload_to_tiktok(self, video_path: str, caption: str = "#fyp #viral #trending"):
         """Upload video ke TikTok"""
         self._log("Memulai upload ke TikTok...")
+        if self.browser_pool:
+            with self.browser_pool.session("tiktok", self.account) as driver:
+                uploader = TikTokUploader(headless=self.headless, debug=self.debug, driver=driver, account=self.account,
+                                          screenshot_level=self.screenshot_level)
+                return uploader.upload_video(video_path, caption)
         return self.tiktok_uploader.upload_video(video_path, caption)
 
     def upload_to_facebook_status(self, status_text: str = "", media_path: str = ""):
         """Upload status ke Facebook dengan dukungan media"""
         self._log("Memulai upload status ke Facebook...")
+        if self.browser_pool:
+            with self.browser_pool.session("facebook", self.account) as driver:
+                uploader = FacebookUploader(headless=self.headless, debug=self.debug, driver=driver, account=self.account,
+                                            screenshot_level=self.screenshot_level)
+                return uploader.upload_status(status_text, media_path)
         return self.facebook_uploader.upload_status(status_text, media_path)
 
     def upload_to_facebook_reels(self, video_path: str, description: str = ""):
         """Upload reels ke Facebook"""
         self._log("Memulai upload reels ke Facebook...")
+        if self.browser_pool:
+            with self.browser_pool.session("facebook", self.account) as driver:
+                uploader = FacebookUploader(headless=self.headless, debug=self.debug, driver=driver, account=self.account,
+                                            screenshot_level=self.screenshot_level)
+                return uploader.upload_reels(video_path, description)
         return self.facebook_uploader.upload_reels(video_path, description)
 
     def upload_to_youtube_shorts(self, video_path: str, title: str, description: str = "", privacy: str = "public"):
@@ -74,54 +155,383 @@ class SocialMediaUploader:
         
         return self.youtube_uploader.upload_shorts(video_path, title, description, privacy)
 
-    def upload_to_all_video_platforms(self, video_path: str, tiktok_caption: str, facebook_description: str, youtube_title: str, youtube_description: str = "", youtube_privacy: str = "public"):
-        """Upload video ke TikTok, Facebook Reels, dan YouTube Shorts sekaligus"""
-        results = {}
+    def upload_to_all_video_platforms(self, video_path: str, tiktok_caption: str, facebook_description: str,
+                                      youtube_title: str, youtube_description: str = "", youtube_privacy: str = "public",
+                                      concurrent: bool = False, timeouts: Optional[Dict[str, float]] = None):
+        """
+        Upload video ke TikTok, Facebook Reels, dan YouTube Shorts sekaligus
+        
+        Args:
+            concurrent: Jalankan ketiga platform bersamaan (Selenium di proses terpisah, YouTube API di thread)
+            timeouts: Batas waktu per platform dalam detik (hanya mode concurrent), mis. {"tiktok": 600}
+            
+        Returns:
+            Dict result per platform, masing-masing ditambah started_at, finished_at, duration_seconds
+        """
+        jobs = {
+            "tiktok": (video_path, tiktok_caption),
+            "facebook_reels": (video_path, facebook_description),
+            "youtube_shorts": (video_path, youtube_title, youtube_description, youtube_privacy),
+        }
         
-        # Upload ke TikTok
+        if concurrent:
+            results = self._upload_concurrent(jobs, dict(DEFAULT_PLATFORM_TIMEOUTS, **(timeouts or {})))
+        else:
+            results = {}
+            for platform, args in jobs.items():
+                method_name, icon, name = self.VIDEO_PLATFORMS[platform]
+                self._log(f"{icon} Mengupload ke {name}...", "INFO")
+                started = time.time()
+                try:
+                    result = getattr(self, method_name)(*args)
+                except Exception as e:
+                    self._log(f"Error {name} upload: {str(e)}", "ERROR")
+                    result = {"success": False, "message": str(e)}
+                results[platform] = self._stamp_result(result, started, time.time())
+                self._report_platform_result(platform, results[platform])
+        
+        return results
+
+    def _process_options(self) -> Dict[str, Any]:
+        """Argumen untuk membuat ulang uploader ini di proses lain"""
+        return {
+            "headless": self.headless,
+            "debug": self.debug,
+            "use_profile": self.use_profile,
+            "screenshot_level": self.screenshot_level,
+            "account": self.account
+        }
+
+    @staticmethod
+    def _stamp_result(result: Dict[str, Any], started: float, finished: float) -> Dict[str, Any]:
+        """Tambahkan timestamp mulai/selesai ke result platform"""
+        result["started_at"] = datetime.fromtimestamp(started).isoformat()
+        result["finished_at"] = datetime.fromtimestamp(finished).isoformat()
+        result["duration_seconds"] = round(finished - started, 1)
+        return result
+
+    def _report_platform_result(self, platform: str, result: Dict[str, Any]):
+        _, _, name = self.VIDEO_PLATFORMS[platform]
+        if result.get("success"):
+            self._log(f"{name} upload berhasil! ({result['duration_seconds']}s)", "SUCCESS")
+            if result.get("video_url"):
+                self._log(f"Video URL: {result['video_url']}", "INFO")
+        else:
+            self._log(f"{name} upload gagal: {result.get('message')}", "ERROR")
+
+    def _platform_upload_thread(self, platform: str, method_name: str, args: Tuple, result_queue):
         try:
-            self._log("📱 Mengupload ke TikTok...", "INFO")
-            tiktok_result = self.upload_to_tiktok(video_path, tiktok_caption)
-            results['tiktok'] = tiktok_result
-            
-            if tiktok_result['success']:
-                self._log("TikTok upload berhasil!", "SUCCESS")
-            else:
-                self._log(f"TikTok upload gagal: {tiktok_result['message']}", "ERROR")
+            result = getattr(self, method_name)(*args)
         except Exception as e:
-            self._log(f"Error TikTok upload: {str(e)}", "ERROR")
-            results['tiktok'] = {"success": False, "message": str(e)}
+            result = {"success": False, "message": str(e)}
+        result_queue.put((platform, result))
+
+    def _upload_concurrent(self, jobs: Dict[str, Tuple], timeouts: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
+        """
+        Jalankan upload semua platform bersamaan, total waktu mendekati platform paling lambat
+        
+        Platform Selenium berjalan di proses terpisah (spawn) dengan Chrome sendiri, kecuali jika memakai
+        browser pool: driver pool hanya ada di proses ini sehingga dijalankan di thread
+        """
+        context = multiprocessing.get_context("spawn")
+        result_queue = context.Queue()
+        options = self._process_options()
+        
+        running = {}
+        for platform, args in jobs.items():
+            method_name, icon, name = self.VIDEO_PLATFORMS[platform]
+            if platform in self.SELENIUM_PLATFORMS and not self.browser_pool:
+                worker = context.Process(
+                    target=_platform_upload_process, args=(platform, options, method_name, args, result_queue),
+                    name=f"upload-{platform}"
+                )
+            else:
+                worker = threading.Thread(
+                    target=self._platform_upload_thread, args=(platform, method_name, args, result_queue),
+                    name=f"upload-{platform}", daemon=True
+                )
+            self._log(f"{icon} Mengupload ke {name} (paralel)...", "INFO")
+            started = time.time()
+            worker.start()
+            running[platform] = (worker, started, started + timeouts[platform])
         
-        # Upload ke Facebook Reels
-        try:
-            self._log("📘 Mengupload reels ke Facebook...", "INFO")
-            facebook_result = self.upload_to_facebook_reels(video_path, facebook_description)
-            results['facebook_reels'] = facebook_result
+        results = {}
+        while running:
+            next_deadline = min(deadline for _, _, deadline in running.values())
+            try:
+                platform, result = result_queue.get(timeout=min(max(next_deadline - time.time(), 0.05), 1.0))
+                entry = running.pop(platform, None)
+                if entry is None:
+                    # Result terlambat dari thread yang sudah dinyatakan timeout
+                    continue
+                worker, started, _ = entry
+                if isinstance(worker, multiprocessing.process.BaseProcess):
+                    worker.join(5)
+                results[platform] = self._stamp_result(result, started, time.time())
+                self._report_platform_result(platform, results[platform])
+                continue
+            except queue.Empty:
+                pass
+            
+            now = time.time()
+            for platform, (worker, started, deadline) in list(running.items()):
+                is_process = isinstance(worker, multiprocessing.process.BaseProcess)
+                if now >= deadline:
+                    message = f"Timeout setelah {timeouts[platform]:.0f} detik"
+                    if is_process:
+                        worker.terminate()
+                        worker.join(10)
+                        if worker.is_alive():
+                            worker.kill()
+                    else:
+                        # Thread daemon tidak bisa dihentikan dan ikut mati saat program selesai;
+                        # session resumable YouTube tersimpan sehingga upload ulang melanjutkan dari byte terakhir
+                        message += " (upload dihentikan saat program selesai, jalankan ulang untuk melanjutkan)"
+                elif is_process and worker.exitcode not in (None, 0):
+                    # Proses mati (crash) tanpa sempat mengirim result
+                    message = f"Proses upload berhenti tanpa hasil (exit code {worker.exitcode})"
+                else:
+                    continue
+                running.pop(platform)
+                results[platform] = self._stamp_result({"success": False, "message": message}, started, now)
+                self._report_platform_result(platform, results[platform])
+        
+        result_queue.close()
+        return {platform: results[platform] for platform in jobs}
+
+    def _account_uploader(self, account: str) -> "SocialMediaUploader":
+        if account not in self._account_uploaders:
+            options = dict(self._process_options(), account=account)
+            uploader = SocialMediaUploader(browser_pool=self.browser_pool, **options)
+            uploader.youtube_uploader.interactive_auth = self.youtube_uploader.interactive_auth
+            self._account_uploaders[account] = uploader
+        return self._account_uploaders[account]
+
+    def run_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Jalankan satu job antrian dengan uploader akun job tersebut"""
+        uploader = self._account_uploader(job["account"])
+        metadata = job["metadata"]
+        video_path = job["video_path"]
+        platform = job["platform"]
+        
+        if platform == "tiktok":
+            return uploader.upload_to_tiktok(video_path, metadata.get("caption", "#fyp #viral #trending"))
+        if platform == "facebook-status":
+            return uploader.upload_to_facebook_status(metadata.get("status_text", ""), video_path or "")
+        if platform == "facebook-reels":
+            return uploader.upload_to_facebook_reels(video_path, metadata.get("description", ""))
+        if platform == "youtube-shorts":
+            return uploader.upload_to_youtube_shorts(
+                video_path, metadata.get("title", ""), metadata.get("description", ""),
+                metadata.get("privacy", "public")
+            )
+        raise ValueError(f"Platform job tidak dikenal: {platform}")
+
+    @staticmethod
+    def _job_heartbeat(job_queue: UploadJobQueue, job_id: int, worker_id: str, stop: threading.Event):
+        """Perpanjang lease selama job berjalan agar tidak diambil worker lain"""
+        while not stop.wait(job_queue.lease_seconds / 3):
+            if not job_queue.heartbeat(job_id, worker_id):
+                break
+
+    def run_queue_worker(self, job_queue: UploadJobQueue, platforms: Optional[List[str]] = None,
+                         stop_when_empty: bool = True, poll_interval: float = 10) -> Dict[str, int]:
+        """
+        Kerjakan job dari antrian sampai kosong (atau terus menunggu jika stop_when_empty=False)
+        
+        Args:
+            job_queue: Antrian job
+            platforms: Hanya klaim job platform ini (None = semua)
+            stop_when_empty: Berhenti jika tidak ada job yang siap
+            poll_interval: Jeda cek antrian saat kosong (detik)
+            
+        Returns:
+            Jumlah job per hasil: done, retry, failed
+        """
+        worker_id = make_worker_id()
+        requeued = job_queue.requeue_dead_workers()
+        if requeued:
+            self._log(f"{requeued} job dari worker yang berhenti dikembalikan ke antrian", "WARNING")
+        
+        counts = {"done": 0, "retry": 0, "failed": 0}
+        while True:
+            job = job_queue.claim(worker_id, platforms=platforms)
+            if job is None:
+                if stop_when_empty:
+                    break
+                time.sleep(poll_interval)
+                continue
+            
+            self._log(f"Job #{job['id']}: {job['platform']}/{job['account']} "
+                      f"(percobaan {job['attempts']}/{job['max_attempts']})", "INFO")
             
-            if facebook_result['success']:
-                self._log("Facebook Reels upload berhasil!", "SUCCESS")
+            stop = threading.Event()
+            heartbeat = threading.Thread(
+                target=self._job_heartbeat, args=(job_queue, job["id"], worker_id, stop), daemon=True
+            )
+            heartbeat.start()
+            try:
+                result = self.run_job(job)
+            except Exception as e:
+                result = {"success": False, "message": str(e)}
+            finally:
+                stop.set()
+                heartbeat.join()
+            
+            if result.get("success"):
+                job_queue.complete(job["id"], worker_id, result)
+                counts["done"] += 1
+                self._log(f"Job #{job['id']} selesai", "SUCCESS")
+                continue
+            
+            # Quota habis: tunda sampai quota reset tanpa menghabiskan percobaan
+            not_before = None
+            if result.get("deferred_until"):
+                not_before = datetime.fromisoformat(result["deferred_until"]).timestamp()
+            state = job_queue.fail(job["id"], worker_id, result.get("message", ""), result=result,
+                                   not_before=not_before, retryable=result.get("retryable", True))
+            if state == "failed":
+                counts["failed"] += 1
+                self._log(f"Job #{job['id']} gagal permanen: {result.get('message')}", "ERROR")
             else:
-                self._log(f"Facebook Reels upload gagal: {facebook_result['message']}", "ERROR")
-        except Exception as e:
-            self._log(f"Error Facebook Reels upload: {str(e)}", "ERROR")
-            results['facebook_reels'] = {"success": False, "message": str(e)}
+                counts["retry"] += 1
+                self._log(f"Job #{job['id']} gagal, dicoba lagi nanti: {result.get('message')}", "WARNING")
         
-        # Upload ke YouTube Shorts
+        self._log(f"Worker selesai: {counts['done']} berhasil, {counts['retry']} diulang, "
+                  f"{counts['failed']} gagal", "INFO")
+        return counts
+
+    def run_queue_workers(self, db_path: Path = DEFAULT_QUEUE_PATH, workers: int = 1,
+                          platforms: Optional[List[str]] = None, stop_when_empty: bool = True):
+        """
+        Kuras antrian dengan beberapa proses worker (masing-masing dengan Chrome sendiri)
+        
+        Args:
+            db_path: Lokasi database antrian
+            workers: Jumlah proses worker; 1 = jalan di proses ini
+        """
+        # Satu user-data-dir hanya bisa dipakai satu Chrome dalam waktu bersamaan (lihat BrowserPool)
+        if self.use_profile and workers > 1:
+            self._log("Profile persisten hanya mendukung 1 worker per akun, jumlah worker menjadi 1", "WARNING")
+            workers = 1
+        
+        if workers <= 1 or self.browser_pool:
+            return self.run_queue_worker(UploadJobQueue(db_path), platforms=platforms,
+                                         stop_when_empty=stop_when_empty)
+        
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(
+                target=_queue_worker_process,
+                args=(self._process_options(), str(db_path), platforms, stop_when_empty),
+                name=f"queue-worker-{index}"
+            )
+            for index in range(workers)
+        ]
+        self._log(f"Menjalankan {workers} worker antrian...", "INFO")
+        for process in processes:
+            process.start()
         try:
-            self._log("📺 Mengupload ke YouTube Shorts (API)...", "INFO")
-            youtube_result = self.upload_to_youtube_shorts(video_path, youtube_title, youtube_description, youtube_privacy)
-            results['youtube_shorts'] = youtube_result
-            
-            if youtube_result['success']:
-                self._log("YouTube Shorts upload berhasil!", "SUCCESS")
-                self._log(f"Video URL: {youtube_result.get('video_url', 'N/A')}", "INFO")
-            else:
-                self._log(f"YouTube Shorts upload gagal: {youtube_result['message']}", "ERROR")
-        except Exception as e:
-            self._log(f"Error YouTube Shorts upload: {str(e)}", "ERROR")
-            results['youtube_shorts'] = {"success": False, "message": str(e)}
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            # Job yang sedang berjalan kembali ke antrian saat worker dijalankan lagi
+            for process in processes:
+                process.terminate()
+            for process in processes:
+                process.join(10)
+            raise
+
+    # Platform job -> platform browser pool (None = API, tanpa browser)
+    POOL_PLATFORMS = {
+        "tiktok": "tiktok",
+        "facebook-status": "facebook",
+        "facebook-reels": "facebook",
+        "youtube-shorts": None,
+    }
+
+    def run_batch(self, manifest_path: Path, results_path: Path, group_size: int = 20) -> Dict[str, int]:
+        """
+        Upload semua job di manifest JSONL/CSV dalam satu proses
+        
+        Manifest dibaca bertahap dan job dikelompokkan per platform/akun (maks group_size per kelompok),
+        sehingga satu Chrome session dan satu client API melayani banyak video. Hasil ditulis ke
+        results_path (JSONL) setiap job selesai; job yang sudah berhasil di file itu dilewati, begitu juga
+        job yang gagal dengan retryable False (perlu dicek manual)
+        
+        Returns:
+            Jumlah job: success, failed, skipped, review
+        """
+        writer = ResultsWriter(results_path)
+        completed = writer.completed_ids()
+        if completed:
+            self._log(f"{len(completed)} job sudah berhasil sebelumnya, dilewati", "INFO")
+        review = writer.review_ids() - completed
+        if review:
+            self._log(f"{len(review)} job mungkin sudah terposting tapi tidak terkonfirmasi, dilewati "
+                      f"(cek manual: {', '.join(sorted(review))})", "WARNING")
+        
+        counts = {"success": 0, "failed": 0, "skipped": 0, "review": 0}
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        
+        owns_pool = self.browser_pool is None
+        pool = self.browser_pool or BrowserPool(size=1, headless=self.headless, debug=self.debug,
+                                                use_profile=self.use_profile)
+        runner = SocialMediaUploader(browser_pool=pool, **self._process_options())
+        
+        def run_group(key):
+            platform, account = key
+            jobs = groups.pop(key)
+            self._log(f"📦 {platform}/{account}: {len(jobs)} job", "INFO")
+            for job in jobs:
+                started = time.time()
+                try:
+                    result = runner.run_job(job)
+                except Exception as e:
+                    result = {"success": False, "message": str(e)}
+                result = self._stamp_result(result, started, time.time())
+                writer.write(job, result)
+                counts["success" if result.get("success") else "failed"] += 1
+                self._log(f"Job {job['id']} ({platform}/{account}): "
+                          f"{'berhasil' if result.get('success') else 'gagal - ' + str(result.get('message'))}",
+                          "SUCCESS" if result.get("success") else "ERROR")
         
-        return results
+        try:
+            for job in iter_manifest(manifest_path):
+                if job["id"] in completed:
+                    counts["skipped"] += 1
+                    continue
+                if job["id"] in review:
+                    counts["review"] += 1
+                    continue
+                
+                error = job.get("error") or validate_job(job)
+                if error:
+                    writer.write(job, {"success": False, "message": error})
+                    counts["failed"] += 1
+                    self._log(f"Job {job['id']} (baris {job['line']}) dilewati: {error}", "ERROR")
+                    continue
+                
+                key = (job["platform"], job["account"])
+                groups.setdefault(key, []).append(job)
+                if len(groups[key]) >= group_size:
+                    run_group(key)
+            
+            for key in sorted(groups):
+                run_group(key)
+                # Akun ini sudah selesai: tutup Chrome-nya agar tidak menumpuk di batch banyak akun
+                pool_platform = self.POOL_PLATFORMS.get(key[0])
+                if pool_platform and owns_pool:
+                    pool.close_idle(pool_platform, key[1])
+        finally:
+            writer.close()
+            if owns_pool:
+                pool.close()
+        
+        self._log(f"Batch selesai: {counts['success']} berhasil, {counts['failed']} gagal, "
+                  f"{counts['skipped']} dilewati, {counts['review']} perlu dicek manual. Hasil: {results_path}",
+                  "SUCCESS" if not counts["failed"] else "WARNING")
+        return counts
 
     def check_all_cookies(self):
         """Cek status cookies untuk semua platform"""
@@ -178,15 +588,28 @@ def main():
     parser.add_argument("--youtube-privacy", "-yp", choices=['public', 'unlisted', 'private'], default='public', help="Privacy YouTube")
     parser.add_argument("--headless", action="store_true", help="Jalankan dalam mode headless")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--profile", action="store_true", help="Pakai profile Chrome persisten untuk TikTok/Facebook")
+    parser.add_argument("--screenshots", choices=list(LEVELS), help="Level screenshot TikTok/Facebook (default: error)")
     parser.add_argument("--clear-cookies", action="store_true", help="Hapus semua cookies")
     parser.add_argument("--check-cookies", action="store_true", help="Cek status semua cookies")
     parser.add_argument("--check-youtube-quota", action="store_true", help="Cek YouTube API quota")
     parser.add_argument("--youtube-channel-info", action="store_true", help="Info channel YouTube")
+    parser.add_argument("--concurrent", action="store_true", help="all-video: upload ke semua platform bersamaan")
+    parser.add_argument("--platform-timeout", type=float, help="all-video --concurrent: batas waktu per platform (detik)")
+    parser.add_argument("--account", default="default", help="Nama akun (cookies/profile/token terpisah per akun)")
+    parser.add_argument("--enqueue", action="store_true", help="Masukkan upload --platform ke antrian job, bukan langsung upload")
+    parser.add_argument("--workers", type=int, metavar="N", help="Jalankan N worker untuk menguras antrian job")
+    parser.add_argument("--watch", action="store_true", help="Worker terus menunggu job baru saat antrian kosong")
+    parser.add_argument("--queue-status", action="store_true", help="Tampilkan status antrian job")
+    parser.add_argument("--queue-db", default=str(DEFAULT_QUEUE_PATH), help="Lokasi database antrian job")
+    parser.add_argument("--batch", metavar="MANIFEST", help="Upload semua job di manifest .jsonl/.csv dalam satu proses")
+    parser.add_argument("--batch-results", metavar="RESULTS", help="File JSONL hasil batch (default: <manifest>.results.jsonl)")
     parser.add_argument("--platform", "-p", choices=['tiktok', 'facebook-status', 'facebook-reels', 'youtube-shorts', 'all-video'], help="Platform target")
     
     args = parser.parse_args()
     
-    uploader = SocialMediaUploader(headless=args.headless, debug=args.debug)
+    uploader = SocialMediaUploader(headless=args.headless, debug=args.debug, use_profile=args.profile,
+                                   screenshot_level=args.screenshots, account=args.account)
     
     # Handle different actions
     if args.clear_cookies:
@@ -205,6 +628,61 @@ def main():
         uploader.get_youtube_channel_info()
         return
     
+    if args.batch:
+        if not os.path.exists(args.batch):
+            print(f"{Fore.RED}❌ File manifest tidak ditemukan: {args.batch}")
+            sys.exit(1)
+        
+        results_path = args.batch_results or str(Path(args.batch).with_suffix(".results.jsonl"))
+        counts = uploader.run_batch(Path(args.batch), Path(results_path))
+        if counts["failed"] and not counts["success"]:
+            sys.exit(1)
+        return
+    
+    if args.queue_status:
+        job_queue = UploadJobQueue(args.queue_db)
+        stats = job_queue.stats()
+        print(f"{Fore.CYAN}📋 Antrian: {stats['queued']} menunggu, {stats['running']} berjalan, "
+              f"{stats['done']} selesai, {stats['failed']} gagal")
+        for job in job_queue.list_jobs(state="failed", limit=10):
+            print(f"{Fore.RED}   #{job['id']} {job['platform']}/{job['account']}: {job['last_error']}")
+        return
+    
+    if args.workers:
+        uploader.run_queue_workers(Path(args.queue_db), workers=args.workers, stop_when_empty=not args.watch)
+        return
+    
+    if args.enqueue:
+        if not args.platform:
+            print(f"{Fore.RED}❌ --platform diperlukan untuk --enqueue")
+            sys.exit(1)
+        
+        platforms = ['tiktok', 'facebook-reels', 'youtube-shorts'] if args.platform == 'all-video' else [args.platform]
+        if args.platform != 'facebook-status' and not args.video:
+            print(f"{Fore.RED}❌ Video path diperlukan")
+            sys.exit(1)
+        if 'youtube-shorts' in platforms and not args.youtube_title:
+            print(f"{Fore.RED}❌ Title diperlukan untuk YouTube Shorts")
+            sys.exit(1)
+        
+        job_queue = UploadJobQueue(args.queue_db)
+        for platform in platforms:
+            if platform == 'tiktok':
+                metadata = {"caption": args.tiktok_caption}
+            elif platform == 'facebook-status':
+                metadata = {"status_text": args.facebook_status or ""}
+            elif platform == 'facebook-reels':
+                metadata = {"description": args.facebook_description}
+            else:
+                metadata = {"title": args.youtube_title, "description": args.youtube_description,
+                            "privacy": args.youtube_privacy}
+            
+            video_path = args.media if platform == 'facebook-status' else args.video
+            job_id = job_queue.enqueue(platform, os.path.abspath(video_path) if video_path else None,
+                                       account=args.account, **metadata)
+            print(f"{Fore.GREEN}📥 Job #{job_id} ditambahkan: {platform}/{args.account}")
+        return
+    
     # Handle platform-specific uploads
     if args.platform:
         if args.platform == 'tiktok':
@@ -283,13 +761,19 @@ def main():
                 print(f"{Fore.RED}❌ YouTube title diperlukan untuk upload ke semua platform")
                 sys.exit(1)
             
+            timeouts = None
+            if args.platform_timeout:
+                timeouts = {platform: args.platform_timeout for platform in DEFAULT_PLATFORM_TIMEOUTS}
+            
             results = uploader.upload_to_all_video_platforms(
                 args.video, 
                 args.tiktok_caption, 
                 args.facebook_description, 
                 args.youtube_title, 
                 args.youtube_description, 
-                args.youtube_privacy
+                args.youtube_privacy,
+                concurrent=args.concurrent,
+                timeouts=timeouts
             )
             
             success_count = sum(1 for result in results.values() if result.get('success', False))
@@ -459,6 +943,8 @@ def main():
             print(f"📘 Facebook: {facebook_description or 'Tanpa deskripsi'}")
             print(f"📺 YouTube: {youtube_title} ({youtube_privacy})")
             
+            concurrent = input(f"{Fore.CYAN}Upload ke semua platform bersamaan? (Y/n): ").strip().lower() != 'n'
+            
             confirm = input(f"\n{Fore.YELLOW}Lanjutkan upload? (y/N): ").strip().lower()
             if confirm != 'y':
                 continue
@@ -469,7 +955,8 @@ def main():
                 facebook_description, 
                 youtube_title, 
                 youtube_description, 
-                youtube_privacy
+                youtube_privacy,
+                concurrent=concurrent
             )
             
             success_count = sum(1 for result in results.values() if result.get('success', False))
@@ -478,7 +965,7 @@ def main():
             print(f"\n{Fore.MAGENTA}📊 HASIL UPLOAD:")
             for platform, result in results.items():
                 status = "✅ BERHASIL" if result.get('success', False) else "❌ GAGAL"
-                print(f"{platform.upper()}: {status}")
+                print(f"{platform.upper()}: {status} ({result.get('duration_seconds', 0)}s)")
                 if result.get('success') and 'video_url' in result:
                     print(f"   🔗 URL: {result['video_url']}")
             
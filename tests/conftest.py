@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modul uploader berada di root repo (bukan package)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
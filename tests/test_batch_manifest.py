@@ -0,0 +1,93 @@
+import json
+
+from batch_manifest import iter_manifest, validate_job, ResultsWriter
+
+
+def test_iter_jsonl_manifest(tmp_path):
+    video = tmp_path / "a.mp4"
+    video.write_bytes(b"video")
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(
+        "# komentar\n"
+        + json.dumps({"id": "satu", "platform": "tiktok", "video": str(video), "caption": "#fyp"}) + "\n"
+        + "\n"
+        + json.dumps({"platform": "facebook-status", "status_text": "Halo"}) + "\n"
+        + "{rusak\n"
+        + "[1, 2]\n",
+        encoding="utf-8"
+    )
+
+    jobs = list(iter_manifest(manifest))
+    assert [job["id"] for job in jobs] == ["satu", "4", "5", "6"]
+
+    assert jobs[0] == {"id": "satu", "line": 2, "platform": "tiktok", "account": "default",
+                       "video_path": str(video), "metadata": {"caption": "#fyp"}}
+    assert jobs[1]["metadata"] == {"status_text": "Halo"}
+    assert jobs[1]["video_path"] is None
+    assert "JSON tidak valid" in jobs[2]["error"]
+    assert "objek JSON" in jobs[3]["error"]
+
+
+def test_iter_csv_manifest(tmp_path):
+    manifest = tmp_path / "jobs.csv"
+    manifest.write_text(
+        "platform,account,video,title,privacy\n"
+        "youtube-shorts,kedua,b.mp4,Judul,\n"
+        "tiktok,,c.mp4,,\n",
+        encoding="utf-8"
+    )
+
+    jobs = list(iter_manifest(manifest))
+    assert jobs[0] == {"id": "2", "line": 2, "platform": "youtube-shorts", "account": "kedua",
+                       "video_path": "b.mp4", "metadata": {"title": "Judul"}}
+    # Kolom kosong tidak ikut ke metadata dan akun kembali ke default
+    assert jobs[1]["account"] == "default"
+    assert jobs[1]["metadata"] == {}
+
+
+def test_validate_job(tmp_path):
+    video = tmp_path / "a.mp4"
+    video.write_bytes(b"video")
+
+    def job(platform, video_path=None, **metadata):
+        return {"platform": platform, "video_path": video_path, "metadata": metadata}
+
+    assert validate_job(job("tiktok", str(video))) is None
+    assert validate_job(job("facebook-status", status_text="Halo")) is None
+    assert "Platform tidak dikenal" in validate_job(job("instagram", str(video)))
+    assert "status_text atau media" in validate_job(job("facebook-status"))
+    assert "Kolom video" in validate_job(job("facebook-reels"))
+    assert "File tidak ditemukan" in validate_job(job("tiktok", str(tmp_path / "hilang.mp4")))
+    assert "title" in validate_job(job("youtube-shorts", str(video)))
+
+
+def test_results_writer_resume(tmp_path):
+    results = tmp_path / "out" / "results.jsonl"
+    writer = ResultsWriter(results)
+
+    def job(job_id):
+        return {"id": job_id, "line": 1, "platform": "tiktok", "account": "default", "video_path": "a.mp4"}
+
+    writer.write(job("ok"), {"success": True})
+    writer.write(job("gagal"), {"success": False, "message": "timeout"})
+    writer.write(job("ganda"), {"success": False, "unconfirmed": True, "retryable": False})
+    writer.write(job("ulang"), {"success": False, "retryable": False})
+    writer.write(job("ulang"), {"success": True})
+    writer.close()
+    # Proses mati saat menulis baris terakhir
+    with open(results, "a", encoding="utf-8") as f:
+        f.write('{"id": "potong", "succ')
+
+    resumed = ResultsWriter(results)
+    assert resumed.completed_ids() == {"ok", "ulang"}
+    assert resumed.review_ids() - resumed.completed_ids() == {"ganda"}
+
+    entry = json.loads(results.read_text(encoding="utf-8").splitlines()[0])
+    assert entry == {"id": "ok", "line": 1, "platform": "tiktok", "account": "default",
+                     "video": "a.mp4", "success": True}
+
+
+def test_results_writer_without_file(tmp_path):
+    writer = ResultsWriter(tmp_path / "results.jsonl")
+    assert writer.completed_ids() == set()
+    assert writer.review_ids() == set()
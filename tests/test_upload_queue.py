@@ -0,0 +1,137 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from upload_queue import UploadJobQueue, QUEUED, RUNNING, DONE, FAILED
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    q = UploadJobQueue(tmp_path / "jobs.db")
+    yield q
+    q.close()
+
+
+def test_claim_returns_jobs_in_order_and_marks_running(job_queue):
+    first = job_queue.enqueue("tiktok", "a.mp4", caption="satu")
+    second = job_queue.enqueue("tiktok", "b.mp4")
+
+    job = job_queue.claim("worker-1")
+    assert job["id"] == first
+    assert job["state"] == RUNNING
+    assert job["attempts"] == 1
+    assert job["lease_owner"] == "worker-1"
+    assert job["metadata"] == {"caption": "satu"}
+
+    assert job_queue.claim("worker-2")["id"] == second
+    assert job_queue.claim("worker-3") is None
+
+
+def test_claim_filters_platforms_and_respects_not_before(job_queue):
+    job_queue.enqueue("tiktok", "a.mp4")
+    job_queue.enqueue("youtube-shorts", "b.mp4", not_before=time.time() + 3600)
+    reels = job_queue.enqueue("facebook-reels", "c.mp4")
+
+    assert job_queue.claim("worker-1", platforms=["youtube-shorts"]) is None
+    assert job_queue.claim("worker-1", platforms=["facebook-reels"])["id"] == reels
+
+
+def test_expired_lease_is_claimed_by_another_worker(job_queue):
+    job_id = job_queue.enqueue("tiktok", "a.mp4")
+    job_queue.claim("worker-1", lease_seconds=0.01)
+    time.sleep(0.05)
+
+    job = job_queue.claim("worker-2")
+    assert job["id"] == job_id
+    assert job["attempts"] == 2
+    # Worker lama tidak lagi memiliki job
+    assert not job_queue.heartbeat(job_id, "worker-1")
+    assert not job_queue.complete(job_id, "worker-1", {"success": True})
+    assert job_queue.complete(job_id, "worker-2", {"success": True})
+    assert job_queue.get(job_id)["state"] == DONE
+
+
+def test_expired_lease_on_last_attempt_fails_job(job_queue):
+    job_id = job_queue.enqueue("tiktok", "a.mp4", max_attempts=1)
+    job_queue.claim("worker-1", lease_seconds=0.01)
+    time.sleep(0.05)
+
+    assert job_queue.claim("worker-2") is None
+    job = job_queue.get(job_id)
+    assert job["state"] == FAILED
+    assert job["last_error"] == "Lease habis"
+
+
+def test_fail_requeues_with_backoff_until_attempts_run_out(job_queue):
+    job_id = job_queue.enqueue("tiktok", "a.mp4", max_attempts=2)
+
+    job_queue.claim("worker-1")
+    before = time.time()
+    assert job_queue.fail(job_id, "worker-1", "timeout", retry_delay=60) == QUEUED
+    assert job_queue.get(job_id)["not_before"] >= before + 60
+    assert job_queue.claim("worker-1") is None
+
+    # Lewati jeda retry
+    with job_queue._transaction() as conn:
+        conn.execute("UPDATE jobs SET not_before = 0 WHERE id = ?", (job_id,))
+    job_queue.claim("worker-1")
+    assert job_queue.fail(job_id, "worker-1", "timeout") == FAILED
+
+
+def test_fail_not_retryable_marks_failed_immediately(job_queue):
+    job_id = job_queue.enqueue("tiktok", "a.mp4", max_attempts=3)
+    job_queue.claim("worker-1")
+
+    state = job_queue.fail(job_id, "worker-1", "tidak terkonfirmasi", result={"unconfirmed": True},
+                           retryable=False)
+    assert state == FAILED
+    job = job_queue.get(job_id)
+    assert job["state"] == FAILED
+    assert job["attempts"] == 1
+    assert job["result"] == {"unconfirmed": True}
+
+
+def test_fail_with_not_before_does_not_count_attempt(job_queue):
+    job_id = job_queue.enqueue("youtube-shorts", "a.mp4", max_attempts=1)
+    job_queue.claim("worker-1")
+
+    reset_at = time.time() + 3600
+    assert job_queue.fail(job_id, "worker-1", "quota habis", not_before=reset_at) == QUEUED
+    job = job_queue.get(job_id)
+    assert job["attempts"] == 0
+    assert job["not_before"] == reset_at
+
+
+def _dead_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def test_requeue_dead_workers(job_queue):
+    hostname = socket.gethostname()
+    dead = job_queue.enqueue("tiktok", "dead.mp4")
+    alive = job_queue.enqueue("tiktok", "alive.mp4")
+    remote = job_queue.enqueue("tiktok", "remote.mp4")
+
+    job_queue.claim(f"{hostname}:{_dead_pid()}:1")
+    job_queue.claim(f"{hostname}:{os.getppid()}:1")
+    job_queue.claim(f"host-lain-{hostname}:{_dead_pid()}:1")
+
+    assert job_queue.requeue_dead_workers() == 1
+    assert job_queue.get(dead)["state"] == QUEUED
+    assert job_queue.get(dead)["last_error"] == "Worker berhenti saat job berjalan"
+    # Proses masih hidup dan job host lain menunggu lease habis
+    assert job_queue.get(alive)["state"] == RUNNING
+    assert job_queue.get(remote)["state"] == RUNNING
+
+
+def test_stats(job_queue):
+    job_queue.enqueue("tiktok", "a.mp4")
+    job_queue.enqueue("tiktok", "b.mp4")
+    job_queue.claim("worker-1")
+    assert job_queue.stats() == {QUEUED: 1, RUNNING: 1, DONE: 0, FAILED: 0}
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from youtube_quota import QuotaLedger, PACIFIC
+
+
+def _at(ledger, monkeypatch, *args):
+    monkeypatch.setattr(ledger, "_pacific_now", lambda: datetime(*args, tzinfo=PACIFIC))
+
+
+def test_usage_resets_at_pacific_midnight(tmp_path, monkeypatch):
+    ledger = QuotaLedger(tmp_path / "quota.json", project="client", daily_limit=5000)
+
+    _at(ledger, monkeypatch, 2026, 3, 10, 23, 30)
+    assert ledger.reserve("videos.insert")
+    assert ledger.reserve("videos.insert")
+    ledger.record("videos.list")
+    usage = ledger.usage()
+    assert usage["day"] == "2026-03-10"
+    assert usage["used"] == 3201
+    assert ledger.reset_at() == datetime(2026, 3, 11, tzinfo=PACIFIC)
+
+    _at(ledger, monkeypatch, 2026, 3, 11, 0, 5)
+    usage = ledger.usage()
+    assert usage["day"] == "2026-03-11"
+    assert usage["used"] == 0
+    assert usage["remaining"] == 5000
+
+
+def test_reserve_refuses_over_limit_and_exhausted_day(tmp_path, monkeypatch):
+    ledger = QuotaLedger(tmp_path / "quota.json", project="client", daily_limit=2000)
+    _at(ledger, monkeypatch, 2026, 3, 10, 12, 0)
+
+    assert ledger.reserve("videos.insert")
+    assert not ledger.reserve("videos.insert")
+    assert ledger.usage()["used"] == 1600
+
+    ledger.mark_exhausted()
+    assert not ledger.reserve("videos.list")
+
+    _at(ledger, monkeypatch, 2026, 3, 11, 0, 0)
+    assert ledger.reserve("videos.insert")
+
+
+def test_ledger_is_shared_per_project(tmp_path, monkeypatch):
+    path = tmp_path / "quota.json"
+    first = QuotaLedger(path, project="client", daily_limit=10000)
+    second = QuotaLedger(path, project="client", daily_limit=10000)
+    other = QuotaLedger(path, project="lain", daily_limit=10000)
+    for ledger in (first, second, other):
+        _at(ledger, monkeypatch, 2026, 3, 10, 12, 0)
+
+    first.record("videos.insert")
+    second.record("videos.update")
+    assert first.usage()["used"] == 1650
+    assert other.usage()["used"] == 0
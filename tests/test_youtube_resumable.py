@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from youtube_resumable import CHUNK_GRANULARITY, ChunkTuner, align_chunk_size  # noqa: E402
+
+
+@pytest.mark.parametrize("size, expected", [
+    (0, CHUNK_GRANULARITY),
+    (1, CHUNK_GRANULARITY),
+    (CHUNK_GRANULARITY, CHUNK_GRANULARITY),
+    (CHUNK_GRANULARITY * 2 - 1, CHUNK_GRANULARITY),
+    (8 * 1024 * 1024 + 1000, 8 * 1024 * 1024),
+    (5.9 * CHUNK_GRANULARITY, 5 * CHUNK_GRANULARITY),
+])
+def test_align_chunk_size(size, expected):
+    assert align_chunk_size(size) == expected
+
+
+def test_chunk_tuner_sizes_stay_aligned(tmp_path):
+    tuner = ChunkTuner(tmp_path / "tuning.json", "upload.example", initial_size=3 * 1000 * 1000)
+    assert tuner.current % CHUNK_GRANULARITY == 0
+
+    for elapsed in (0.3, 0.7, 1.3, 0.2):
+        size = tuner.record(tuner.current, elapsed)
+        assert size % CHUNK_GRANULARITY == 0
+        assert tuner.min_size <= size <= tuner.max_size
+    assert tuner.on_error() % CHUNK_GRANULARITY == 0
+
+
+def test_chunk_tuner_remembers_host(tmp_path):
+    path = tmp_path / "tuning.json"
+    tuner = ChunkTuner(path, "upload.example", initial_size=8 * 1024 * 1024)
+    tuner.record(tuner.current, 1.0)
+    tuner.save()
+
+    assert ChunkTuner(path, "upload.example", initial_size=1024 * 1024).current == tuner.current
+    assert ChunkTuner(path, "host.lain", initial_size=1024 * 1024).current == 1024 * 1024
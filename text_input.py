@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Text Input - memasukkan teks panjang ke input/textarea/contenteditable dalam satu operasi
+Urutan metode: CDP Input.insertText -> event paste sintetis -> mengetik (send_keys)
+"""
+
+import re
+import time
+from typing import Optional, Any, Callable
+
+from selenium.common.exceptions import WebDriverException
+
+# Fokus ke elemen dan (opsional) pilih semua isi agar teks baru menggantikan isi lama
+PREPARE_JS = """
+const el = arguments[0];
+const clear = arguments[1];
+el.scrollIntoView({block: 'center'});
+el.focus();
+
+if ('value' in el && typeof el.value === 'string') {
+    if (clear) {
+        // Native setter agar framework (React) ikut melihat perubahan value
+        const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, '');
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+    }
+    const end = el.value.length;
+    try { el.setSelectionRange(end, end); } catch (e) {}
+    return document.activeElement === el;
+}
+
+const selection = window.getSelection();
+const range = document.createRange();
+range.selectNodeContents(el);
+if (!clear) range.collapse(false);
+selection.removeAllRanges();
+selection.addRange(range);
+if (clear && (el.innerText || '').trim()) {
+    // Lewat execCommand agar editor (Lexical/Draft.js) memproses penghapusan lewat beforeinput
+    document.execCommand('delete');
+}
+return document.activeElement === el || el.contains(document.activeElement);
+"""
+
+# Paste sintetis: editor rich-text membaca clipboardData dari event paste
+PASTE_JS = """
+const el = arguments[0];
+const text = arguments[1];
+const data = new DataTransfer();
+data.setData('text/plain', text);
+const event = new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true});
+const target = document.activeElement && el.contains(document.activeElement) ? document.activeElement : el;
+target.dispatchEvent(event);
+return event.defaultPrevented;
+"""
+
+# Ambil isi elemen dalam satu panggilan untuk verifikasi
+READ_TEXT_JS = """
+const el = arguments[0];
+if ('value' in el && typeof el.value === 'string') return el.value;
+return el.innerText || el.textContent || '';
+"""
+
+
+class TextInserter:
+    def __init__(self, driver, log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize Text Inserter
+
+        Args:
+            driver: Selenium WebDriver (Chrome untuk metode CDP)
+            log: Fungsi logging (message, level), mis. uploader._log
+        """
+        self.driver = driver
+        self.log = log
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self.log:
+            self.log(message, level)
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        # Editor mengganti spasi/newline dengan nbsp atau paragraf, bandingkan tanpa whitespace
+        return re.sub(r"\s+", "", text or "").lower()
+
+    def prepare(self, element: Any, clear: bool = True) -> bool:
+        """Fokus ke elemen dan kosongkan isinya jika clear=True"""
+        try:
+            return bool(self.driver.execute_script(PREPARE_JS, element, clear))
+        except WebDriverException:
+            # Fallback: klik biasa untuk fokus
+            try:
+                element.click()
+                return True
+            except WebDriverException:
+                return False
+
+    def read_text(self, element: Any) -> str:
+        """Isi elemen saat ini (value atau innerText)"""
+        try:
+            return self.driver.execute_script(READ_TEXT_JS, element) or ""
+        except WebDriverException:
+            return ""
+
+    def verify(self, element: Any, expected_text: str) -> bool:
+        """Verifikasi teks sudah masuk dengan satu panggilan script"""
+        return self._normalize(expected_text) in self._normalize(self.read_text(element))
+
+    def _insert_cdp(self, element: Any, text: str) -> bool:
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return False
+        self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+        return True
+
+    def _insert_paste(self, element: Any, text: str) -> bool:
+        self.driver.execute_script(PASTE_JS, element, text)
+        return True
+
+    def _insert_typing(self, element: Any, text: str) -> bool:
+        element.send_keys(text)
+        return True
+
+    def insert(self, element: Any, text: str, clear: bool = True, allow_typing: bool = True) -> Optional[str]:
+        """
+        Masukkan teks ke elemen dalam satu operasi, fallback ke metode berikutnya jika verifikasi gagal
+
+        Args:
+            element: Input, textarea atau elemen contenteditable
+            text: Teks yang dimasukkan (boleh mengandung kutip, emoji, newline)
+            clear: Ganti isi lama
+            allow_typing: Izinkan fallback send_keys (lambat, memicu autocomplete)
+
+        Returns:
+            Nama metode yang berhasil ('cdp', 'paste', 'typing') atau None jika semua gagal
+        """
+        methods = [("cdp", self._insert_cdp), ("paste", self._insert_paste)]
+        if allow_typing:
+            methods.append(("typing", self._insert_typing))
+
+        original_text = "" if clear else self.read_text(element)
+
+        for name, method in methods:
+            start_time = time.time()
+            try:
+                if not self.prepare(element, clear=clear):
+                    self._log("Elemen teks tidak mendapat fokus", "DEBUG")
+                if not method(element, text):
+                    continue
+            except WebDriverException as e:
+                self._log(f"Input teks via {name} gagal: {e}", "DEBUG")
+                continue
+
+            if self.verify(element, text):
+                elapsed_ms = (time.time() - start_time) * 1000
+                self._log(f"Teks dimasukkan via {name} ({len(text)} karakter, {elapsed_ms:.0f} ms)", "DEBUG")
+                return name
+
+            self._log(f"Teks via {name} tidak terverifikasi", "DEBUG")
+
+            # Tanpa clear, sisa percobaan gagal tidak bisa dibersihkan: jangan menumpuk teks
+            if not clear and self.read_text(element) != original_text:
+                return None
+
+        return None
@@ -8,52 +8,94 @@ import os
 import sys
 import json
 import time
-import platform
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, List, Iterable
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     WebDriverException,
-    ElementNotInteractableException,
-    StaleElementReferenceException
+    NoAlertPresentException,
+    UnexpectedAlertPresentException
 )
-from webdriver_manager.chrome import ChromeDriverManager
-from colorama import init, Fore, Style, Back
+from colorama import init, Fore, Style
 import argparse
 
+from chromedriver_cache import ChromeDriverCache
+from cdp_cookies import set_cookies_cdp
+from element_locator import ElementLocator
+from selector_stats import SelectorStats
+from page_readiness import PageReadiness
+from text_input import TextInserter
+from screenshot_manager import ScreenshotManager, LEVELS
+from upload_session import UploadSession
+
 # Initialize colorama untuk Windows compatibility
 init(autoreset=True)
 
 class TikTokUploader:
-    def __init__(self, headless: bool = False, debug: bool = False):
+    # Batas menunggu konfirmasi setelah klik post (berhenti begitu terkonfirmasi)
+    POST_CONFIRM_TIMEOUT = 30
+
+    def __init__(self, headless: bool = False, debug: bool = False,
+                 driver: Optional[webdriver.Chrome] = None, account: str = "default",
+                 use_profile: bool = False, screenshot_level: Optional[str] = None):
         """
         Initialize TikTok Uploader
         
         Args:
             headless: Jalankan browser dalam mode headless
             debug: Enable debug logging
+            driver: Driver yang sudah login (mis. dari BrowserPool). Driver dari luar
+                    tidak di-quit oleh uploader
+            account: Nama akun, menentukan file cookies yang dipakai
+            use_profile: Jalankan Chrome dengan profile persisten per akun sehingga
+                         session login bertahan antar run
+            screenshot_level: 'off', 'error', 'milestones' atau 'verbose'
+                              (default: env SCREENSHOT_LEVEL atau 'error')
         """
         self.headless = headless
         self.debug = debug
-        self.driver = None
-        self.wait = None
+        self.account = account
+        self.use_profile = use_profile
+        self.driver = driver
+        self.wait = WebDriverWait(driver, 30) if driver else None
+        self._owns_driver = driver is None
+        self.cookie_injection_ms = None
         
         # Setup paths - menggunakan folder cookies dengan file JSON
         self.base_dir = Path(__file__).parent
         self.cookies_dir = self.base_dir / "cookies"
         self.cookies_dir.mkdir(exist_ok=True)
-        self.cookies_path = self.cookies_dir / "tiktok_cookies.json"
+        if account == "default":
+            self.cookies_path = self.cookies_dir / "tiktok_cookies.json"
+        else:
+            self.cookies_path = self.cookies_dir / f"tiktok_{account}_cookies.json"
         self.screenshots_dir = self.base_dir / "screenshots"
         self.screenshots_dir.mkdir(exist_ok=True)
+        self.screenshots = ScreenshotManager(self.screenshots_dir, "tiktok", level=screenshot_level, log=self._log)
+        
+        # Profile Chrome persisten per akun (--user-data-dir)
+        self.profiles_dir = self.base_dir / "profiles"
+        self.profile_dir = self.profiles_dir / f"tiktok_{account}"
+        self.profile_marker_path = self.profile_dir / "sosmed_session.json"
+        
+        # Statistik selector yang berhasil, untuk mengurutkan ulang fallback
+        self.selector_stats = SelectorStats(self.base_dir / "selector_stats.json", "tiktok")
+        
+        # Kondisi siap bernama pengganti sleep tetap (dibuat ulang per driver)
+        self.readiness = None
+        self.readiness_timings = []
+        
+        # Tombol post upload terakhir sudah diklik: upload bisa saja sudah terkirim, jangan diulang otomatis
+        self.post_clicked = False
+        # Konfirmasi (indikator sukses/pindah halaman) terlihat setelah klik post
+        self.post_confirmed = False
         
         # TikTok URLs
         self.upload_url = "https://www.tiktok.com/tiktokstudio/upload?from=webapp"
@@ -100,6 +142,11 @@ class TikTokUploader:
                 ".upload-success"
             ]
         }
+        
+        # Kata kunci teks tombol (multi bahasa) untuk fallback pencarian berdasarkan teks
+        self.text_keywords = {
+            'post_button': ['post', 'posting', 'publish', 'terbitkan', 'share']
+        }
 
     def _log(self, message: str, level: str = "INFO"):
         """Enhanced logging dengan warna - versi sederhana"""
@@ -127,58 +174,8 @@ class TikTokUploader:
         print(f"{color}{icon} {message}{Style.RESET_ALL}")
 
     def _get_chromedriver_path(self):
-        """Get ChromeDriver path dengan fallback untuk Windows"""
-        try:
-            # Coba download ChromeDriver terbaru
-            self._log("Mendownload ChromeDriver terbaru...")
-            driver_path = ChromeDriverManager().install()
-            
-            # Validasi file exists dan executable
-            if os.path.exists(driver_path):
-                # Untuk Windows, pastikan file adalah .exe
-                if platform.system() == "Windows" and not driver_path.endswith('.exe'):
-                    # Cari file .exe di direktori yang sama
-                    driver_dir = os.path.dirname(driver_path)
-                    for file in os.listdir(driver_dir):
-                        if file.endswith('.exe') and 'chromedriver' in file.lower():
-                            driver_path = os.path.join(driver_dir, file)
-                            break
-                
-                self._log(f"ChromeDriver ditemukan: {driver_path}", "SUCCESS")
-                return driver_path
-            else:
-                raise FileNotFoundError("ChromeDriver tidak ditemukan setelah download")
-                
-        except Exception as e:
-            self._log(f"Error downloading ChromeDriver: {e}", "WARNING")
-            
-            # Fallback: cari ChromeDriver di PATH
-            self._log("Mencari ChromeDriver di sistem PATH...")
-            
-            chrome_names = ['chromedriver', 'chromedriver.exe']
-            for name in chrome_names:
-                # Cek di PATH
-                import shutil
-                path = shutil.which(name)
-                if path:
-                    self._log(f"ChromeDriver ditemukan di PATH: {path}", "SUCCESS")
-                    return path
-            
-            # Fallback terakhir: cek lokasi umum Windows
-            if platform.system() == "Windows":
-                common_paths = [
-                    r"C:\Program Files\Google\Chrome\Application\chromedriver.exe",
-                    r"C:\Program Files (x86)\Google\Chrome\Application\chromedriver.exe",
-                    r"C:\chromedriver\chromedriver.exe",
-                    r"C:\tools\chromedriver.exe"
-                ]
-                
-                for path in common_paths:
-                    if os.path.exists(path):
-                        self._log(f"ChromeDriver ditemukan: {path}", "SUCCESS")
-                        return path
-            
-            raise FileNotFoundError("ChromeDriver tidak ditemukan. Silakan install Chrome dan ChromeDriver.")
+        """Get ChromeDriver path dari cache lokal, download hanya jika belum ada"""
+        return ChromeDriverCache(debug=self.debug).resolve()
 
     def _setup_driver(self):
         """Setup Chrome WebDriver dengan konfigurasi optimal dan suppress logs"""
@@ -250,6 +247,13 @@ class TikTokUploader:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Profile persisten: cookies dan local storage bertahan antar run
+        if self.use_profile:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={self.profile_dir.resolve()}")
+            chrome_options.add_argument("--profile-directory=Default")
+            self._log(f"Memakai profile Chrome: {self.profile_dir.name}", "DEBUG")
+        
         if self.headless:
             self._log("Mode headless diaktifkan")
         
@@ -269,6 +273,7 @@ class TikTokUploader:
             os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
             
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self._owns_driver = True
             
             # Anti-detection script
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -291,30 +296,162 @@ class TikTokUploader:
             
             raise
 
-    def _find_element_by_selectors(self, selectors: list, timeout: int = 10, visible: bool = True) -> Optional[Any]:
-        """Mencari elemen menggunakan multiple selectors - versi sederhana"""
-        for i, selector in enumerate(selectors):
-            try:
-                if visible:
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                else:
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                
-                # Log sederhana tanpa menampilkan selector panjang
-                if i == 0:
-                    self._log("Elemen ditemukan", "SUCCESS")
-                else:
-                    self._log(f"Elemen ditemukan (alternatif {i+1})", "SUCCESS")
-                return element
-                
-            except TimeoutException:
-                continue
-                
-        return None
+    def launch_session(self) -> webdriver.Chrome:
+        """Buka browser, muat cookies dan buka TikTok Studio (dipakai BrowserPool untuk pre-launch)"""
+        self._start_session()
+        self.driver.get(self.upload_url)
+
+        # Driver diserahkan ke pemanggil, uploader ini tidak lagi menutupnya
+        self._owns_driver = False
+        return self.driver
+
+    def _profile_session_ready(self) -> bool:
+        """Cek apakah profile sudah pernah login (tidak perlu import cookies lagi)"""
+        return self.use_profile and self.profile_marker_path.exists()
+
+    def _mark_profile_session(self):
+        """Tandai profile sudah login setelah halaman target terbuka tanpa redirect login"""
+        if not self.use_profile or self.profile_marker_path.exists():
+            return
+        try:
+            with open(self.profile_marker_path, 'w', encoding='utf-8') as f:
+                json.dump({"account": self.account, "timestamp": int(time.time())}, f)
+        except Exception as e:
+            self._log(f"Gagal menandai profile: {e}", "DEBUG")
+
+    def _start_session(self) -> bool:
+        """Setup browser dan siapkan login. Return True jika session/cookies tersedia"""
+        self._setup_driver()
+
+        if self._profile_session_ready():
+            # Session sudah tersimpan di profile, langsung ke halaman target
+            self._log("Memakai session dari profile Chrome", "SUCCESS")
+            return True
+
+        # Cookies JSON sebagai import awal (atau mekanisme login tanpa profile)
+        return self.load_cookies()
+
+    def _ensure_logged_in(self, target_url: str, cookies_loaded: bool):
+        """Pastikan halaman target tidak redirect ke login, fallback ke cookies lalu login manual"""
+        if self.check_login_required():
+            if self._profile_session_ready():
+                self._log("Session profile sudah tidak valid, mengimport cookies...", "WARNING")
+                if self.load_cookies():
+                    self.driver.get(target_url)
+                    self._wait_ready('navigation_settled', timeout=3)
+            elif cookies_loaded:
+                self._log("Cookies dimuat tapi masih perlu login, refresh halaman...", "WARNING")
+                self.driver.refresh()
+                self._wait_ready('navigation_settled', timeout=3)
+            
+            if self.check_login_required():
+                self.wait_for_login()
+                # Navigate ulang ke halaman target setelah login
+                self.driver.get(target_url)
+                self._wait_ready('navigation_settled', timeout=3)
+
+        # Profile hanya ditandai login jika halaman target benar-benar terbuka tanpa redirect ke login
+        if self.check_login_required():
+            self._log("Masih diarahkan ke halaman login, profile tidak ditandai sebagai login", "WARNING")
+            return
+        self._mark_profile_session()
+
+    def export_cookies(self) -> bool:
+        """Export cookies dari profile Chrome ke file JSON"""
+        if not self.use_profile or not self.profile_dir.exists():
+            self._log("Profile Chrome belum ada untuk akun ini", "WARNING")
+            return False
+
+        try:
+            self._setup_driver()
+            self.driver.get("https://www.tiktok.com")
+            self._wait_ready('navigation_settled', timeout=2)
+            self.save_cookies()
+            return True
+        except Exception as e:
+            self._log(f"Gagal export cookies: {str(e)}", "ERROR")
+            return False
+        finally:
+            self._release_driver()
+
+    def clear_profile(self):
+        """Hapus profile Chrome akun ini"""
+        import shutil
+        try:
+            if self.profile_dir.exists():
+                shutil.rmtree(self.profile_dir)
+                self._log("Profile Chrome berhasil dihapus", "SUCCESS")
+            else:
+                self._log("Tidak ada profile Chrome untuk dihapus", "WARNING")
+        except Exception as e:
+            self._log(f"Gagal menghapus profile: {str(e)}", "ERROR")
+
+    def _release_driver(self):
+        """Tutup browser hanya jika dibuat sendiri oleh uploader ini"""
+        if not self.driver or not self._owns_driver:
+            return
+
+        self._log("Menutup browser...")
+        try:
+            self.driver.quit()
+        except:
+            pass
+        self.driver = None
+        self.wait = None
+
+    def _locate(self, selectors: list, timeout: float = 10, mode: str = "clickable",
+                key: Optional[str] = None) -> Tuple[Optional[Any], int]:
+        """
+        Cari elemen dari semua kandidat selector sekaligus
+        
+        Jika key diberikan, kandidat diurutkan berdasarkan statistik keberhasilan sebelumnya
+        dan hasilnya dicatat ke selector_stats.json
+        
+        Returns:
+            Tuple (elemen, index di list selectors asli) atau (None, -1)
+        """
+        ranked = self.selector_stats.rank(key, selectors) if key else selectors
+        
+        start_time = time.time()
+        element, index = ElementLocator(self.driver).find_first(ranked, timeout=timeout, mode=mode, by_type="CSS")
+        elapsed_ms = (time.time() - start_time) * 1000
+        
+        if key:
+            self.selector_stats.record(key, ranked[index] if element is not None else None, elapsed_ms)
+        
+        if element is None:
+            return None, -1
+        return element, selectors.index(ranked[index])
+
+    def _readiness(self) -> PageReadiness:
+        """PageReadiness untuk driver aktif, kondisi platform didaftarkan sekali per driver"""
+        if self.readiness is None or self.readiness.driver is not self.driver:
+            self.readiness = PageReadiness(self.driver, log=self._log)
+            self.readiness.timings = self.readiness_timings
+            self.readiness.register('file_input_ready', timeout=2, attached=["input[type='file']"])
+            self.readiness.register('caption_editor_ready', timeout=3, present=self.selectors['caption_input'])
+            self.readiness.register('post_submitted', timeout=5, present=self.selectors['success_indicators'],
+                                    url_not_contains=["/upload"])
+        return self.readiness
+
+    def _wait_ready(self, name: str, timeout: Optional[float] = None, element: Any = None, **overrides) -> bool:
+        """Tunggu kondisi readiness bernama, timeout tidak lebih lama dari sleep yang digantikan"""
+        return self._readiness().wait(name, timeout=timeout, element=element, **overrides)
+
+    def _find_element_by_selectors(self, selectors: list, timeout: int = 10, visible: bool = True,
+                                   key: Optional[str] = None) -> Optional[Any]:
+        """Mencari elemen menggunakan multiple selectors - semua kandidat dicek bersamaan"""
+        element, index = self._locate(selectors, timeout=timeout, mode="clickable" if visible else "present", key=key)
+        
+        if element is None:
+            return None
+        
+        # Log sederhana tanpa menampilkan selector panjang
+        if index == 0:
+            self._log("Elemen ditemukan", "SUCCESS")
+        else:
+            self._log(f"Elemen ditemukan (alternatif {index+1})", "SUCCESS")
+        return element
 
     def load_cookies(self) -> bool:
         """Load cookies dari file JSON"""
@@ -336,44 +473,55 @@ class TikTokUploader:
                 self._log("File cookies kosong", "WARNING")
                 return False
             
-            # Navigate ke TikTok dulu sebelum set cookies
-            self.driver.get("https://www.tiktok.com")
-            time.sleep(2)
+            start_time = time.time()
             
-            # Add cookies
-            cookies_added = 0
-            for cookie in cookies:
-                try:
-                    # Pastikan cookie memiliki format yang benar
-                    if 'name' in cookie and 'value' in cookie:
-                        # Hapus keys yang tidak diperlukan untuk Selenium
-                        clean_cookie = {
-                            'name': cookie['name'],
-                            'value': cookie['value'],
-                            'domain': cookie.get('domain', '.tiktok.com'),
-                            'path': cookie.get('path', '/'),
-                        }
+            # Bulk inject via CDP di tab kosong, tanpa load homepage dulu
+            cookies_added = set_cookies_cdp(self.driver, cookies, ".tiktok.com")
+            method = "CDP"
+            
+            if cookies_added is None:
+                # CDP tidak tersedia, fallback ke add_cookie per cookie
+                method = "add_cookie"
+                
+                # Navigate ke TikTok dulu sebelum set cookies
+                self.driver.get("https://www.tiktok.com")
+                self._wait_ready('navigation_settled', timeout=2)
+            
+                # Add cookies
+                cookies_added = 0
+                for cookie in cookies:
+                    try:
+                        # Pastikan cookie memiliki format yang benar
+                        if 'name' in cookie and 'value' in cookie:
+                            # Hapus keys yang tidak diperlukan untuk Selenium
+                            clean_cookie = {
+                                'name': cookie['name'],
+                                'value': cookie['value'],
+                                'domain': cookie.get('domain', '.tiktok.com'),
+                                'path': cookie.get('path', '/'),
+                            }
                         
-                        # Tambahkan expiry jika ada
-                        if 'expiry' in cookie:
-                            clean_cookie['expiry'] = int(cookie['expiry'])
-                        elif 'expires' in cookie:
-                            clean_cookie['expiry'] = int(cookie['expires'])
+                            # Tambahkan expiry jika ada
+                            if 'expiry' in cookie:
+                                clean_cookie['expiry'] = int(cookie['expiry'])
+                            elif 'expires' in cookie:
+                                clean_cookie['expiry'] = int(cookie['expires'])
                         
-                        # Tambahkan secure dan httpOnly jika ada
-                        if 'secure' in cookie:
-                            clean_cookie['secure'] = cookie['secure']
-                        if 'httpOnly' in cookie:
-                            clean_cookie['httpOnly'] = cookie['httpOnly']
+                            # Tambahkan secure dan httpOnly jika ada
+                            if 'secure' in cookie:
+                                clean_cookie['secure'] = cookie['secure']
+                            if 'httpOnly' in cookie:
+                                clean_cookie['httpOnly'] = cookie['httpOnly']
                         
-                        self.driver.add_cookie(clean_cookie)
-                        cookies_added += 1
+                            self.driver.add_cookie(clean_cookie)
+                            cookies_added += 1
                         
-                except Exception as e:
-                    if self.debug:
-                        self._log(f"Gagal menambahkan cookie {cookie.get('name', 'unknown')}: {e}", "DEBUG")
+                    except Exception as e:
+                        if self.debug:
+                            self._log(f"Gagal menambahkan cookie {cookie.get('name', 'unknown')}: {e}", "DEBUG")
             
-            self._log(f"Cookies dimuat: {cookies_added}/{len(cookies)}", "SUCCESS")
+            self.cookie_injection_ms = (time.time() - start_time) * 1000
+            self._log(f"Cookies dimuat: {cookies_added}/{len(cookies)} via {method} ({self.cookie_injection_ms:.0f} ms)", "SUCCESS")
             return cookies_added > 0
             
         except Exception as e:
@@ -420,18 +568,13 @@ class TikTokUploader:
         self._log("Silakan login secara manual di browser...", "WARNING")
         self._log(f"Menunggu login selesai (timeout {timeout} detik)...", "INFO")
         
-        start_time = time.time()
+        # Cek apakah sudah tidak di halaman login (observer, tanpa polling current_url)
+        result = ElementLocator(self.driver).wait_for([], timeout=timeout, url_not_contains=["login", "passport"])
         
-        while time.time() - start_time < timeout:
-            current_url = self.driver.current_url
-            
-            # Cek apakah sudah tidak di halaman login
-            if not ("login" in current_url or "passport" in current_url):
-                self._log("Login berhasil!", "SUCCESS")
-                self.save_cookies()  # Simpan cookies setelah login
-                return True
-            
-            time.sleep(2)
+        if result:
+            self._log("Login berhasil!", "SUCCESS")
+            self.save_cookies()  # Simpan cookies setelah login
+            return True
         
         raise TimeoutException("Timeout menunggu login")
 
@@ -444,13 +587,13 @@ class TikTokUploader:
         self._log(f"Mengupload: {os.path.basename(video_path)} ({file_size:.2f}MB)")
         
         # Coba klik tombol upload terlebih dahulu (jika ada)
-        upload_button = self._find_element_by_selectors(self.selectors['upload_button'], timeout=5)
+        upload_button = self._find_element_by_selectors(self.selectors['upload_button'], timeout=5, key='upload_button')
         if upload_button:
             try:
                 # Coba klik tombol upload
                 self.driver.execute_script("arguments[0].click();", upload_button)
                 self._log("Tombol upload diklik", "SUCCESS")
-                time.sleep(2)
+                self._wait_ready('file_input_ready')
             except Exception as e:
                 self._log(f"Gagal klik tombol upload: {e}", "WARNING")
         
@@ -485,21 +628,15 @@ class TikTokUploader:
         """Tunggu video diproses menggunakan selector baru"""
         self._log("Menunggu video diproses...")
         
-        start_time = time.time()
+        # Observer di dalam halaman, langsung bereaksi saat indikator selesai muncul
+        result = ElementLocator(self.driver).wait_for(
+            self.selectors['upload_success_status'], timeout=timeout, by_type="CSS"
+        )
         
-        while time.time() - start_time < timeout:
-            # Cek indikator pemrosesan selesai menggunakan selector baru
-            for selector in self.selectors['upload_success_status']:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if element.is_displayed():
-                        self._log("Video berhasil diproses", "SUCCESS")
-                        time.sleep(3)  # Tunggu UI siap
-                        return True
-                except:
-                    continue
-            
-            time.sleep(2)
+        if result:
+            self._log("Video berhasil diproses", "SUCCESS")
+            self._wait_ready('caption_editor_ready')
+            return True
         
         self._log("Timeout menunggu pemrosesan, melanjutkan...", "WARNING")
         return False
@@ -513,92 +650,71 @@ class TikTokUploader:
         self._log("Menambahkan caption...")
         
         # Cari input caption menggunakan selector sederhana
-        caption_input = self._find_element_by_selectors(self.selectors['caption_input'])
+        caption_input = self._find_element_by_selectors(self.selectors['caption_input'], key='caption_input')
         
         if not caption_input:
             self._log("Input caption tidak ditemukan", "WARNING")
             return
         
         try:
-            # Focus dan clear existing content
-            caption_input.click()
-            time.sleep(0.5)
-            
-            # Select all dan hapus
-            caption_input.send_keys(Keys.CONTROL + "a")
-            caption_input.send_keys(Keys.BACKSPACE)
-            time.sleep(0.5)
+            # Ganti caption bawaan (nama file) dalam satu operasi, tanpa memicu autocomplete per '#'
+            method = TextInserter(self.driver, log=self._log).insert(caption_input, caption)
             
-            # Type caption baru
-            caption_input.send_keys(caption)
+            if not method:
+                self._log("Caption tidak terverifikasi setelah semua metode input", "WARNING")
+                return
             
             preview = caption[:50] + "..." if len(caption) > 50 else caption
-            self._log(f"Caption ditambahkan: {preview}", "SUCCESS")
+            self._log(f"Caption ditambahkan via {method}: {preview}", "SUCCESS")
             
         except Exception as e:
             self._log(f"Gagal menambahkan caption: {str(e)}", "WARNING")
 
     def post_video(self):
-        """Post video menggunakan selector baru"""
+        """
+        Post video menggunakan selector baru
+
+        Returns:
+            True jika tombol post diklik; apakah post terkonfirmasi dicatat di self.post_confirmed
+        """
         self._log("Mencari tombol post...")
         
-        # Coba selector utama terlebih dahulu (yang baru diberikan)
-        primary_selector = self.selectors['post_button'][0]
-        
-        try:
-            self._log("Mencoba tombol post utama...")
-            
-            # Tunggu elemen muncul
-            post_button = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, primary_selector))
-            )
-            
-            # Klik menggunakan JavaScript untuk memastikan
-            self.driver.execute_script("arguments[0].click();", post_button)
-            
-            self._log("Tombol post berhasil diklik!", "SUCCESS")
-            time.sleep(5)
-            
-            # Setelah klik post, anggap berhasil dan tutup browser
-            self._log("Video berhasil dipost!", "SUCCESS")
-            return True
-            
-        except TimeoutException:
-            self._log("Selector utama tidak ditemukan, mencoba alternatif...", "WARNING")
-        
-        # Coba fallback selectors
-        self._log("Mencoba tombol post alternatif...")
+        # Semua selector post (utama + alternatif) dicek bersamaan dengan satu timeout
+        post_button, index = self._locate(self.selectors['post_button'], timeout=10, key='post_button')
         
-        for i, selector in enumerate(self.selectors['post_button'][1:], 1):
+        if post_button:
             try:
-                post_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                )
+                # Klik menggunakan JavaScript untuk memastikan
+                self.driver.execute_script("arguments[0].click();", post_button)
+                self.post_clicked = True
                 
-                # Cek apakah tombol enabled
-                if post_button.is_enabled():
-                    post_button.click()
-                    self._log(f"Tombol post diklik (alternatif {i})", "SUCCESS")
-                    time.sleep(5)
-                    return True
-                    
-            except TimeoutException:
-                continue
+                if index == 0:
+                    self._log("Tombol post berhasil diklik!", "SUCCESS")
+                else:
+                    self._log(f"Tombol post diklik (alternatif {index})", "SUCCESS")
+                self.post_confirmed = self._wait_ready('post_submitted', timeout=self.POST_CONFIRM_TIMEOUT)
+                return True
+            
+            except WebDriverException as e:
+                self._log(f"Gagal klik tombol post: {e}", "WARNING")
+        else:
+            self._log("Selector tombol post tidak ditemukan, mencoba berdasarkan teks...", "WARNING")
         
         # Fallback terakhir: cari berdasarkan text
         self._log("Mencari tombol berdasarkan teks...")
         
         try:
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
+            # Teks, enabled dan visible dicek di dalam halaman dalam satu script
+            button, text = ElementLocator(self.driver).find_by_text(
+                self.text_keywords['post_button'], tag_selector="button"
+            )
             
-            for button in buttons:
-                text = button.text.lower()
-                if any(keyword in text for keyword in ['post', 'publish', 'share']):
-                    if button.is_enabled() and button.is_displayed():
-                        button.click()
-                        self._log(f"Tombol post ditemukan: '{button.text}'", "SUCCESS")
-                        time.sleep(5)
-                        return True
+            if button:
+                button.click()
+                self.post_clicked = True
+                self._log(f"Tombol post ditemukan: '{text}'", "SUCCESS")
+                self.post_confirmed = self._wait_ready('post_submitted', timeout=self.POST_CONFIRM_TIMEOUT)
+                return True
         
         except Exception as e:
             self._log(f"Error saat mencari tombol berdasarkan teks: {str(e)}", "ERROR")
@@ -610,17 +726,12 @@ class TikTokUploader:
         self._log("Memeriksa status upload...")
         
         try:
-            # Cek indikator sukses
-            for selector in self.selectors['success_indicators']:
-                try:
-                    element = WebDriverWait(self.driver, 3).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if element.is_displayed():
-                        self._log("Konfirmasi upload sukses!", "SUCCESS")
-                        return True
-                except TimeoutException:
-                    continue
+            # Cek indikator sukses (semua selector sekaligus)
+            element, _ = self._locate(self.selectors['success_indicators'], timeout=3, mode="visible",
+                                      key='success_indicators')
+            if element:
+                self._log("Konfirmasi upload sukses!", "SUCCESS")
+                return True
             
             # Cek URL redirect
             current_url = self.driver.current_url
@@ -635,18 +746,24 @@ class TikTokUploader:
             self._log(f"Error saat memeriksa status: {str(e)}", "WARNING")
             return False
 
-    def take_screenshot(self, filename: str = None):
-        """Ambil screenshot untuk debugging"""
+    def take_screenshot(self, filename: str = None, kind: str = "milestone"):
+        """
+        Ambil screenshot untuk debugging sesuai level kebijakan screenshot
+        
+        Args:
+            filename: Nama file
+            kind: 'error', 'milestone' atau 'verbose'
+        """
         if not filename:
             filename = f"tiktok_screenshot_{int(time.time())}.png"
         
-        screenshot_path = self.screenshots_dir / filename
-        
         try:
             if self.driver:
-                self.driver.save_screenshot(str(screenshot_path))
-                self._log(f"Screenshot disimpan: {screenshot_path.name}", "INFO")
-                return str(screenshot_path)
+                # Capture terkompresi, penulisan ke disk di background thread
+                screenshot_path = self.screenshots.capture(self.driver, filename, kind=kind)
+                if screenshot_path:
+                    self._log(f"Screenshot disimpan: {Path(screenshot_path).name}", "INFO")
+                return screenshot_path
             else:
                 self._log("Driver tidak tersedia untuk screenshot", "WARNING")
                 return None
@@ -654,6 +771,73 @@ class TikTokUploader:
             self._log(f"Gagal menyimpan screenshot: {str(e)}", "WARNING")
             return None
 
+    def _open_upload_page(self):
+        """Navigasi ke TikTok Studio, dialog 'tinggalkan halaman?' dari upload sebelumnya diterima"""
+        try:
+            # Kartu upload yang belum selesai/gagal memasang beforeunload
+            self.driver.execute_script("window.onbeforeunload = null;")
+        except WebDriverException:
+            pass
+        
+        try:
+            self.driver.get(self.upload_url)
+        except UnexpectedAlertPresentException:
+            try:
+                self.driver.switch_to.alert.accept()
+            except NoAlertPresentException:
+                pass
+            self.driver.get(self.upload_url)
+        self._wait_ready('navigation_settled', timeout=3)
+
+    def _publish(self, video_path: str, caption: str) -> Dict[str, Any]:
+        """Upload file, caption dan post di halaman upload yang sudah terbuka"""
+        # Upload file
+        self.upload_file(video_path)
+        
+        # Tunggu processing
+        self.wait_for_processing()
+        
+        # Tambahkan caption
+        self.add_caption(caption)
+        
+        # Post video, berhasil hanya jika indikator sukses/pindah halaman terlihat setelah klik
+        self.post_video()
+        
+        if self.post_confirmed:
+            self._log("Video berhasil diupload ke TikTok!", "SUCCESS")
+            return {
+                "success": True,
+                "message": "Upload berhasil",
+                "video_path": video_path,
+                "caption": caption
+            }
+        else:
+            self._log("Upload mungkin berhasil tapi tidak dapat dikonfirmasi", "WARNING")
+            return {
+                "success": False,
+                "message": "Upload mungkin berhasil tapi tidak dapat dikonfirmasi",
+                "video_path": video_path,
+                "caption": caption,
+                "unconfirmed": True,
+                "retryable": False
+            }
+
+    def _failed_result(self, error: Exception, video_path: str, caption: str) -> Dict[str, Any]:
+        error_msg = f"Upload gagal: {str(error)}"
+        self._log(error_msg, "ERROR")
+        
+        # Ambil screenshot untuk debugging
+        self.take_screenshot(f"error_{int(time.time())}.png", kind="error")
+        
+        return {
+            "success": False,
+            "message": error_msg,
+            "video_path": video_path,
+            "caption": caption,
+            # Gagal setelah klik post: video mungkin sudah terkirim, ulangi hanya secara manual
+            "retryable": not self.post_clicked
+        }
+
     def upload_video(self, video_path: str, caption: str = "#fyp #viral #trending") -> Dict[str, Any]:
         """
         Main method untuk upload video
@@ -665,80 +849,77 @@ class TikTokUploader:
         Returns:
             Dict dengan status upload
         """
+        # Screenshot upload ini dikelompokkan dalam satu run
+        self.screenshots.new_run()
+        self.post_clicked = False
+        self.post_confirmed = False
+        
         try:
-            # Setup driver
-            self._setup_driver()
-            
-            # Load cookies
-            cookies_loaded = self.load_cookies()
-            
+            if self.driver is None:
+                # Setup driver + cookies/profile
+                cookies_loaded = self._start_session()
+            else:
+                # Driver dari luar (pool) sudah memuat cookies saat diluncurkan
+                cookies_loaded = True
+
             # Navigate ke upload page
             self._log("Navigasi ke TikTok Studio...")
             self.driver.get(self.upload_url)
-            time.sleep(3)
+            self._wait_ready('navigation_settled', timeout=3)
             
             # Cek apakah perlu login
-            if self.check_login_required():
-                if cookies_loaded:
-                    self._log("Cookies dimuat tapi masih perlu login, refresh halaman...", "WARNING")
-                    self.driver.refresh()
-                    time.sleep(3)
-                
-                if self.check_login_required():
-                    self.wait_for_login()
-                    # Navigate ulang ke upload page setelah login
-                    self.driver.get(self.upload_url)
-                    time.sleep(3)
-            
-            # Upload file
-            self.upload_file(video_path)
-            
-            # Tunggu processing
-            self.wait_for_processing()
-            
-            # Tambahkan caption
-            self.add_caption(caption)
-            
-            # Post video
-            success = self.post_video()
-            
-            if success:
-                self._log("Video berhasil diupload ke TikTok!", "SUCCESS")
-                return {
-                    "success": True,
-                    "message": "Upload berhasil",
-                    "video_path": video_path,
-                    "caption": caption
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": "Upload mungkin berhasil tapi tidak dapat dikonfirmasi",
-                    "video_path": video_path,
-                    "caption": caption
-                }
+            self._ensure_logged_in(self.upload_url, cookies_loaded)
+            
+            return self._publish(video_path, caption)
                 
         except Exception as e:
-            error_msg = f"Upload gagal: {str(e)}"
-            self._log(error_msg, "ERROR")
-            
-            # Ambil screenshot untuk debugging
-            self.take_screenshot(f"error_{int(time.time())}.png")
-            
-            return {
-                "success": False,
-                "message": error_msg,
-                "video_path": video_path,
-                "caption": caption
-            }
+            return self._failed_result(e, video_path, caption)
         
         finally:
-            if self.driver:
-                self._log("Menutup browser...")
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+            self._release_driver()
+
+    def session(self) -> "TikTokSession":
+        """
+        Session multi-video: login sekali, lalu upload berturut-turut di Chrome yang sama
+
+        Contoh:
+            with uploader.session() as session:
+                session.upload("video1.mp4", "#fyp")
+                session.upload("video2.mp4", "#viral")
+        """
+        return TikTokSession(self)
+
+    def upload_many(self, videos: Iterable[Any], caption: str = "#fyp #viral #trending") -> List[Dict[str, Any]]:
+        """
+        Upload beberapa video dalam satu session browser
+
+        Args:
+            videos: Path video, tuple (path, caption) atau dict {"video": ..., "caption": ...}
+            caption: Caption untuk item yang tidak menyertakan caption sendiri
+
+        Returns:
+            List hasil per video (urutan sama dengan input); satu video gagal tidak menghentikan sisanya
+        """
+        items = []
+        for item in videos:
+            if isinstance(item, dict):
+                items.append((item.get("video") or item.get("video_path"), item.get("caption", caption)))
+            elif isinstance(item, (tuple, list)):
+                items.append((item[0], item[1] if len(item) > 1 else caption))
+            else:
+                items.append((item, caption))
+        
+        try:
+            with self.session() as session:
+                for video_path, item_caption in items:
+                    session.upload(video_path, item_caption)
+                return session.results
+        except Exception as e:
+            # Session gagal dibuka (browser/login): semua video dilaporkan gagal
+            self._log(f"Session TikTok gagal dibuka: {str(e)}", "ERROR")
+            return [dict(success=False, message=f"Upload gagal: {str(e)}", video_path=video_path,
+                         caption=item_caption, index=index)
+                    for index, (video_path, item_caption) in enumerate(items)]
 
     def check_cookies_status(self):
         """Cek status cookies"""
@@ -801,29 +982,131 @@ class TikTokUploader:
             return {"exists": True, "error": str(e)}
 
 
+class TikTokSession(UploadSession):
+    """Chrome yang sudah login ke TikTok Studio untuk beberapa upload berturut-turut"""
+
+    # Batas menunggu post sebelumnya yang belum terkonfirmasi sebelum meninggalkan halaman
+    SETTLE_TIMEOUT = 60
+
+    def __init__(self, uploader: TikTokUploader):
+        super().__init__(uploader)
+        self._page_fresh = False
+        self._post_unsettled = False
+
+    def _open_home(self) -> str:
+        self.uploader._log("Navigasi ke TikTok Studio...")
+        self.uploader._open_upload_page()
+        return self.uploader.upload_url
+
+    def _on_open(self):
+        self._page_fresh = True
+        self._post_unsettled = False
+
+    def _wait_post_settled(self):
+        """
+        Post sebelumnya sudah diklik tapi belum terkonfirmasi: tunggu dialog selesai/halaman berpindah
+        sebelum beforeunload dibuang, agar post yang masih terkirim tidak dibatalkan
+        """
+        uploader = self.uploader
+        uploader._log("Menunggu post sebelumnya selesai terkirim...", "INFO")
+        if not uploader._wait_ready('post_submitted', timeout=self.SETTLE_TIMEOUT):
+            uploader._log("Post sebelumnya belum terkonfirmasi, tetap melanjutkan ke upload berikutnya", "WARNING")
+
+    def upload(self, video_path: str, caption: str = "#fyp #viral #trending") -> Dict[str, Any]:
+        """
+        Upload satu video di session ini: kembali ke halaman upload, kirim file, caption lalu post
+
+        Returns:
+            Dict hasil upload ditambah index dan duration_seconds; error tidak dilempar
+        """
+        uploader = self.uploader
+        uploader.screenshots.new_run()
+        uploader.post_clicked = False
+        uploader.post_confirmed = False
+        index = len(self.results)
+        started = time.time()
+        uploader._log(f"[{index + 1}] {os.path.basename(str(video_path))}")
+
+        try:
+            if not self._driver_alive():
+                self._recover()
+            elif not self._page_fresh:
+                if self._post_unsettled:
+                    self._wait_post_settled()
+                # Kartu upload baru, login tidak diulang kecuali session ternyata habis
+                uploader._open_upload_page()
+                if uploader.check_login_required():
+                    uploader._ensure_logged_in(uploader.upload_url, True)
+            self._page_fresh = False
+            self._post_unsettled = False
+
+            result = uploader._publish(video_path, caption)
+        except Exception as e:
+            self._page_fresh = False
+            result = uploader._failed_result(e, video_path, caption)
+
+        self._post_unsettled = uploader.post_clicked and not uploader.post_confirmed
+        result["index"] = index
+        result["duration_seconds"] = round(time.time() - started, 2)
+        self.results.append(result)
+        return result
+
+
 def main():
     """Main function untuk CLI"""
     parser = argparse.ArgumentParser(description="TikTok Video Uploader")
     parser.add_argument("--video", "-v", help="Path ke file video")
+    parser.add_argument("--videos", nargs="+", metavar="VIDEO",
+                        help="Upload beberapa video dalam satu session browser (caption sama)")
     parser.add_argument("--caption", "-c", default="#fyp #viral #trending", help="Caption untuk video")
     parser.add_argument("--headless", action="store_true", help="Jalankan dalam mode headless")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--clear-cookies", action="store_true", help="Hapus cookies")
     parser.add_argument("--check-cookies", action="store_true", help="Cek status cookies")
+    parser.add_argument("--account", default="default", help="Nama akun (cookies/profile terpisah per akun)")
+    parser.add_argument("--profile", action="store_true", help="Pakai profile Chrome persisten per akun")
+    parser.add_argument("--export-cookies", action="store_true", help="Export cookies dari profile Chrome ke JSON")
+    parser.add_argument("--clear-profile", action="store_true", help="Hapus profile Chrome akun")
+    parser.add_argument("--screenshots", choices=list(LEVELS), help="Level screenshot (default: error)")
     
     args = parser.parse_args()
     
-    uploader = TikTokUploader(headless=args.headless, debug=args.debug)
+    uploader = TikTokUploader(headless=args.headless, debug=args.debug,
+                              account=args.account, use_profile=args.profile or args.export_cookies,
+                              screenshot_level=args.screenshots)
     
     # Handle different actions
     if args.clear_cookies:
         uploader.clear_cookies()
         return
     
+    if args.clear_profile:
+        uploader.clear_profile()
+        return
+    
+    if args.export_cookies:
+        if not uploader.export_cookies():
+            sys.exit(1)
+        return
+    
     if args.check_cookies:
         uploader.check_cookies_status()
         return
     
+    if args.videos:
+        results = uploader.upload_many(args.videos, args.caption)
+        
+        failed = [result for result in results if not result["success"]]
+        for result in results:
+            status = f"{Fore.GREEN}✅" if result["success"] else f"{Fore.RED}❌"
+            duration = result.get("duration_seconds")
+            timing = f" ({duration:.1f}s)" if duration is not None else ""
+            print(f"{status} {os.path.basename(str(result['video_path']))}{timing}: {result['message']}")
+        print(f"{Fore.CYAN}📊 {len(results) - len(failed)}/{len(results)} video berhasil diupload")
+        if failed:
+            sys.exit(1)
+        return
+    
     if args.video:
         if not os.path.exists(args.video):
             print(f"{Fore.RED}❌ File video tidak ditemukan: {args.video}")
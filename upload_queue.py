@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Upload Queue - antrian job upload yang persisten (SQLite mode WAL)
+Job (video, platform, akun, metadata) diklaim worker dengan lease berbatas waktu, sehingga beberapa
+proses bisa menguras antrian bersamaan dan job milik worker yang mati otomatis kembali ke antrian
+"""
+
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+try:
+    import psutil
+except ImportError:  # psutil opsional, fallback ke os.kill di POSIX
+    psutil = None
+
+# Status job
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    platform TEXT NOT NULL,
+    account TEXT NOT NULL DEFAULT 'default',
+    video_path TEXT,
+    metadata TEXT NOT NULL DEFAULT '{}',
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    lease_owner TEXT,
+    lease_expires REAL,
+    not_before REAL NOT NULL DEFAULT 0,
+    result TEXT,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (state, not_before, id);
+"""
+
+
+def _pid_alive(pid: int) -> Optional[bool]:
+    """True/False jika bisa dipastikan, None jika tidak bisa dicek di sistem ini"""
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+    if os.name != "posix":
+        # os.kill(pid, 0) di Windows justru menghentikan proses
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def make_worker_id() -> str:
+    """ID worker unik: host:pid:thread"""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class UploadJobQueue:
+    def __init__(self, db_path: Path, lease_seconds: float = 1800):
+        """
+        Initialize Upload Job Queue
+
+        Args:
+            db_path: Lokasi database SQLite (dipakai bersama antar proses)
+            lease_seconds: Lama lease default; worker memperpanjang lewat heartbeat selama job berjalan
+        """
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Satu koneksi per thread, sqlite3.Connection tidak boleh dipakai lintas thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        # IMMEDIATE: ambil write lock di awal agar dua worker tidak mengklaim job yang sama
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job["metadata"] = json.loads(job["metadata"] or "{}")
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def enqueue(self, platform: str, video_path: Optional[str] = None, account: str = "default",
+                max_attempts: int = 3, not_before: float = 0, **metadata) -> int:
+        """
+        Tambahkan job ke antrian
+
+        Args:
+            platform: 'tiktok', 'facebook-status', 'facebook-reels' atau 'youtube-shorts'
+            video_path: File video/media
+            account: Nama akun
+            max_attempts: Batas percobaan sebelum job ditandai gagal
+            not_before: Jangan dikerjakan sebelum timestamp ini
+            **metadata: caption, description, title, privacy, status_text, ...
+
+        Returns:
+            ID job
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (platform, account, video_path, metadata, max_attempts, not_before, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (platform, account, video_path, json.dumps(metadata, ensure_ascii=False), max_attempts,
+                 not_before, now, now)
+            )
+            return cursor.lastrowid
+
+    def claim(self, worker_id: str, platforms: Optional[List[str]] = None,
+              lease_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Klaim job berikutnya yang siap (termasuk job yang lease-nya sudah habis)
+
+        Returns:
+            Dict job atau None jika antrian kosong
+        """
+        now = time.time()
+        lease = lease_seconds or self.lease_seconds
+        query = ("SELECT * FROM jobs WHERE ((state = ? AND not_before <= ?) OR (state = ? AND lease_expires < ?))")
+        params: List[Any] = [QUEUED, now, RUNNING, now]
+        if platforms:
+            query += f" AND platform IN ({','.join('?' * len(platforms))})"
+            params.extend(platforms)
+        query += " ORDER BY not_before, id LIMIT 1"
+
+        with self._transaction() as conn:
+            while True:
+                row = conn.execute(query, params).fetchone()
+                if row is None:
+                    return None
+
+                if row["attempts"] >= row["max_attempts"]:
+                    # Lease habis pada percobaan terakhir: jangan diulang tanpa batas
+                    conn.execute(
+                        "UPDATE jobs SET state = ?, lease_owner = NULL, lease_expires = NULL, "
+                        "last_error = COALESCE(last_error, 'Lease habis'), updated_at = ? WHERE id = ?",
+                        (FAILED, now, row["id"])
+                    )
+                    continue
+
+                conn.execute(
+                    "UPDATE jobs SET state = ?, attempts = attempts + 1, lease_owner = ?, lease_expires = ?, "
+                    "updated_at = ? WHERE id = ?",
+                    (RUNNING, worker_id, now + lease, now, row["id"])
+                )
+                job = self._row_to_job(row)
+                job.update(state=RUNNING, attempts=row["attempts"] + 1, lease_owner=worker_id,
+                           lease_expires=now + lease)
+                return job
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: Optional[float] = None) -> bool:
+        """Perpanjang lease; False jika job sudah bukan milik worker ini"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? WHERE id = ? AND state = ? AND lease_owner = ?",
+                (now + (lease_seconds or self.lease_seconds), now, job_id, RUNNING, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, result: Dict[str, Any]) -> bool:
+        """Tandai job selesai dan simpan result"""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET state = ?, result = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND lease_owner = ?",
+                (DONE, json.dumps(result, ensure_ascii=False, default=str), time.time(), job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker_id: str, error: str, result: Optional[Dict[str, Any]] = None,
+             retry_delay: float = 60, not_before: Optional[float] = None, retryable: bool = True) -> str:
+        """
+        Catat kegagalan: kembali ke antrian (dengan jeda) selama percobaan masih tersisa
+
+        Args:
+            retry_delay: Jeda sebelum dicoba lagi (dikali 2 setiap percobaan)
+            not_before: Tunda sampai timestamp ini (mis. reset quota). Penundaan tidak dihitung
+                        sebagai percobaan
+            retryable: False jika mengulang bisa menggandakan post (mis. gagal setelah tombol post
+                       diklik), job langsung ditandai gagal
+
+        Returns:
+            Status baru job ('queued' atau 'failed')
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND lease_owner = ?", (job_id, worker_id)
+            ).fetchone()
+            if row is None:
+                return FAILED
+
+            attempts = row["attempts"]
+            if not_before is None:
+                not_before = now + retry_delay * 2 ** max(attempts - 1, 0)
+            else:
+                attempts -= 1
+            state = QUEUED if retryable and attempts < row["max_attempts"] else FAILED
+
+            conn.execute(
+                "UPDATE jobs SET state = ?, attempts = ?, last_error = ?, result = ?, not_before = ?, "
+                "lease_owner = NULL, lease_expires = NULL, updated_at = ? WHERE id = ?",
+                (state, attempts, error, json.dumps(result, ensure_ascii=False, default=str) if result else None,
+                 not_before if state == QUEUED else 0, now, job_id)
+            )
+            return state
+
+    def requeue_dead_workers(self) -> int:
+        """
+        Kembalikan job 'running' milik worker di host ini yang prosesnya sudah mati (dipanggil saat start)
+        Job milik host lain menunggu lease-nya habis
+
+        Returns:
+            Jumlah job yang dikembalikan ke antrian
+        """
+        hostname = socket.gethostname()
+        now = time.time()
+        requeued = 0
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, lease_owner, attempts, max_attempts FROM jobs WHERE state = ?", (RUNNING,)
+            ).fetchall()
+            for row in rows:
+                host, _, rest = (row["lease_owner"] or "").partition(":")
+                pid = rest.split(":")[0]
+                if host != hostname or not pid.isdigit() or int(pid) == os.getpid():
+                    continue
+                if _pid_alive(int(pid)) is not False:
+                    continue
+                state = QUEUED if row["attempts"] < row["max_attempts"] else FAILED
+                conn.execute(
+                    "UPDATE jobs SET state = ?, lease_owner = NULL, lease_expires = NULL, "
+                    "last_error = 'Worker berhenti saat job berjalan', updated_at = ? WHERE id = ?",
+                    (state, now, row["id"])
+                )
+                requeued += state == QUEUED
+        return requeued
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, state: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Job terbaru (opsional per status)"""
+        if state:
+            rows = self._connect().execute(
+                "SELECT * FROM jobs WHERE state = ? ORDER BY id DESC LIMIT ?", (state, limit)
+            ).fetchall()
+        else:
+            rows = self._connect().execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """Jumlah job per status"""
+        rows = self._connect().execute("SELECT state, COUNT(*) AS count FROM jobs GROUP BY state").fetchall()
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        counts.update({row["state"]: row["count"] for row in rows})
+        return counts
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
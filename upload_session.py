@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Upload Session - dasar session multi-upload di satu Chrome yang sudah login
+Dipakai TikTokSession dan FacebookSession: buka browser + login sekali, pulihkan browser yang mati,
+lalu tutup saat session selesai
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any
+
+from selenium.common.exceptions import WebDriverException
+
+
+class UploadSession(ABC):
+    """Chrome yang sudah login untuk beberapa upload berturut-turut"""
+
+    def __init__(self, uploader):
+        self.uploader = uploader
+        self.results: List[Dict[str, Any]] = []
+
+    @abstractmethod
+    def _open_home(self) -> str:
+        """Navigasi ke halaman awal platform, return URL untuk pengecekan login"""
+
+    def _on_open(self):
+        """Dipanggil setelah browser terbuka dan login di halaman awal"""
+
+    def open(self):
+        """Siapkan browser, cookies/profile dan login (sekali untuk seluruh session)"""
+        uploader = self.uploader
+        if uploader.driver is None:
+            cookies_loaded = uploader._start_session()
+        else:
+            # Driver dari luar (pool) sudah memuat cookies saat diluncurkan
+            cookies_loaded = True
+
+        url = self._open_home()
+        uploader._ensure_logged_in(url, cookies_loaded)
+        self._on_open()
+
+    def _driver_alive(self) -> bool:
+        driver = self.uploader.driver
+        if driver is None:
+            return False
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _recover(self):
+        """Browser mati di tengah session: buka ulang (login dari profile/cookies)"""
+        uploader = self.uploader
+        uploader._log("Browser tidak merespons, membuka session baru...", "WARNING")
+        uploader._release_driver()
+        uploader.driver = None
+        uploader.wait = None
+        self.open()
+
+    def close(self):
+        """Tutup browser (driver dari luar/pool tidak ditutup)"""
+        self.uploader._release_driver()
+
+    def __enter__(self):
+        try:
+            self.open()
+        except BaseException:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
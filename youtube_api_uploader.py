@@ -9,43 +9,96 @@ import sys
 import json
 import time
 import mimetypes
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Iterator, Callable
 from datetime import datetime
+from urllib.parse import urlparse
 
 import google.auth
-from google.auth.transport.requests import Request
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
 from colorama import init, Fore, Style
 import argparse
 
+from youtube_token_manager import TokenManager
+from youtube_quota import QuotaLedger
+from youtube_status import ProcessingStatusPoller
+from youtube_resumable import (
+    UploadSessionStore, ChunkTuner, ResizableMediaFileUpload, StreamingMediaUpload, quick_file_hash,
+    align_chunk_size
+)
+
 # Initialize colorama
 init(autoreset=True)
 
 class YouTubeAPIUploader:
-    def __init__(self, debug: bool = False):
+    UPLOAD_SCOPE = 'https://www.googleapis.com/auth/youtube.upload'
+    # videos.list untuk status processing
+    READONLY_SCOPE = 'https://www.googleapis.com/auth/youtube.readonly'
+
+    def __init__(self, debug: bool = False, account: str = "default", chunk_size_mb: float = 8,
+                 adaptive_chunks: bool = True, streaming: bool = True, daily_quota: Optional[int] = None):
         """
         Initialize YouTube API Uploader
         
         Args:
             debug: Enable debug logging
+            account: Nama akun, menentukan file token dan session upload yang dipakai
+            chunk_size_mb: Ukuran chunk resumable upload (dibulatkan ke kelipatan 256 KiB).
+                           Dengan adaptive_chunks ini hanya ukuran awal untuk host yang belum dikenal
+            adaptive_chunks: Sesuaikan ukuran chunk dengan throughput/RTT yang terukur
+            streaming: Kirim chunk dari reader ber-buffer tetap (memori konstan berapapun ukuran file)
+            daily_quota: Quota harian project API (default env YOUTUBE_DAILY_QUOTA atau 10.000 unit)
         """
         self.debug = debug
+        self.account = account
         self.youtube = None
+        self.credentials = None
+        # Identitas credentials yang dipakai self.youtube, service dibangun ulang hanya jika berubah
+        self._service_fingerprint = None
+        # Service per worker thread untuk upload_batch (httplib2.Http tidak thread-safe)
+        self._local = threading.local()
+        self.chunk_size = align_chunk_size(chunk_size_mb * 1024 * 1024)
+        self.adaptive_chunks = adaptive_chunks
+        self.streaming = streaming
         
         # Setup paths
         self.base_dir = Path(__file__).parent
         self.credentials_dir = self.base_dir / "credentials"
         self.credentials_dir.mkdir(exist_ok=True)
-        self.token_path = self.credentials_dir / "youtube_token.json"
+        if account == "default":
+            self.token_path = self.credentials_dir / "youtube_token.json"
+        else:
+            self.token_path = self.credentials_dir / f"youtube_{account}_token.json"
         self.credentials_path = self.credentials_dir / "youtube_credentials.json"
         
-        # YouTube API scopes
-        self.scopes = ['https://www.googleapis.com/auth/youtube.upload']
+        # Session resumable upload yang belum selesai, per (hash file, akun)
+        self.upload_sessions = UploadSessionStore(self.credentials_dir / "youtube_upload_sessions.json")
+        # Ukuran chunk yang dipelajari per host upload
+        self.chunk_tuning_path = self.credentials_dir / "youtube_chunk_tuning.json"
+        
+        # YouTube API scopes (upload saja; readonly diminta hanya saat status processing dipantau)
+        self.scopes = [self.UPLOAD_SCOPE]
+        # False untuk worker tanpa layar (batch/queue): jangan pernah membuka browser OAuth
+        self.interactive_auth = True
+        
+        # Token di memori, direfresh di background dan dibagi antar proses lewat file lock
+        self.token_manager = TokenManager(self.token_path, self.scopes, log=self._log)
+        # Token yang sudah pernah disetujui untuk readonly tetap diminta dengan scope itu,
+        # agar refresh tidak mempersempit akses token
+        if self.READONLY_SCOPE in self.token_manager.stored_scopes():
+            self.scopes.append(self.READONLY_SCOPE)
+        
+        # Pemakaian quota dicatat lokal per project OAuth (quota dibagi semua akun di project yang sama)
+        self.quota = QuotaLedger(
+            self.credentials_dir / "youtube_quota.json", project=self._quota_project(), daily_limit=daily_quota
+        )
         
         # API service name and version
         self.api_service_name = "youtube"
@@ -76,9 +129,26 @@ class YouTubeAPIUploader:
         icon = icons.get(level, "📝")
         print(f"{color}{icon} {message}{Style.RESET_ALL}")
 
-    def setup_credentials(self):
-        """Setup OAuth2 credentials untuk YouTube API"""
+    def _quota_project(self) -> str:
+        """client_id dari credentials.json sebagai identitas project quota"""
+        try:
+            with open(self.credentials_path, 'r') as f:
+                data = json.load(f)
+            client = data.get("installed") or data.get("web") or {}
+            return client.get("client_id") or "default"
+        except (OSError, ValueError):
+            return "default"
+
+    def setup_credentials(self, interactive: Optional[bool] = None):
+        """
+        Setup OAuth2 credentials untuk YouTube API
+        
+        Args:
+            interactive: Boleh membuka browser OAuth (default: self.interactive_auth)
+        """
         self._log("Menyiapkan kredensial YouTube API...")
+        if interactive is None:
+            interactive = self.interactive_auth
         
         # Cek apakah file credentials.json ada
         if not self.credentials_path.exists():
@@ -93,53 +163,209 @@ class YouTubeAPIUploader:
         
         creds = None
         
-        # Load existing token jika ada
-        if self.token_path.exists():
-            try:
-                creds = Credentials.from_authorized_user_file(str(self.token_path), self.scopes)
+        # Load existing token jika ada (sekali per proses, selanjutnya dari memori)
+        try:
+            creds = self.token_manager.load()
+            if creds:
                 self._log("Token existing dimuat", "SUCCESS")
+        except Exception as e:
+            self._log(f"Error loading token: {e}", "WARNING")
+            creds = None
+        
+        # Token lama dibuat sebelum scope baru ditambahkan: perlu persetujuan ulang
+        missing = self.token_manager.missing_scopes() if creds else []
+        if missing:
+            self._log(f"Token belum punya izin: {', '.join(missing)}", "WARNING")
+            if not interactive:
+                raise PermissionError(
+                    "Token YouTube perlu persetujuan ulang, jalankan upload YouTube sekali secara interaktif"
+                )
+            creds = self._run_oauth_flow("Meminta persetujuan ulang untuk izin baru...")
+        
+        # Refresh jika mendekati expired; jika proses lain sedang refresh, pakai hasilnya
+        elif creds and creds.refresh_token:
+            try:
+                refreshed = self.token_manager.refresh_if_needed()
             except Exception as e:
-                self._log(f"Error loading token: {e}", "WARNING")
-                creds = None
+                # Refresh token dicabut/rusak: login ulang harus dilakukan pengguna, bukan di tengah upload
+                raise RuntimeError(
+                    f"Token YouTube tidak bisa direfresh ({e}), hapus {self.token_path.name} lalu login ulang"
+                ) from e
+            if not refreshed and not self.token_manager.reload():
+                raise RuntimeError("Token YouTube expired dan belum direfresh proses lain, coba lagi nanti")
         
-        # Jika tidak ada credentials yang valid, lakukan OAuth flow
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    self._log("Merefresh token yang expired...")
-                    creds.refresh(Request())
-                    self._log("Token berhasil direfresh", "SUCCESS")
-                except Exception as e:
-                    self._log(f"Error refresh token: {e}", "WARNING")
-                    creds = None
-            
-            if not creds:
-                self._log("Memulai OAuth flow...", "INFO")
-                self._log("Browser akan terbuka untuk autentikasi Google", "WARNING")
-                
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    str(self.credentials_path), self.scopes)
-                creds = flow.run_local_server(port=0)
-                self._log("Autentikasi berhasil!", "SUCCESS")
-            
-            # Simpan credentials untuk next time
-            with open(self.token_path, 'w') as token:
-                token.write(creds.to_json())
-            self._log("Token disimpan untuk penggunaan selanjutnya", "SUCCESS")
+        # Belum pernah login sama sekali: satu-satunya kasus OAuth flow dijalankan otomatis
+        if not creds:
+            if not interactive:
+                raise PermissionError("Token YouTube belum ada, login dulu secara interaktif")
+            creds = self._run_oauth_flow("Memulai OAuth flow...")
+        elif not creds.valid and not creds.refresh_token:
+            raise RuntimeError(f"Token YouTube expired tanpa refresh token, hapus {self.token_path.name} lalu login ulang")
+        
+        self.token_manager.start()
+        return creds
+
+    def _run_oauth_flow(self, message: str):
+        """Jalankan OAuth flow di browser dan simpan token hasilnya"""
+        self._log(message, "INFO")
+        self._log("Browser akan terbuka untuk autentikasi Google", "WARNING")
         
+        flow = InstalledAppFlow.from_client_secrets_file(
+            str(self.credentials_path), self.scopes)
+        creds = flow.run_local_server(port=0)
+        self._log("Autentikasi berhasil!", "SUCCESS")
+        
+        # Simpan credentials untuk next time
+        self.token_manager.save(creds)
+        self._log("Token disimpan untuk penggunaan selanjutnya", "SUCCESS")
         return creds
 
-    def initialize_youtube_service(self):
-        """Initialize YouTube API service"""
+    def _credentials_fingerprint(self) -> Optional[tuple]:
+        """Identitas token tersimpan (refresh token + client + scopes), None jika tidak ada/rusak"""
         try:
-            creds = self.setup_credentials()
-            self.youtube = build(self.api_service_name, self.api_version, credentials=creds)
+            with open(self.token_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return (data.get("refresh_token"), data.get("client_id"), tuple(sorted(data.get("scopes") or [])))
+
+    def _service_current(self) -> bool:
+        """Service yang sudah dibangun masih memakai credentials yang berlaku"""
+        if self.youtube is None or self.credentials is None:
+            return False
+        if self._service_fingerprint is None or self._credentials_fingerprint() != self._service_fingerprint:
+            # Token diganti/dihapus di luar (login ulang, clear credentials, proses lain)
+            return False
+        return self.credentials.valid or bool(self.credentials.refresh_token)
+
+    def _build_service(self, credentials=None, http=None):
+        """Bangun service dari discovery document statis bawaan library (tanpa request discovery)"""
+        return build(
+            self.api_service_name, self.api_version, credentials=credentials, http=http,
+            static_discovery=True, cache_discovery=False
+        )
+
+    def initialize_youtube_service(self, force: bool = False, interactive: Optional[bool] = None):
+        """
+        Initialize YouTube API service
+        
+        Service dipakai ulang selama credentials tidak berubah, jadi aman dipanggil sebelum setiap upload
+        
+        Args:
+            force: Bangun ulang walau credentials masih sama
+            interactive: Boleh membuka browser OAuth (default: self.interactive_auth)
+        """
+        if not force and self._service_current():
+            self._log("YouTube API service dipakai ulang", "DEBUG")
+            return True
+        
+        try:
+            creds = self.setup_credentials(interactive=interactive)
+            self.credentials = creds
+            self.youtube = self._build_service(credentials=creds)
+            self._service_fingerprint = self._credentials_fingerprint()
             self._log("YouTube API service berhasil diinisialisasi", "SUCCESS")
             return True
         except Exception as e:
             self._log(f"Gagal inisialisasi YouTube API: {str(e)}", "ERROR")
             return False
 
+    def benchmark_service_init(self, iterations: int = 20) -> Dict[str, Any]:
+        """
+        Bandingkan overhead per upload: memuat credentials + build service setiap kali
+        vs initialize_youtube_service yang di-memoize
+        
+        Returns:
+            Dict dengan rata-rata ms per panggilan untuk kedua cara
+        """
+        if not self.initialize_youtube_service():
+            return {"success": False, "message": "Gagal inisialisasi YouTube API"}
+        
+        # Cara lama: baca token dan build service untuk setiap upload
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            creds = Credentials.from_authorized_user_file(str(self.token_path), self.scopes)
+            build(self.api_service_name, self.api_version, credentials=creds)
+        rebuild_ms = (time.perf_counter() - start_time) * 1000 / iterations
+        
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            self.initialize_youtube_service()
+        memoized_ms = (time.perf_counter() - start_time) * 1000 / iterations
+        
+        self._log(f"Build setiap upload: {rebuild_ms:.2f} ms/panggilan", "INFO")
+        self._log(f"Service di-memoize: {memoized_ms:.3f} ms/panggilan", "INFO")
+        
+        return {
+            "success": True,
+            "iterations": iterations,
+            "rebuild_ms": round(rebuild_ms, 3),
+            "memoized_ms": round(memoized_ms, 3),
+            "speedup": round(rebuild_ms / memoized_ms, 1) if memoized_ms else None
+        }
+
+    def _service(self):
+        """Service untuk thread ini: milik worker batch jika ada, selain itu self.youtube"""
+        return getattr(self._local, "service", None) or self.youtube
+
+    def _init_thread_service(self):
+        """Bangun service + transport httplib2 sendiri untuk worker thread dari credentials bersama"""
+        if getattr(self._local, "service", None) is not None and self._local.credentials is self.credentials:
+            return
+        http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+        self._local.service = self._build_service(http=http)
+        self._local.credentials = self.credentials
+        self._log(f"Service YouTube dibuat untuk {threading.current_thread().name}", "DEBUG")
+
+    def _query_upload_offset(self, insert_request, session_uri: str, total_size: int):
+        """
+        Tanya server sampai byte mana session resumable sudah diterima
+        
+        Returns:
+            Tuple (offset, response): offset byte berikutnya, atau response video jika upload
+            sudah selesai. (None, None) jika session tidak berlaku lagi
+        """
+        headers = {"Content-Range": f"bytes */{total_size}", "Content-Length": "0"}
+        resp, content = insert_request.http.request(session_uri, "PUT", headers=headers)
+        
+        if resp.status in (200, 201):
+            return total_size, json.loads(content)
+        if resp.status == 308:
+            # Header Range: bytes=0-N (tidak ada jika belum ada byte yang diterima)
+            received = resp.get("range")
+            offset = int(received.split("-")[-1]) + 1 if received else 0
+            return offset, None
+        return None, None
+
+    def _resume_upload_session(self, insert_request, file_hash: str, total_size: int):
+        """
+        Lanjutkan session tersimpan jika ada
+        
+        Returns:
+            Tuple (offset awal, response jika sudah selesai)
+        """
+        session = self.upload_sessions.get(file_hash, self.account)
+        if not session:
+            return 0, None
+        
+        try:
+            offset, response = self._query_upload_offset(insert_request, session["uri"], total_size)
+        except Exception as e:
+            self._log(f"Gagal mengecek session upload tersimpan: {e}", "WARNING")
+            offset, response = None, None
+        
+        if offset is None:
+            self._log("Session upload tersimpan sudah tidak berlaku, mulai dari awal", "WARNING")
+            self.upload_sessions.delete(file_hash, self.account)
+            return 0, None
+        
+        # Lanjutkan request baru dari byte terakhir yang dikonfirmasi server
+        insert_request.resumable_uri = session["uri"]
+        insert_request.resumable_progress = offset
+        self._log(f"Melanjutkan upload dari byte {offset:,}/{total_size:,} "
+                  f"({offset / max(total_size, 1) * 100:.1f}%)", "SUCCESS")
+        return offset, response
+
     def get_video_category_id(self, category_name: str = "Entertainment") -> str:
         """Get video category ID berdasarkan nama kategori"""
         category_mapping = {
@@ -228,35 +454,83 @@ class YouTubeAPIUploader:
             }
         }
         
-        # Prepare media upload
-        media = MediaFileUpload(
-            video_path,
-            chunksize=-1,  # Upload in single chunk
-            resumable=True,
-            mimetype=mime_type
-        )
+        # Prepare media upload - chunked agar bisa dilanjutkan dari byte terakhir
+        if self.streaming:
+            media = StreamingMediaUpload(video_path, mimetype=mime_type, chunksize=self.chunk_size)
+        else:
+            media = ResizableMediaFileUpload(
+                video_path,
+                chunksize=self.chunk_size,
+                resumable=True,
+                mimetype=mime_type
+            )
+        total_size = os.path.getsize(video_path)
+        file_hash = quick_file_hash(video_path)
         
         try:
             self._log("Memulai upload ke YouTube...", "INFO")
             
             # Execute upload request
-            insert_request = self.youtube.videos().insert(
+            insert_request = self._service().videos().insert(
                 part=','.join(body.keys()),
                 body=body,
                 media_body=media
             )
             
+            # Lanjutkan session dari run sebelumnya jika file + akun sama
+            resumed_from, response = self._resume_upload_session(insert_request, file_hash, total_size)
+            
+            # Session baru memakai quota videos.insert: tolak sebelum ada byte yang dikirim jika tidak cukup
+            if response is None and not insert_request.resumable_uri and not self.quota.reserve("videos.insert"):
+                usage = self.quota.usage()
+                error_msg = (f"Quota API tidak cukup untuk upload: sisa {usage['remaining']}/{usage['limit']} unit, "
+                             f"reset {usage['reset_at']}")
+                self._log(error_msg, "ERROR")
+                return {
+                    "success": False,
+                    "message": error_msg,
+                    "video_path": video_path,
+                    "title": title,
+                    "quota_exceeded": True,
+                    "deferred_until": usage["reset_at"]
+                }
+            
+            # Ukuran chunk awal dari setting host yang sudah dipelajari
+            tuner = ChunkTuner(
+                self.chunk_tuning_path, urlparse(insert_request.uri).netloc, self.chunk_size,
+                adaptive=self.adaptive_chunks
+            )
+            media.set_chunksize(tuner.current)
+            self._log(f"Ukuran chunk awal: {tuner.current / (1024 * 1024):.2f}MB", "DEBUG")
+            
             # Upload dengan progress tracking
-            response = None
             error = None
             retry = 0
             max_retries = 3
             
             while response is None:
                 try:
-                    self._log(f"Upload attempt {retry + 1}/{max_retries + 1}")
+                    offset_before = insert_request.resumable_progress
+                    chunk_start = time.time()
                     status, response = insert_request.next_chunk()
                     
+                    # Ukur throughput chunk ini dan sesuaikan ukuran chunk berikutnya
+                    sent = (total_size if response is not None else insert_request.resumable_progress) - offset_before
+                    previous_size = tuner.current
+                    media.set_chunksize(tuner.record(sent, time.time() - chunk_start))
+                    if tuner.current != previous_size:
+                        self._log(f"Ukuran chunk: {previous_size / (1024 * 1024):.2f}MB -> "
+                                  f"{tuner.current / (1024 * 1024):.2f}MB", "DEBUG")
+                    
+                    # Simpan offset yang sudah dikonfirmasi setelah setiap chunk
+                    if response is None and insert_request.resumable_uri:
+                        self.upload_sessions.save(
+                            file_hash, self.account, insert_request.resumable_uri,
+                            insert_request.resumable_progress,
+                            video_path=os.path.abspath(video_path), size=total_size, title=title
+                        )
+                    retry = 0
+                    
                     if status:
                         progress = int(status.progress() * 100)
                         self._log(f"Upload progress: {progress}%", "INFO")
@@ -265,6 +539,7 @@ class YouTubeAPIUploader:
                     if e.resp.status in [500, 502, 503, 504]:
                         error = f"HTTP Error {e.resp.status}: {e.content}"
                         self._log(f"Retriable error: {error}", "WARNING")
+                        media.set_chunksize(tuner.on_error())
                         retry += 1
                         if retry > max_retries:
                             raise Exception(f"Max retries exceeded: {error}")
@@ -275,18 +550,29 @@ class YouTubeAPIUploader:
                 except Exception as e:
                     error = str(e)
                     self._log(f"Upload error: {error}", "ERROR")
+                    media.set_chunksize(tuner.on_error())
                     retry += 1
                     if retry > max_retries:
                         raise Exception(f"Upload failed after {max_retries} retries: {error}")
                     time.sleep(2 ** retry)
             
             if response:
+                self.upload_sessions.delete(file_hash, self.account)
+                tuner.save()
+                transfer_stats = tuner.stats()
+                if self.streaming:
+                    rss_delta = media.peak_rss_delta()
+                    transfer_stats["peak_rss_delta_mb"] = (
+                        round(rss_delta / (1024 * 1024), 2) if rss_delta is not None else None
+                    )
                 video_id = response['id']
                 video_url = f"https://www.youtube.com/watch?v={video_id}"
                 
                 self._log("Upload berhasil!", "SUCCESS")
                 self._log(f"Video ID: {video_id}", "INFO")
                 self._log(f"Video URL: {video_url}", "INFO")
+                self._log(f"Throughput: {transfer_stats['throughput_mb_s']} MB/s, "
+                          f"chunk: {[round(c / (1024 * 1024), 2) for c in transfer_stats['chunk_sizes']]} MB", "INFO")
                 
                 return {
                     "success": True,
@@ -297,7 +583,9 @@ class YouTubeAPIUploader:
                     "description": description,
                     "privacy": privacy,
                     "is_shorts": is_shorts,
-                    "file_size_mb": file_size
+                    "file_size_mb": file_size,
+                    "resumed_from_bytes": resumed_from,
+                    **transfer_stats
                 }
             else:
                 raise Exception("Upload gagal: No response received")
@@ -312,23 +600,31 @@ class YouTubeAPIUploader:
             elif e.resp.status == 400:
                 self._log("Request tidak valid, cek parameter upload", "ERROR")
             
-            return {
-                "success": False,
-                "message": error_msg,
-                "video_path": video_path,
-                "title": title
-            }
+            return self._failed_upload_result(error_msg, video_path, title)
             
         except Exception as e:
             error_msg = f"Upload error: {str(e)}"
             self._log(error_msg, "ERROR")
             
-            return {
-                "success": False,
-                "message": error_msg,
-                "video_path": video_path,
-                "title": title
-            }
+            return self._failed_upload_result(error_msg, video_path, title)
+        
+        finally:
+            if self.streaming:
+                media.close()
+
+    def _failed_upload_result(self, error_msg: str, video_path: str, title: str) -> Dict[str, Any]:
+        result = {
+            "success": False,
+            "message": error_msg,
+            "video_path": video_path,
+            "title": title
+        }
+        if self._is_quota_error(result):
+            # Samakan ledger dengan server: quota hari ini sudah habis
+            self.quota.mark_exhausted()
+            result["quota_exceeded"] = True
+            result["deferred_until"] = self.quota.usage()["reset_at"]
+        return result
 
     def upload_shorts(self, video_path: str, title: str, description: str = "", 
                      privacy: str = "public") -> Dict[str, Any]:
@@ -363,6 +659,194 @@ class YouTubeAPIUploader:
             privacy=privacy
         )
 
+    @staticmethod
+    def _is_quota_error(result: Dict[str, Any]) -> bool:
+        if result.get("quota_exceeded"):
+            return True
+        message = result.get("message", "")
+        return any(reason in message for reason in ("quotaExceeded", "uploadLimitExceeded", "dailyLimitExceeded"))
+
+    def _run_batch_job(self, index: int, job: Dict[str, Any], shorts: bool) -> Dict[str, Any]:
+        """Jalankan satu job batch di worker thread"""
+        try:
+            self._init_thread_service()
+            if shorts:
+                result = self.upload_shorts(**job)
+            else:
+                result = self.upload_video(**job)
+        except Exception as e:
+            # Validasi file/argumen gagal: jadikan result agar batch tetap jalan
+            result = {
+                "success": False,
+                "message": f"Upload error: {str(e)}",
+                "video_path": job.get("video_path"),
+                "title": job.get("title")
+            }
+        result["job_index"] = index
+        return result
+
+    def upload_batch(self, jobs: List[Dict[str, Any]], max_workers: int = 2,
+                     shorts: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Upload banyak video bersamaan, setiap worker thread memakai service dan transport sendiri
+        
+        Args:
+            jobs: List dict argumen upload_shorts (video_path, title, description, privacy)
+                  atau upload_video jika shorts=False
+            max_workers: Batas upload bersamaan. Satu upload memakai ~1600 unit quota API,
+                         jadi jaga tetap kecil agar quota harian tidak habis di tengah batch
+            shorts: Upload sebagai Shorts (upload_shorts) atau video biasa (upload_video)
+            
+        Yields:
+            Result dict per job (ditambah 'job_index') begitu job selesai, urutan sesuai selesainya
+        """
+        if not jobs:
+            return
+        
+        if not self.credentials and not self.initialize_youtube_service():
+            for index, job in enumerate(jobs):
+                yield {
+                    "success": False,
+                    "message": "Gagal inisialisasi YouTube API",
+                    "video_path": job.get("video_path"),
+                    "title": job.get("title"),
+                    "job_index": index
+                }
+            return
+        
+        max_workers = max(1, min(max_workers, len(jobs)))
+        self._log(f"Batch upload: {len(jobs)} video, {max_workers} upload bersamaan", "INFO")
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="youtube-upload") as executor:
+            futures = {
+                executor.submit(self._run_batch_job, index, job, shorts): index
+                for index, job in enumerate(jobs)
+            }
+            quota_exhausted = False
+            
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                result = future.result()
+                yield result
+                
+                # Quota habis: job yang belum mulai pasti gagal juga, batalkan
+                if not quota_exhausted and not result["success"] and self._is_quota_error(result):
+                    quota_exhausted = True
+                    self._log("Quota API habis, membatalkan job yang belum dimulai", "ERROR")
+                    for pending in futures:
+                        pending.cancel()
+            
+            if quota_exhausted:
+                for future, index in futures.items():
+                    if future.cancelled():
+                        yield {
+                            "success": False,
+                            "message": "Dibatalkan: quota API habis",
+                            "video_path": jobs[index].get("video_path"),
+                            "title": jobs[index].get("title"),
+                            "job_index": index
+                        }
+
+    def enable_processing_status(self, interactive: Optional[bool] = None) -> bool:
+        """
+        Pastikan token punya scope youtube.readonly (videos.list untuk status processing)
+        
+        Args:
+            interactive: Boleh membuka browser OAuth untuk persetujuan (default: self.interactive_auth)
+        
+        Returns:
+            True jika scope tersedia, False jika tidak (worker non-interaktif tidak meminta persetujuan)
+        """
+        if self.READONLY_SCOPE in self.token_manager.stored_scopes():
+            return True
+        if interactive is None:
+            interactive = self.interactive_auth
+        if not interactive:
+            self._log("Token belum punya izin youtube.readonly, status processing tidak dipantau", "WARNING")
+            return False
+        
+        if self.READONLY_SCOPE not in self.scopes:
+            self.scopes.append(self.READONLY_SCOPE)
+        try:
+            self._run_oauth_flow("Meminta izin youtube.readonly untuk memantau status processing...")
+        except Exception as e:
+            # Jangan sampai setup_credentials berikutnya menuntut persetujuan ulang
+            self.scopes.remove(self.READONLY_SCOPE)
+            self._log(f"Izin youtube.readonly tidak didapat: {e}", "WARNING")
+            return False
+        return self.initialize_youtube_service(force=True, interactive=False)
+
+    def status_poller(self, video_ids: Optional[List[str]] = None,
+                      on_transition: Optional[Callable[[Dict[str, Any]], None]] = None,
+                      **kwargs) -> ProcessingStatusPoller:
+        """
+        Poller status processing untuk video yang sudah diupload
+        
+        Perlu scope youtube.readonly, lihat enable_processing_status
+        
+        Args:
+            video_ids: ID video yang dipantau (bisa ditambah nanti dengan poller.add)
+            on_transition: Callback setiap status video berubah
+            **kwargs: min_interval, max_interval
+        """
+        poller = ProcessingStatusPoller(
+            self.youtube, quota=self.quota, on_transition=on_transition, log=self._log, **kwargs
+        )
+        poller.add(video_ids or [])
+        return poller
+
+    def wait_for_processing(self, video_ids: List[str], timeout: float = 900,
+                            on_transition: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Tunggu YouTube selesai memproses video (satu panggilan videos.list per 50 video)
+        
+        Tanpa scope youtube.readonly (mis. worker non-interaktif) pemantauan dilewati, upload tidak dianggap gagal
+        
+        Returns:
+            Dict dengan status akhir per video_id
+        """
+        try:
+            if not self.youtube:
+                if not self.initialize_youtube_service():
+                    return {"success": False, "message": "Gagal inisialisasi YouTube API"}
+            
+            if not self.enable_processing_status():
+                return {
+                    "success": True,
+                    "skipped": True,
+                    "message": "Status processing tidak dipantau (token belum punya izin youtube.readonly)"
+                }
+            
+            poller = self.status_poller(video_ids, on_transition=on_transition)
+            self._log(f"Menunggu processing {len(video_ids)} video...", "INFO")
+            states = poller.wait(timeout=timeout)
+            
+            done = [video_id for video_id, info in states.items() if info["state"] == "succeeded"]
+            pending = poller.pending()
+            self._log(f"Processing selesai: {len(done)}/{len(states)} video "
+                      f"({poller.api_calls} panggilan API)", "SUCCESS" if not pending else "WARNING")
+            
+            return {
+                "success": len(done) == len(states),
+                "message": "Semua video selesai diproses" if len(done) == len(states)
+                           else f"{len(states) - len(done)} video belum/gagal diproses",
+                "videos": states,
+                "pending": pending,
+                "api_calls": poller.api_calls
+            }
+            
+        except HttpError as e:
+            error_msg = f"YouTube API Error: {e.resp.status} - {e.content}"
+            self._log(error_msg, "ERROR")
+            if e.resp.status == 403:
+                self._log("Akses baca video ditolak, pastikan YouTube Data API aktif dan token punya scope youtube.readonly", "ERROR")
+            return {"success": False, "message": error_msg}
+        except Exception as e:
+            error_msg = f"Error checking processing status: {str(e)}"
+            self._log(error_msg, "ERROR")
+            return {"success": False, "message": error_msg}
+
     def get_channel_info(self) -> Dict[str, Any]:
         """Get informasi channel YouTube"""
         try:
@@ -374,6 +858,7 @@ class YouTubeAPIUploader:
                 part="snippet,statistics",
                 mine=True
             )
+            self.quota.record("channels.list")
             response = request.execute()
             
             if response['items']:
@@ -401,44 +886,23 @@ class YouTubeAPIUploader:
             return {"success": False, "message": error_msg}
 
     def check_api_quota(self) -> Dict[str, Any]:
-        """Check API quota usage (estimasi)"""
+        """Check API quota dari ledger lokal (tanpa memakai quota untuk request test)"""
         try:
-            # Lakukan request sederhana untuk test quota
-            if not self.youtube:
-                if not self.initialize_youtube_service():
-                    return {"success": False, "message": "Gagal inisialisasi YouTube API"}
+            usage = self.quota.usage()
+            quota_available = usage["remaining"] > 0
             
-            # Test dengan request ringan
-            request = self.youtube.channels().list(
-                part="id",
-                mine=True
-            )
-            response = request.execute()
+            self._log(f"Quota terpakai hari ini (waktu Pasifik {usage['day']}): "
+                      f"{usage['used']:,}/{usage['limit']:,} unit", "INFO")
+            self._log(f"Sisa: {usage['remaining']:,} unit (~{usage['uploads_remaining']} upload), "
+                      f"reset {usage['reset_at']}", "SUCCESS" if usage["uploads_remaining"] else "WARNING")
             
-            self._log("API quota tersedia", "SUCCESS")
             return {
                 "success": True,
-                "message": "API quota tersedia",
-                "quota_available": True
+                "message": "API quota tersedia" if quota_available else "API quota habis",
+                "quota_available": quota_available,
+                **usage
             }
             
-        except HttpError as e:
-            if e.resp.status == 403:
-                error_msg = "API quota habis atau akses ditolak"
-                self._log(error_msg, "ERROR")
-                return {
-                    "success": False,
-                    "message": error_msg,
-                    "quota_available": False
-                }
-            else:
-                error_msg = f"API Error: {e.resp.status}"
-                self._log(error_msg, "ERROR")
-                return {
-                    "success": False,
-                    "message": error_msg,
-                    "quota_available": False
-                }
         except Exception as e:
             error_msg = f"Error checking quota: {str(e)}"
             self._log(error_msg, "ERROR")
@@ -451,6 +915,10 @@ class YouTubeAPIUploader:
     def clear_credentials(self):
         """Hapus credentials dan token"""
         try:
+            self.token_manager.stop()
+            self.youtube = None
+            self.credentials = None
+            self._service_fingerprint = None
             if self.token_path.exists():
                 self.token_path.unlink()
                 self._log("Token YouTube berhasil dihapus", "SUCCESS")
@@ -500,10 +968,20 @@ def main():
     parser.add_argument("--check-credentials", action="store_true", help="Cek status credentials")
     parser.add_argument("--check-quota", action="store_true", help="Cek API quota")
     parser.add_argument("--channel-info", action="store_true", help="Tampilkan info channel")
+    parser.add_argument("--account", default="default", help="Nama akun (token/session upload terpisah per akun)")
+    parser.add_argument("--chunk-size-mb", type=float, default=8, help="Ukuran chunk awal upload (MB, kelipatan 256 KiB)")
+    parser.add_argument("--fixed-chunks", action="store_true", help="Jangan sesuaikan ukuran chunk dengan throughput")
+    parser.add_argument("--no-streaming", action="store_true", help="Pakai MediaFileUpload biasa (tanpa reader memori konstan)")
+    parser.add_argument("--wait-processing", action="store_true", help="Setelah upload, tunggu YouTube selesai memproses video")
+    parser.add_argument("--status", nargs="+", metavar="VIDEO_ID", help="Pantau status processing video yang sudah diupload")
+    parser.add_argument("--daily-quota", type=int, help="Quota harian project API (default 10000 atau env YOUTUBE_DAILY_QUOTA)")
+    parser.add_argument("--benchmark-init", type=int, metavar="N", help="Ukur overhead inisialisasi service per upload (N iterasi)")
     
     args = parser.parse_args()
     
-    uploader = YouTubeAPIUploader(debug=args.debug)
+    uploader = YouTubeAPIUploader(debug=args.debug, account=args.account, chunk_size_mb=args.chunk_size_mb,
+                                  adaptive_chunks=not args.fixed_chunks, streaming=not args.no_streaming,
+                                  daily_quota=args.daily_quota)
     
     # Handle different actions
     if args.clear_credentials:
@@ -518,6 +996,23 @@ def main():
         uploader.check_api_quota()
         return
     
+    if args.benchmark_init:
+        result = uploader.benchmark_service_init(args.benchmark_init)
+        if result["success"]:
+            print(f"{Fore.CYAN}⏱️ Build setiap upload: {result['rebuild_ms']} ms, "
+                  f"memoize: {result['memoized_ms']} ms ({result['speedup']}x)")
+        return
+    
+    if args.status:
+        result = uploader.wait_for_processing(
+            args.status,
+            on_transition=lambda t: print(f"{Fore.CYAN}🎞️ {t['video_id']}: {t['previous']} -> {t['state']}"
+                                          f"{' (' + t['reason'] + ')' if t['reason'] else ''}")
+        )
+        if not result["success"]:
+            sys.exit(1)
+        return
+    
     if args.channel_info:
         if uploader.initialize_youtube_service():
             uploader.get_channel_info()
@@ -538,6 +1033,10 @@ def main():
         if result["success"]:
             print(f"{Fore.GREEN}🎉 YouTube Shorts berhasil diupload!")
             print(f"{Fore.CYAN}📺 Video URL: {result['video_url']}")
+            if args.wait_processing:
+                processing = uploader.wait_for_processing([result["video_id"]])
+                if not processing["success"]:
+                    sys.exit(1)
         else:
             print(f"{Fore.RED}❌ YouTube Shorts gagal: {result['message']}")
             sys.exit(1)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+YouTube Quota - catatan pemakaian quota YouTube Data API di lokal
+Biaya setiap panggilan dicatat per project OAuth, direset pada pergantian hari waktu Pasifik
+(sama seperti Google), sehingga sisa quota bisa diketahui tanpa memanggil API
+"""
+
+import os
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from file_lock import FileLock
+
+try:
+    from zoneinfo import ZoneInfo
+    PACIFIC = ZoneInfo("America/Los_Angeles")
+except Exception:  # tzdata tidak tersedia (mis. Windows tanpa paket tzdata)
+    PACIFIC = timezone(timedelta(hours=-8))
+
+# Biaya unit per method (https://developers.google.com/youtube/v3/determine_quota_cost)
+QUOTA_COSTS = {
+    "videos.insert": 1600,
+    "videos.list": 1,
+    "videos.update": 50,
+    "channels.list": 1,
+    "thumbnails.set": 50,
+}
+
+DEFAULT_DAILY_QUOTA = 10000
+
+
+class QuotaLedger:
+    def __init__(self, store_path: Path, project: str = "default", daily_limit: Optional[int] = None):
+        """
+        Initialize Quota Ledger
+
+        Args:
+            store_path: Lokasi file JSON ledger (dipakai bersama antar proses)
+            project: Identitas project OAuth (client_id), quota dihitung per project
+            daily_limit: Quota harian (default env YOUTUBE_DAILY_QUOTA atau 10.000)
+        """
+        self.store_path = Path(store_path)
+        self.project = project
+        self.daily_limit = daily_limit or int(os.environ.get("YOUTUBE_DAILY_QUOTA", DEFAULT_DAILY_QUOTA))
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(self.store_path.with_suffix(".lock"))
+
+    @staticmethod
+    def _pacific_now() -> datetime:
+        return datetime.now(PACIFIC)
+
+    def _today(self) -> str:
+        return self._pacific_now().strftime("%Y-%m-%d")
+
+    def reset_at(self) -> datetime:
+        """Waktu reset quota berikutnya (tengah malam waktu Pasifik)"""
+        now = self._pacific_now()
+        return datetime(now.year, now.month, now.day, tzinfo=PACIFIC) + timedelta(days=1)
+
+    def _load(self) -> Dict[str, Any]:
+        if not self.store_path.exists():
+            return {}
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _save(self, data: Dict[str, Any]):
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.store_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.store_path)
+
+    def _day_entry(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        entry = data.get(self.project)
+        today = self._today()
+        if not entry or entry.get("day") != today:
+            entry = {"day": today, "used": 0, "calls": {}}
+            data[self.project] = entry
+        return entry
+
+    def _update(self, update) -> Any:
+        """Baca-ubah-tulis ledger di bawah lock thread + file (antar proses)"""
+        with self._lock:
+            self._file_lock.acquire(blocking=True)
+            try:
+                data = self._load()
+                result = update(self._day_entry(data))
+                self._save(data)
+                return result
+            finally:
+                self._file_lock.release()
+
+    def reserve(self, method: str, units: Optional[int] = None) -> bool:
+        """
+        Catat biaya panggilan sebelum dikirim, hanya jika masih muat dalam quota hari ini
+
+        Returns:
+            False jika panggilan ini akan melebihi quota (tidak dicatat)
+        """
+        cost = QUOTA_COSTS.get(method, 1) if units is None else units
+
+        def update(entry):
+            if entry["used"] + cost > self.daily_limit:
+                return False
+            entry["used"] += cost
+            entry["calls"][method] = entry["calls"].get(method, 0) + 1
+            return True
+
+        return self._update(update)
+
+    def record(self, method: str, units: Optional[int] = None):
+        """Catat biaya panggilan yang sudah terjadi (walau melebihi perkiraan quota)"""
+        cost = QUOTA_COSTS.get(method, 1) if units is None else units
+
+        def update(entry):
+            entry["used"] += cost
+            entry["calls"][method] = entry["calls"].get(method, 0) + 1
+
+        self._update(update)
+
+    def mark_exhausted(self):
+        """Server menolak dengan quotaExceeded: anggap quota hari ini habis"""
+        def update(entry):
+            entry["used"] = max(entry["used"], self.daily_limit)
+            entry["exhausted"] = True
+
+        self._update(update)
+
+    def usage(self) -> Dict[str, Any]:
+        """Pemakaian hari ini dan prediksi sisa kapasitas"""
+        with self._lock:
+            entry = self._day_entry(self._load())
+        remaining = max(self.daily_limit - entry["used"], 0)
+        reset_at = self.reset_at()
+        return {
+            "day": entry["day"],
+            "used": entry["used"],
+            "limit": self.daily_limit,
+            "remaining": remaining,
+            "uploads_remaining": remaining // QUOTA_COSTS["videos.insert"],
+            "calls": dict(entry["calls"]),
+            "reset_at": reset_at.isoformat(),
+            "seconds_until_reset": int(reset_at.timestamp() - datetime.now(timezone.utc).timestamp())
+        }
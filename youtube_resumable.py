@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+YouTube Resumable - penyimpanan session upload resumable YouTube
+Session URI dan offset byte yang sudah dikonfirmasi disimpan per (hash file, akun) agar upload
+yang terputus (termasuk restart proses) bisa dilanjutkan dari byte terakhir.
+Ukuran chunk disesuaikan dengan throughput/RTT yang terukur dan dipelajari per host.
+Mode streaming membaca file lewat buffer berukuran tetap sehingga memori konstan berapapun ukuran file
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from googleapiclient.http import MediaFileUpload, MediaUpload
+
+from file_lock import FileLock
+
+try:
+    import psutil
+except ImportError:  # psutil opsional, fallback ke /proc di Linux
+    psutil = None
+
+# Ukuran chunk resumable upload harus kelipatan 256 KiB
+CHUNK_GRANULARITY = 256 * 1024
+
+# Session URI YouTube berlaku sekitar satu minggu, buang lebih awal agar aman
+SESSION_MAX_AGE = 6 * 86400
+
+
+def align_chunk_size(size_bytes: int) -> int:
+    """Bulatkan ukuran chunk ke kelipatan 256 KiB (minimum 256 KiB)"""
+    return max(CHUNK_GRANULARITY, (int(size_bytes) // CHUNK_GRANULARITY) * CHUNK_GRANULARITY)
+
+
+def current_rss_bytes() -> Optional[int]:
+    """RSS proses ini saat ini (bukan peak seumur proses), None jika tidak bisa diukur"""
+    if psutil is not None:
+        try:
+            return psutil.Process().memory_info().rss
+        except psutil.Error:
+            return None
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def quick_file_hash(file_path: str, sample_size: int = 1024 * 1024) -> str:
+    """
+    Hash identitas file tanpa membaca seluruh file multi-GB
+
+    Ukuran file + sample awal, tengah dan akhir (masing-masing sample_size byte)
+    """
+    size = os.path.getsize(file_path)
+    digest = hashlib.sha256(str(size).encode())
+
+    with open(file_path, 'rb') as f:
+        for offset in sorted({0, max(size // 2 - sample_size // 2, 0), max(size - sample_size, 0)}):
+            f.seek(offset)
+            digest.update(f.read(sample_size))
+
+    return digest.hexdigest()
+
+
+class UploadSessionStore:
+    def __init__(self, store_path: Path):
+        """
+        Initialize Upload Session Store
+
+        Args:
+            store_path: Lokasi file JSON session
+        """
+        self.store_path = Path(store_path)
+        self._lock = threading.Lock()
+        # Beberapa proses worker bisa menyimpan session ke file yang sama
+        self._file_lock = FileLock(self.store_path.with_suffix(".lock"))
+
+    @staticmethod
+    def _key(file_hash: str, account: str) -> str:
+        return f"{account}:{file_hash}"
+
+    def _load(self) -> Dict[str, Any]:
+        if not self.store_path.exists():
+            return {}
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _save(self, data: Dict[str, Any]):
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.store_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.store_path)
+
+    def get(self, file_hash: str, account: str) -> Optional[Dict[str, Any]]:
+        """Session yang masih berlaku untuk file + akun ini, atau None"""
+        with self._lock, self._file_lock:
+            data = self._load()
+            session = data.get(self._key(file_hash, account))
+            if session and time.time() - session.get("created_at", 0) > SESSION_MAX_AGE:
+                del data[self._key(file_hash, account)]
+                self._save(data)
+                return None
+            return session
+
+    def save(self, file_hash: str, account: str, session_uri: str, offset: int, **extra):
+        """Simpan session URI dan offset byte yang sudah dikonfirmasi server"""
+        with self._lock, self._file_lock:
+            data = self._load()
+            key = self._key(file_hash, account)
+            previous = data.get(key, {})
+            created_at = previous.get("created_at") if previous.get("uri") == session_uri else None
+
+            data[key] = dict(
+                previous if created_at else {},
+                **extra,
+                uri=session_uri,
+                offset=offset,
+                created_at=created_at or time.time(),
+                updated_at=time.time()
+            )
+            self._save(data)
+
+    def delete(self, file_hash: str, account: str):
+        """Hapus session (upload selesai atau session kedaluwarsa)"""
+        with self._lock, self._file_lock:
+            data = self._load()
+            if data.pop(self._key(file_hash, account), None) is not None:
+                self._save(data)
+
+
+class ResizableMediaFileUpload(MediaFileUpload):
+    """MediaFileUpload yang ukuran chunk-nya boleh diubah di antara next_chunk()"""
+
+    def set_chunksize(self, chunk_size: int):
+        self._chunksize = align_chunk_size(chunk_size)
+
+
+class ChunkTuner:
+    def __init__(self, store_path: Path, host: str, initial_size: int,
+                 min_size: int = 1024 * 1024, max_size: int = 64 * 1024 * 1024,
+                 target_seconds: float = 4.0, adaptive: bool = True):
+        """
+        Initialize Chunk Tuner
+
+        Args:
+            store_path: Lokasi file JSON setting per host
+            host: Host upload (mis. 'www.googleapis.com')
+            initial_size: Ukuran chunk awal jika host belum pernah dipelajari
+            min_size: Batas bawah ukuran chunk
+            max_size: Batas atas ukuran chunk
+            target_seconds: Durasi ideal satu chunk (dinaikkan otomatis jika RTT tinggi)
+            adaptive: False = ukuran tetap initial_size
+        """
+        self.store_path = Path(store_path)
+        self.host = host
+        self.min_size = align_chunk_size(min_size)
+        self.max_size = align_chunk_size(max_size)
+        self.target_seconds = target_seconds
+        self.adaptive = adaptive
+
+        # (bytes, detik) per chunk untuk estimasi throughput dan RTT
+        self.samples: List[tuple] = []
+        self.history: List[int] = []
+        self.rtt = None
+        self.throughput = None
+
+        learned = self._load().get(host, {}) if adaptive else {}
+        self.current = self._clamp(learned.get("chunk_size", initial_size))
+        self.history.append(self.current)
+
+    def _load(self) -> Dict[str, Any]:
+        if not self.store_path.exists():
+            return {}
+        try:
+            with open(self.store_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _clamp(self, size: int) -> int:
+        return align_chunk_size(min(max(int(size), self.min_size), self.max_size))
+
+    def _estimate(self):
+        """Regresi linier durasi = RTT + bytes / throughput atas sample terakhir"""
+        recent = self.samples[-8:]
+        total_bytes = sum(b for b, _ in recent)
+        total_seconds = sum(t for _, t in recent)
+        if total_seconds <= 0:
+            return
+
+        sizes = {b for b, _ in recent}
+        if len(sizes) >= 2:
+            n = len(recent)
+            mean_b = total_bytes / n
+            mean_t = total_seconds / n
+            var_b = sum((b - mean_b) ** 2 for b, _ in recent)
+            slope = sum((b - mean_b) * (t - mean_t) for b, t in recent) / var_b
+            if slope > 0:
+                self.throughput = 1 / slope
+                self.rtt = max(mean_t - slope * mean_b, 0.0)
+                return
+
+        # Belum ada variasi ukuran: throughput rata-rata, RTT belum diketahui
+        self.throughput = total_bytes / total_seconds
+
+    def record(self, chunk_bytes: int, elapsed: float) -> int:
+        """
+        Catat satu chunk yang terkirim dan hitung ukuran chunk berikutnya
+
+        Returns:
+            Ukuran chunk berikutnya
+        """
+        if chunk_bytes <= 0 or elapsed <= 0:
+            return self.current
+
+        self.samples.append((chunk_bytes, elapsed))
+        self._estimate()
+        if not self.adaptive or not self.throughput:
+            return self.current
+
+        # Overhead RTT per chunk maksimal ~5% dari durasi chunk
+        target = max(self.target_seconds, (self.rtt or 0) * 20)
+        desired = self.throughput * target
+
+        # Berubah bertahap (maks 2x per langkah) agar tidak berosilasi
+        desired = min(max(desired, self.current / 2), self.current * 2)
+        new_size = self._clamp(desired)
+        if new_size != self.current:
+            self.current = new_size
+            self.history.append(new_size)
+        return self.current
+
+    def on_error(self) -> int:
+        """Koneksi bermasalah: perkecil chunk agar retry lebih murah"""
+        if self.adaptive:
+            new_size = self._clamp(self.current // 2)
+            if new_size != self.current:
+                self.current = new_size
+                self.history.append(new_size)
+        return self.current
+
+    def stats(self) -> Dict[str, Any]:
+        """Ringkasan untuk result dict"""
+        total_bytes = sum(b for b, _ in self.samples)
+        total_seconds = sum(t for _, t in self.samples)
+        peak = max((b / t for b, t in self.samples), default=0)
+        return {
+            "chunk_sizes": list(self.history),
+            "chunks_sent": len(self.samples),
+            "throughput_mb_s": round(total_bytes / total_seconds / (1024 * 1024), 2) if total_seconds else 0,
+            "peak_throughput_mb_s": round(peak / (1024 * 1024), 2),
+            "rtt_ms": round(self.rtt * 1000, 1) if self.rtt is not None else None
+        }
+
+    def save(self):
+        """Simpan setting yang dipelajari agar upload berikutnya ke host ini langsung di ukuran yang baik"""
+        if not self.adaptive or not self.samples:
+            return
+        # Upload paralel (thread/proses) ke host lain menyimpan ke file yang sama: baca ulang di dalam lock
+        with FileLock(self.store_path.with_suffix(".lock")):
+            data = self._load()
+            data[self.host] = {
+                "chunk_size": self.current,
+                "throughput_mb_s": self.stats()["throughput_mb_s"],
+                "rtt_ms": round(self.rtt * 1000, 1) if self.rtt is not None else None,
+                "updated_at": time.time()
+            }
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.store_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.store_path)
+
+
+class _TrackedReader:
+    """Reader file dengan buffer tetap yang mencatat peak RSS selama upload"""
+
+    def __init__(self, file_path: str, buffer_size: int, sample_every: int = 4 * 1024 * 1024):
+        self._fd = open(file_path, 'rb', buffering=buffer_size)
+        self._sample_every = sample_every
+        self._since_sample = 0
+        self.baseline_rss = current_rss_bytes()
+        self.peak_rss = self.baseline_rss
+
+    def _sample(self):
+        rss = current_rss_bytes()
+        if rss is not None and (self.peak_rss is None or rss > self.peak_rss):
+            self.peak_rss = rss
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            # Membaca seluruh file berarti memori sebanding ukuran file, tidak diizinkan di mode ini
+            raise ValueError("Streaming upload tidak boleh membaca seluruh file sekaligus")
+        data = self._fd.read(size)
+        self._since_sample += len(data)
+        if self._since_sample >= self._sample_every:
+            self._since_sample = 0
+            self._sample()
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._fd.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._fd.tell()
+
+    def close(self):
+        self._sample()
+        self._fd.close()
+
+
+class StreamingMediaUpload(MediaUpload):
+    """
+    Media resumable dengan memori konstan: chunk dikirim langsung dari reader ber-buffer tetap,
+    tidak pernah ada salinan seluruh payload (chunksize=-1 ditolak)
+    """
+
+    def __init__(self, file_path: str, mimetype: str, chunksize: int, buffer_size: int = 1024 * 1024):
+        super().__init__()
+        if chunksize is None or chunksize <= 0:
+            raise ValueError("StreamingMediaUpload memerlukan chunksize > 0")
+        self._filename = file_path
+        self._mimetype = mimetype
+        self._chunksize = align_chunk_size(chunksize)
+        self._size = os.path.getsize(file_path)
+        self._reader = _TrackedReader(file_path, buffer_size)
+
+    def set_chunksize(self, chunk_size: int):
+        self._chunksize = align_chunk_size(chunk_size)
+
+    def chunksize(self) -> int:
+        return self._chunksize
+
+    def mimetype(self) -> str:
+        return self._mimetype
+
+    def size(self) -> int:
+        return self._size
+
+    def resumable(self) -> bool:
+        return True
+
+    def has_stream(self) -> bool:
+        return True
+
+    def stream(self):
+        return self._reader
+
+    def getbytes(self, begin: int, length: int) -> bytes:
+        self._reader.seek(begin)
+        return self._reader.read(length)
+
+    def peak_rss_delta(self) -> Optional[int]:
+        """Kenaikan RSS tertinggi (byte) selama upload dibanding saat media dibuat"""
+        self._reader._sample()
+        if self._reader.baseline_rss is None or self._reader.peak_rss is None:
+            return None
+        return max(self._reader.peak_rss - self._reader.baseline_rss, 0)
+
+    def close(self):
+        self._reader.close()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+YouTube Status - pantau status processing video setelah upload
+Semua video yang ditunggu dicek bersama lewat videos.list (maks 50 ID per panggilan), interval
+polling menyesuaikan perkiraan sisa waktu dari YouTube. Perubahan status dikirim lewat callback/iterator
+"""
+
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterator, Callable, Iterable
+
+# Maksimum ID per panggilan videos.list
+MAX_IDS_PER_CALL = 50
+
+# Status akhir: video tidak akan berubah lagi tanpa tindakan
+TERMINAL_STATES = {"succeeded", "failed", "rejected", "deleted", "terminated", "missing"}
+
+# Video yang baru diupload kadang belum muncul di videos.list, anggap hilang setelah beberapa kali
+MISSING_AFTER_POLLS = 3
+
+
+class ProcessingStatusPoller:
+    def __init__(self, youtube, quota=None, min_interval: float = 5, max_interval: float = 120,
+                 on_transition: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize Processing Status Poller
+
+        Args:
+            youtube: Service YouTube API (googleapiclient)
+            quota: QuotaLedger untuk mencatat biaya videos.list (opsional)
+            min_interval: Interval polling minimum (detik)
+            max_interval: Interval polling maksimum (detik)
+            on_transition: Callback dipanggil setiap status video berubah
+            log: Fungsi logging (message, level), mis. uploader._log
+        """
+        self.youtube = youtube
+        self.quota = quota
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.on_transition = on_transition
+        self.log = log
+
+        self.states: Dict[str, Dict[str, Any]] = {}
+        self.interval = min_interval
+        self.api_calls = 0
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self.log:
+            self.log(message, level)
+
+    def add(self, video_ids: Iterable[str]):
+        """Tambahkan video yang ditunggu (ID yang sudah dipantau diabaikan)"""
+        for video_id in video_ids:
+            self.states.setdefault(video_id, {"state": "pending", "misses": 0})
+
+    def pending(self) -> List[str]:
+        """ID video yang belum mencapai status akhir"""
+        return [video_id for video_id, info in self.states.items() if info["state"] not in TERMINAL_STATES]
+
+    @staticmethod
+    def _parse(item: Dict[str, Any]) -> Dict[str, Any]:
+        """Gabungkan status upload dan processing menjadi satu state"""
+        status = item.get("status", {})
+        details = item.get("processingDetails", {})
+        upload_status = status.get("uploadStatus")
+        processing_status = details.get("processingStatus")
+
+        if upload_status in ("failed", "rejected", "deleted"):
+            state = upload_status
+        elif processing_status in ("succeeded", "failed", "terminated"):
+            state = processing_status
+        elif upload_status == "processed":
+            state = "succeeded"
+        else:
+            state = processing_status or upload_status or "pending"
+
+        progress = details.get("processingProgress", {})
+        parts_total = int(progress.get("partsTotal") or 0)
+        time_left = progress.get("timeLeftMs")
+
+        return {
+            "state": state,
+            "upload_status": upload_status,
+            "processing_status": processing_status,
+            "progress": round(int(progress.get("partsProcessed") or 0) / parts_total, 3) if parts_total else None,
+            "time_left_ms": int(time_left) if time_left is not None else None,
+            "reason": status.get("rejectionReason") or status.get("failureReason")
+                      or details.get("processingFailureReason")
+        }
+
+    def _fetch(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Satu panggilan videos.list untuk maksimal 50 ID"""
+        if self.quota:
+            self.quota.record("videos.list")
+        self.api_calls += 1
+        response = self.youtube.videos().list(
+            part="status,processingDetails",
+            id=",".join(video_ids),
+            maxResults=MAX_IDS_PER_CALL
+        ).execute()
+        return {item["id"]: item for item in response.get("items", [])}
+
+    def poll_once(self) -> List[Dict[str, Any]]:
+        """
+        Cek semua video yang belum selesai, satu panggilan per 50 ID
+
+        Returns:
+            List perubahan status pada putaran ini
+        """
+        pending = self.pending()
+        transitions = []
+
+        for start in range(0, len(pending), MAX_IDS_PER_CALL):
+            batch = pending[start:start + MAX_IDS_PER_CALL]
+            items = self._fetch(batch)
+
+            for video_id in batch:
+                info = self.states[video_id]
+                if video_id in items:
+                    info["misses"] = 0
+                    current = self._parse(items[video_id])
+                else:
+                    info["misses"] += 1
+                    if info["misses"] < MISSING_AFTER_POLLS:
+                        continue
+                    current = {"state": "missing", "upload_status": None, "processing_status": None,
+                               "progress": None, "time_left_ms": None, "reason": None}
+
+                previous = info["state"]
+                info.update(current)
+                if current["state"] == previous:
+                    continue
+
+                transition = dict(current, video_id=video_id, previous=previous,
+                                  at=datetime.now().isoformat())
+                transitions.append(transition)
+                self._log(f"Video {video_id}: {previous} -> {current['state']}", "DEBUG")
+                if self.on_transition:
+                    self.on_transition(transition)
+
+        self._adapt_interval(bool(transitions))
+        return transitions
+
+    def _adapt_interval(self, changed: bool):
+        """
+        Interval berikutnya: ikuti setengah perkiraan sisa waktu tercepat dari YouTube jika ada,
+        selain itu mundur bertahap selama tidak ada perubahan
+        """
+        hints = [self.states[video_id]["time_left_ms"] for video_id in self.pending()
+                 if self.states[video_id].get("time_left_ms")]
+        if hints:
+            interval = min(hints) / 1000 / 2
+        elif changed:
+            interval = self.min_interval
+        else:
+            interval = self.interval * 1.5
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+
+    def transitions(self, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterator perubahan status sampai semua video mencapai status akhir atau timeout
+
+        Yields:
+            Dict transisi (video_id, previous, state, progress, time_left_ms, reason, at)
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+
+        while self.pending():
+            yield from self.poll_once()
+            if not self.pending():
+                break
+
+            sleep_for = self.interval
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    self._log(f"Timeout menunggu processing {len(self.pending())} video", "WARNING")
+                    break
+                sleep_for = min(sleep_for, remaining)
+            time.sleep(sleep_for)
+
+    def wait(self, timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Tunggu semua video selesai diproses, kembalikan status akhir per video"""
+        for _ in self.transitions(timeout=timeout):
+            pass
+        return {video_id: {k: v for k, v in info.items() if k != "misses"}
+                for video_id, info in self.states.items()}
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+YouTube Token Manager - token OAuth di memori dengan refresh proaktif di background
+Token direfresh beberapa menit sebelum expired. Antar proses dikoordinasikan lewat file lock +
+rename atomik, sehingga hanya satu proses yang refresh dan yang lain memakai token hasilnya
+"""
+
+import os
+import json
+import random
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, List, Callable
+
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+from file_lock import FileLock
+
+
+def _utcnow() -> datetime:
+    # google-auth menyimpan expiry sebagai datetime UTC naive
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class TokenManager:
+    def __init__(self, token_path: Path, scopes: List[str], refresh_margin: float = 300,
+                 log: Optional[Callable[[str, str], None]] = None):
+        """
+        Initialize Token Manager
+
+        Args:
+            token_path: Lokasi file token (authorized user JSON)
+            scopes: Scope OAuth
+            refresh_margin: Refresh dilakukan sejauh ini (detik) sebelum token expired.
+                            Harus lebih besar dari ambang refresh google-auth (~4 menit)
+            log: Fungsi logging (message, level), mis. uploader._log
+        """
+        self.token_path = Path(token_path)
+        self.scopes = scopes
+        self.refresh_margin = refresh_margin
+        self.log = log
+
+        self._credentials: Optional[Credentials] = None
+        self._disk_mtime = None
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(self.token_path.with_suffix(".lock"))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _log(self, message: str, level: str = "INFO"):
+        if self.log:
+            self.log(message, level)
+
+    def _file_mtime(self):
+        try:
+            return self.token_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_disk(self) -> Optional[Credentials]:
+        try:
+            return Credentials.from_authorized_user_file(str(self.token_path), self.scopes)
+        except (OSError, ValueError):
+            return None
+
+    def stored_scopes(self) -> List[str]:
+        """Scope yang disetujui saat token di file dibuat (kosong jika tidak ada/rusak)"""
+        try:
+            with open(self.token_path, 'r') as f:
+                scopes = json.load(f).get("scopes") or []
+        except (OSError, ValueError, AttributeError):
+            return []
+        return scopes.split(" ") if isinstance(scopes, str) else list(scopes)
+
+    def missing_scopes(self) -> List[str]:
+        """
+        Scope yang diminta tetapi belum ada di token tersimpan
+
+        Credentials.from_authorized_user_file menimpa scope tersimpan dengan scope yang diminta,
+        jadi token lama (mis. hanya youtube.upload) harus dibandingkan langsung dengan isi file
+        """
+        stored = set(self.stored_scopes())
+        return [scope for scope in self.scopes if scope not in stored]
+
+    def _write_disk(self, creds: Credentials):
+        """Tulis token lewat file sementara + rename, pembaca tidak pernah melihat file setengah jadi"""
+        self.token_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.token_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w') as f:
+            f.write(creds.to_json())
+        os.replace(tmp_path, self.token_path)
+        self._disk_mtime = self._file_mtime()
+
+    def _adopt_from_disk(self, force: bool = False) -> bool:
+        """
+        Pakai token di file jika lebih baru (direfresh proses lain)
+        Token di-update di objek yang sama agar service yang sudah dibangun tetap memakainya
+        """
+        mtime = self._file_mtime()
+        if mtime is None or (mtime == self._disk_mtime and not force):
+            return False
+        self._disk_mtime = mtime
+
+        disk = self._read_disk()
+        if disk is None or not disk.token:
+            return False
+        creds = self._credentials
+        if disk.expiry is None or (creds.expiry is not None and disk.expiry <= creds.expiry):
+            return False
+        creds.token = disk.token
+        creds.expiry = disk.expiry
+        return True
+
+    def _needs_refresh(self) -> bool:
+        creds = self._credentials
+        if not creds.token:
+            return True
+        if creds.expiry is None:
+            return False
+        return (creds.expiry - _utcnow()).total_seconds() < self.refresh_margin
+
+    def load(self) -> Optional[Credentials]:
+        """
+        Credentials di memori (dimuat dari file sekali), None jika belum ada token
+
+        Objek yang dikembalikan selalu sama, token-nya diperbarui di tempat saat refresh
+        """
+        with self._lock:
+            if self._credentials is None:
+                creds = self._read_disk()
+                if creds is None:
+                    return None
+                self._credentials = creds
+                self._disk_mtime = self._file_mtime()
+            else:
+                self._adopt_from_disk()
+            return self._credentials
+
+    def reload(self) -> bool:
+        """
+        Baca ulang token dari file (mis. setelah proses lain selesai refresh)
+
+        Returns:
+            True jika token di memori sekarang masih berlaku
+        """
+        with self._lock:
+            if self._credentials is None:
+                return False
+            self._adopt_from_disk(force=True)
+            return self._credentials.valid
+
+    def save(self, creds: Credentials):
+        """Simpan credentials baru (hasil OAuth flow) dan jadikan credentials aktif"""
+        with self._lock:
+            self._file_lock.acquire(blocking=True)
+            try:
+                self._write_disk(creds)
+            finally:
+                self._file_lock.release()
+            self._credentials = creds
+
+    def refresh_if_needed(self, wait_timeout: float = 30) -> bool:
+        """
+        Refresh token jika mendekati expired
+
+        Jika proses lain sedang refresh, token lama dipakai selama masih berlaku (tidak menunggu).
+        Hanya jika token sudah expired, tunggu token baru dari proses tersebut
+
+        Returns:
+            True jika token siap dipakai
+        """
+        with self._lock:
+            if self._credentials is None:
+                return False
+            self._adopt_from_disk()
+            if not self._needs_refresh():
+                return True
+
+            if self._file_lock.acquire(blocking=False):
+                try:
+                    # Proses lain mungkin baru selesai refresh tepat sebelum lock didapat
+                    self._adopt_from_disk(force=True)
+                    if self._needs_refresh():
+                        self._credentials.refresh(Request())
+                        self._write_disk(self._credentials)
+                        self._log("Token YouTube direfresh", "DEBUG")
+                    return True
+                finally:
+                    self._file_lock.release()
+
+            if self._credentials.valid:
+                self._log("Token sedang direfresh proses lain, token lama masih berlaku", "DEBUG")
+                return True
+
+        # Token sudah expired dan proses lain memegang lock: tunggu hasil refresh-nya
+        deadline = _utcnow().timestamp() + wait_timeout
+        while _utcnow().timestamp() < deadline:
+            if self._stop.wait(0.5):
+                break
+            with self._lock:
+                self._adopt_from_disk()
+                if self._credentials.valid:
+                    return True
+        return False
+
+    def _seconds_until_refresh(self) -> float:
+        creds = self._credentials
+        if creds is None or creds.expiry is None:
+            return self.refresh_margin
+        # Jitter agar proses yang start bersamaan tidak bangun di detik yang sama
+        jitter = random.uniform(0, min(60, self.refresh_margin / 4))
+        remaining = (creds.expiry - _utcnow()).total_seconds() - self.refresh_margin + jitter
+        return max(remaining, 5)
+
+    def _run(self):
+        while not self._stop.wait(self._seconds_until_refresh()):
+            try:
+                self.refresh_if_needed()
+            except Exception as e:
+                self._log(f"Refresh token di background gagal: {e}", "WARNING")
+                self._stop.wait(60)
+
+    def start(self):
+        """Mulai thread refresh di background (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="youtube-token-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Hentikan thread refresh dan lupakan credentials di memori"""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self._thread = None
+        with self._lock:
+            self._credentials = None
+            self._disk_mtime = None